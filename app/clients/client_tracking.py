@@ -0,0 +1,215 @@
+"""Server-assisted client-side caching through Redis CLIENT TRACKING (Redis 6+)."""
+
+from asyncio import CancelledError, Task, create_task
+from asyncio import sleep as asyncio_sleep
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import Any
+
+from redis.asyncio import ConnectionPool
+from redis.asyncio.connection import AbstractConnection
+from redis.exceptions import RedisError
+
+from app.clients.near_cache import NearCache
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ClientTracking:
+    """
+    Local mirror of Redis values kept coherent by server invalidation pushes.
+
+    A dedicated RESP3 connection enables ``CLIENT TRACKING ON BCAST PREFIX`` for
+    the tracked prefix, so Redis pushes an ``invalidate`` message whenever any
+    client modifies, expires or evicts a key under it. Values read through
+    ``RedisClient`` are mirrored in two bounded near caches (decoded and raw) and
+    repeated reads of a key cost no network I/O until it is invalidated.
+
+    The mirror is only served while the tracking connection is live. Losing it
+    clears the mirror, since invalidations may have been missed, and a
+    background task reconnects. When the server does not support RESP3 or
+    client tracking, ``start`` returns False and reads go to Redis as before.
+
+    Features:
+        - Broadcast mode, so no per-key tracking state is kept on the server
+        - Version stamping against reads racing an invalidation
+        - Idle pings to notice a dead tracking connection
+    """
+
+    # Seconds between reconnection attempts of the tracking connection
+    RETRY_DELAY: float = 1.0
+    # Seconds without a push after which the tracking connection is pinged
+    PING_INTERVAL: float = 5.0
+
+    def __init__(self, prefix: str, max_entries: int = 10_000, ttl: int = 60) -> None:
+        """
+        Initialize the mirror.
+
+        Args:
+            prefix: Key prefix tracked in broadcast mode; other keys are not mirrored.
+            max_entries: Maximum number of values mirrored per decoding mode.
+            ttl: Upper bound in seconds for how long a value is mirrored.
+        """
+        self.prefix = prefix
+        self.text: NearCache[str] = NearCache(max_entries=max_entries, ttl=ttl)
+        self.binary: NearCache[bytes] = NearCache(max_entries=max_entries, ttl=ttl)
+        self.invalidations: int = 0
+        self._ready = False
+        self._pool: ConnectionPool | None = None
+        self._connection: AbstractConnection | None = None
+        self._task: Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether invalidations are being received and the mirror may be served."""
+        return self._ready
+
+    def lookup[ValueT: (str, bytes)](
+        self,
+        mirror: NearCache[ValueT],
+        keys: Sequence[str],
+    ) -> list[ValueT | None]:
+        """Return the mirrored value of each key, None where Redis must be read."""
+        if not self._ready:
+            return [None] * len(keys)
+        return [mirror.get(key) if key.startswith(self.prefix) else None for key in keys]
+
+    def store[ValueT: (str, bytes)](
+        self,
+        mirror: NearCache[ValueT],
+        keys: Sequence[str],
+        values: Sequence[ValueT | None],
+        version: int,
+    ) -> None:
+        """
+        Mirror values just read from Redis.
+
+        Args:
+            mirror: ``text`` or ``binary``, matching how the values were decoded.
+            keys: Keys that were read.
+            values: Values read, None for missing keys (which are not mirrored).
+            version: ``mirror.version`` observed before the read; values are
+                dropped if an invalidation arrived while it was in flight.
+        """
+        if not self._ready:
+            return
+        for key, value in zip(keys, values, strict=True):
+            if value is not None and key.startswith(self.prefix):
+                mirror.set(key, value, version=version)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop keys from both mirrors."""
+        self.text.invalidate(*keys)
+        self.binary.invalidate(*keys)
+
+    def clear(self) -> None:
+        """Drop every mirrored value."""
+        self.text.clear()
+        self.binary.clear()
+
+    async def start(self, pool_kwargs: dict[str, Any]) -> bool:
+        """
+        Open the tracking connection and start listening for invalidations.
+
+        Args:
+            pool_kwargs: Connection settings of the ``RedisClient`` pools.
+
+        Returns:
+            True if tracking is active, False if the server does not support it.
+        """
+        if self._task is not None:
+            return True
+        # One RESP3 connection for pushes only; commands keep using the RESP2 pools
+        self._pool = ConnectionPool(**{**pool_kwargs, "protocol": 3, "max_connections": 1})
+        try:
+            await self._connect()
+        except RedisError as e:
+            logger.warning("Redis client tracking unavailable, reads go to Redis: %s", e)
+            await self._close()
+            return False
+        self._task = create_task(self._listen())
+        logger.info("Redis client tracking enabled for prefix %s.", self.prefix)
+        return True
+
+    async def stop(self) -> None:
+        """Stop listening, close the tracking connection and clear the mirror."""
+        self._ready = False
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(CancelledError):
+                await self._task
+            self._task = None
+        await self._close()
+        self.clear()
+
+    async def _connect(self) -> None:
+        """Open the tracking connection and enable broadcast tracking on it."""
+        if self._pool is None:
+            return
+        connection = await self._pool.get_connection()
+        self._connection = connection
+        # The parser is only final once connected (HELLO may replace it)
+        connection._parser.set_invalidation_push_handler(self._on_invalidate)  # noqa: SLF001
+        await connection.send_command("CLIENT", "TRACKING", "ON", "BCAST", "PREFIX", self.prefix)
+        await connection.read_response()
+        # Anything read before this point may have missed invalidations
+        self.clear()
+        self._ready = True
+
+    async def _close(self) -> None:
+        """Close the tracking connection and its pool."""
+        self._ready = False
+        connection, self._connection = self._connection, None
+        if self._pool is None:
+            return
+        with suppress(RedisError, OSError):
+            await self._pool.disconnect()
+        # Hand the connection back so the single-slot pool can open a new one
+        if connection is not None:
+            await self._pool.release(connection)
+
+    async def _listen(self) -> None:
+        """Apply pushed invalidations, reconnecting whenever the connection drops."""
+        while True:
+            try:
+                if self._connection is None:
+                    await self._connect()
+                await self._read_pushes()
+            except (RedisError, OSError) as e:
+                logger.warning("Redis client tracking connection lost: %s", e)
+            self.clear()
+            await self._close()
+            await asyncio_sleep(self.RETRY_DELAY)
+
+    async def _read_pushes(self) -> None:
+        """Read pushes until the connection fails, pinging it while idle."""
+        connection = self._connection
+        if connection is None:
+            return
+        while True:
+            # Pushes are handed to _on_invalidate by the parser; None means idle
+            pushed = await connection.read_response(timeout=self.PING_INTERVAL, push_request=True)
+            if pushed is None:
+                await connection.send_command("PING")
+                await connection.read_response()
+
+    async def _on_invalidate(self, message: list[Any]) -> list[Any]:
+        """Apply an ``invalidate`` push; a null key list means the database was flushed."""
+        self.invalidations += 1
+        keys = message[1] if len(message) > 1 else None
+        if keys is None:
+            self.clear()
+        else:
+            self.invalidate(*(key.decode() if isinstance(key, bytes) else key for key in keys))
+        return message
+
+    def info(self) -> dict[str, Any]:
+        """Return tracking state and mirror counters for health reporting."""
+        return {
+            "ready": self._ready,
+            "prefix": self.prefix,
+            "invalidations": self.invalidations,
+            "text": self.text.info(),
+            "binary": self.binary.info(),
+        }
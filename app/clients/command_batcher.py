@@ -0,0 +1,146 @@
+"""Automatic batching of concurrent single-key Redis reads into pipelines."""
+
+from asyncio import Future, Handle, Task, gather, get_running_loop, shield
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Batch:
+    """Commands queued for one Redis client until the batch is flushed."""
+
+    __slots__ = ("client", "commands", "handle")
+
+    def __init__(self, client: Redis | RedisCluster) -> None:
+        self.client = client
+        # Identical commands share one future, so each is sent once per batch
+        self.commands: dict[tuple[str, ...], Future[Any]] = {}
+        self.handle: Handle | None = None
+
+
+class CommandBatcher:
+    """
+    DataLoader-style coalescing of the reads issued by one worker.
+
+    Under load many coroutines issue independent ``GET``/``EXISTS`` calls in the
+    same event-loop tick (blacklist checks, cache lookups, lockout checks), each
+    taking a pooled connection and paying its own round trip. Commands submitted
+    through ``execute`` are instead queued per client and flushed together as one
+    non-transactional pipeline, either at the end of the current tick or after a
+    short window; every caller then receives its own reply.
+
+    A failed round trip fails every command of the batch with the same error, so
+    the per-operation retries of ``RedisClient`` apply unchanged. A caller that
+    is cancelled does not cancel the shared reply of the others.
+
+    Features:
+        - One pipeline and one pooled connection per batch
+        - Duplicate commands within a batch sent once
+        - Early flush once a batch reaches its maximum size
+    """
+
+    DEFAULT_MAX_BATCH: int = 128
+
+    def __init__(self, window: float = 0.0, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            window: Seconds a batch stays open after its first command; 0 flushes
+                at the end of the current event-loop tick.
+            max_batch: Distinct commands after which a batch is flushed at once.
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self.batches: int = 0
+        self.commands: int = 0
+        self.coalesced: int = 0
+        self._pending: dict[int, _Batch] = {}
+        self._flushes: set[Task[None]] = set()
+
+    async def execute(self, client: Redis | RedisCluster, *args: str) -> Any:  # noqa: ANN401
+        """
+        Queue a command on the next batch of client and wait for its reply.
+
+        Args:
+            client: Pool the command is sent over; its response decoding applies.
+            *args: Command name and arguments, e.g. ``("GET", key)``.
+
+        Returns:
+            The reply Redis would have given to the command sent on its own.
+        """
+        batch = self._pending.get(id(client))
+        if batch is None:
+            batch = self._pending[id(client)] = _Batch(client)
+            loop = get_running_loop()
+            if self.window > 0:
+                batch.handle = loop.call_later(self.window, self._flush, batch)
+            else:
+                batch.handle = loop.call_soon(self._flush, batch)
+        future = batch.commands.get(args)
+        if future is None:
+            future = batch.commands[args] = get_running_loop().create_future()
+            if len(batch.commands) >= self.max_batch:
+                self._flush(batch)
+        else:
+            self.coalesced += 1
+        return await shield(future)
+
+    def _flush(self, batch: _Batch) -> None:
+        """Close batch to new commands and send it in the background."""
+        if self._pending.get(id(batch.client)) is not batch:
+            return
+        del self._pending[id(batch.client)]
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = get_running_loop().create_task(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, batch: _Batch) -> None:
+        """Send batch as one pipeline and hand each reply to its waiters."""
+        commands = batch.commands
+        self.batches += 1
+        self.commands += len(commands)
+        try:
+            async with batch.client.pipeline(transaction=False) as pipe:
+                for args in commands:
+                    pipe.execute_command(*args)
+                replies = await pipe.execute(raise_on_error=False)
+        except Exception as e:  # noqa: BLE001
+            # Every waiter must be woken, whatever went wrong
+            logger.debug("Batch of %d Redis commands failed: %s", len(commands), e)
+            for future in commands.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, reply in zip(commands.values(), replies, strict=True):
+            if future.done():
+                continue
+            if isinstance(reply, Exception):
+                future.set_exception(reply)
+            else:
+                future.set_result(reply)
+
+    async def close(self) -> None:
+        """Send the batches still open and wait for those in flight."""
+        for batch in list(self._pending.values()):
+            self._flush(batch)
+        if self._flushes:
+            await gather(*self._flushes, return_exceptions=True)
+
+    def info(self) -> dict[str, Any]:
+        """Return batching counters for health reporting."""
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "batches": self.batches,
+            "commands": self.commands,
+            "coalesced": self.coalesced,
+            "average_batch_size": round(self.commands / self.batches, 2) if self.batches else 0,
+        }
@@ -0,0 +1,236 @@
+"""
+Eviction policies for the in-memory cache client.
+
+A policy tracks key order (and, for TinyLFU, access frequency) alongside
+``MemoryClient``'s store and picks the victim whenever the client is over its
+entry or memory limit. The client owns the data; a policy only sees keys.
+"""
+
+from collections import OrderedDict
+from typing import Literal
+
+EvictionStrategy = Literal["LRU", "FIFO", "TinyLFU"]
+
+_MASK64 = (1 << 64) - 1
+# Lookup table that halves every byte, used to age the sketch with bytearray.translate
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+class CountMinSketch:
+    """
+    Approximate per-key access counter in fixed memory.
+
+    Four rows of saturating 4-bit-range counters (stored one per byte), indexed by
+    multiplicative hashes of the key; the estimate is the minimum across rows.
+    Once ``sample_size`` increments have been recorded every counter is halved, so
+    frequencies decay and keys that were hot long ago do not stay hot forever.
+    """
+
+    DEPTH: int = 4
+    MAX_COUNT: int = 15
+    # Odd 64-bit multipliers, one per row
+    _SEEDS: tuple[int, ...] = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+
+    def __init__(self, width: int, sample_size: int | None = None) -> None:
+        """
+        Initialize the sketch.
+
+        Args:
+            width: Expected number of distinct hot keys; rounded up to a power of two.
+            sample_size: Increments between agings; defaults to ten times the width.
+        """
+        bits = max(4, (max(width, 1) - 1).bit_length())
+        self._width = 1 << bits
+        self._shift = 64 - bits
+        self._rows = [bytearray(self._width) for _ in range(self.DEPTH)]
+        self._sample_size = sample_size or 10 * self._width
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & _MASK64
+        # Top bits of the product (Fibonacci hashing) are the well-mixed ones
+        return [((h * seed) & _MASK64) >> self._shift for seed in self._SEEDS]
+
+    def increment(self, key: str) -> None:
+        """Record one access to ``key``."""
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Return the estimated access count of ``key``."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key), strict=True))
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        for row in self._rows:
+            row[:] = row.translate(_HALVE)
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        for row in self._rows:
+            row[:] = bytes(self._width)
+        self._additions = 0
+
+
+class EvictionPolicy:
+    """
+    Least-recently-used eviction.
+
+    Base class for the other policies. Hooks are synchronous and called by the
+    client with its state already updated, so they need no locking of their own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the policy."""
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Track a newly stored key."""
+        self._order[key] = None
+
+    def on_access(self, key: str) -> None:
+        """Record a hit on, or an overwrite of, a stored key."""
+        self._order.move_to_end(key)
+
+    def on_miss(self, key: str) -> None:
+        """Record a lookup of a key that is not stored."""
+
+    def on_remove(self, key: str) -> None:
+        """Forget a key that was deleted, expired or evicted."""
+        self._order.pop(key, None)
+
+    def victim(self) -> str:
+        """Return the key to evict next; the client removes it via ``on_remove``."""
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._order.clear()
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Evict the oldest inserted key; hits and overwrites do not reorder."""
+
+    def on_access(self, key: str) -> None:
+        """Keep insertion order on access."""
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """
+    W-TinyLFU: a small LRU admission window in front of a frequency-filtered main LRU.
+
+    New keys always enter the window, so bursts of fresh keys still get a chance to
+    be hit. When space is needed, the window's oldest key competes with the main
+    region's oldest key and the one with the lower sketch frequency is evicted. A
+    scan over many one-off keys therefore churns the window without displacing the
+    frequently used working set in the main region.
+    """
+
+    # Share of capacity reserved for the admission window
+    WINDOW_RATIO: float = 0.01
+    # Sketch counters per row for each entry of capacity; keeps collisions rare
+    SKETCH_WIDTH_FACTOR: int = 4
+    # Sketch increments between agings, per entry of capacity
+    SAMPLE_FACTOR: int = 10
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_entries: Capacity of the client, used to size the window and sketch.
+        """
+        super().__init__()
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._max_entries = max_entries
+        self._window_size = max(1, int(max_entries * self.WINDOW_RATIO))
+        self.sketch = CountMinSketch(
+            self.SKETCH_WIDTH_FACTOR * max_entries,
+            sample_size=self.SAMPLE_FACTOR * max_entries,
+        )
+
+    def on_insert(self, key: str) -> None:
+        """Admit a new key into the window, spilling into main while there is room."""
+        self.sketch.increment(key)
+        self._window[key] = None
+        if (
+            len(self._window) > self._window_size
+            and len(self._window) + len(self._order) <= self._max_entries
+        ):
+            self._order[self._window.popitem(last=False)[0]] = None
+
+    def on_access(self, key: str) -> None:
+        """Count the access and refresh the key's position in its region."""
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        else:
+            self._order.move_to_end(key)
+
+    def on_miss(self, key: str) -> None:
+        """Count misses too, so a repeatedly requested key can win admission."""
+        self.sketch.increment(key)
+
+    def on_remove(self, key: str) -> None:
+        """Forget the key in whichever region holds it."""
+        if key in self._window:
+            del self._window[key]
+        else:
+            self._order.pop(key, None)
+
+    def victim(self) -> str:
+        """Evict the loser of the window candidate versus the main region's oldest key."""
+        while len(self._window) > self._window_size or not self._order:
+            candidate = next(iter(self._window))
+            if not self._order:
+                self._promote(candidate)
+                continue
+            victim = next(iter(self._order))
+            if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+                self._promote(candidate)
+                return victim
+            return candidate
+        return next(iter(self._order))
+
+    def _promote(self, key: str) -> None:
+        """Move a key from the window into the main region."""
+        del self._window[key]
+        self._order[key] = None
+
+    def clear(self) -> None:
+        """Forget all keys and frequencies."""
+        super().clear()
+        self._window.clear()
+        self.sketch.clear()
+
+
+def make_policy(strategy: EvictionStrategy, max_entries: int) -> EvictionPolicy:
+    """
+    Build the eviction policy for a strategy name.
+
+    Args:
+        strategy: ``"LRU"``, ``"FIFO"`` or ``"TinyLFU"``.
+        max_entries: Capacity of the client.
+
+    Returns:
+        A fresh policy instance.
+    """
+    if strategy == "FIFO":
+        return FIFOPolicy()
+    if strategy == "TinyLFU":
+        return TinyLFUPolicy(max_entries)
+    return LRUPolicy()
@@ -1,30 +1,118 @@
 """In-memory cache client for fallback when Redis is not available."""
 
-from asyncio import CancelledError, Lock, Task, create_task
+from asyncio import CancelledError, Lock, Task, create_task, to_thread
 from asyncio import sleep as asyncio_sleep
 from collections import OrderedDict
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from fnmatch import fnmatch
+from heapq import heapify, heappop, heappush
 from logging import DEBUG
+from mmap import ACCESS_READ, mmap
+from os import getpid, replace, stat
+from pathlib import Path
+from struct import Struct
 from sys import getsizeof
 from time import time
 
+from app.clients.eviction import EvictionPolicy, EvictionStrategy, make_policy
 from app.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keys are indexed under every prefix that ends with this separator
+KEY_SEPARATOR = ":"
+# Characters that start a glob in scan_iter patterns
+GLOB_CHARS = "*?["
+
+# Snapshot file: the magic, then per entry its expiry (epoch seconds, 0 = none),
+# key length, value length and flags, followed by the key and value bytes
+SNAPSHOT_MAGIC = b"BBMEMSN1"
+SNAPSHOT_RECORD = Struct("<dHIB")
+# Flag bit of a value stored as text, restored as str
+SNAPSHOT_TEXT_FLAG = 1
+
+# Snapshot entry to restore: value offset and length in the file, flags, expiry
+type PendingEntry = tuple[int, int, int, float]
+
+
+def _container_overhead() -> int:
+    """
+    Measure the bytes each entry costs in the client's own containers.
+
+    Covers the store's dict slot, the policy's ordering node, the TTL map slot and
+    its float, and the expiry heap tuple, so ``max_memory_mb`` bounds the real
+    footprint rather than just the keys and values.
+    """
+    n = 1024
+    keys = [f"{i:08d}" for i in range(n)]
+    store = getsizeof(dict.fromkeys(keys)) // n
+    order = getsizeof(OrderedDict.fromkeys(keys)) // n
+    ttl = store + getsizeof(time())
+    heap_entry = getsizeof((time(), keys[0])) + 8  # tuple plus its list slot
+    return store + order + ttl + heap_entry
+
+
+ENTRY_OVERHEAD: int = _container_overhead()
+# Set slot cost of one prefix index membership
+INDEX_OVERHEAD: int = getsizeof(set(range(1024))) // 1024
+
+
+def _write_snapshot(path: str, entries: Iterable[tuple[str, str | bytes, float]]) -> int:
+    """
+    Write entries to a snapshot file, replacing the previous one atomically.
+
+    Returns:
+        Number of entries written.
+    """
+    # Per-process temporary name, so workers sharing a path never interleave writes
+    tmp = Path(f"{path}.{getpid()}.tmp")
+    count = 0
+    with tmp.open("wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        for key, value, expires_at in entries:
+            flags = SNAPSHOT_TEXT_FLAG if isinstance(value, str) else 0
+            data = value.encode("utf-8") if isinstance(value, str) else value
+            key_bytes = key.encode("utf-8")
+            file.write(SNAPSHOT_RECORD.pack(expires_at, len(key_bytes), len(data), flags))
+            file.write(key_bytes)
+            file.write(data)
+            count += 1
+    replace(tmp, path)
+    return count
+
+
+def _key_prefixes(key: str) -> list[str]:
+    """Return the prefixes of ``key`` that end with the separator, shortest first."""
+    prefixes = []
+    end = key.find(KEY_SEPARATOR)
+    while end != -1:
+        prefixes.append(key[: end + 1])
+        end = key.find(KEY_SEPARATOR, end + 1)
+    return prefixes
+
 
 class MemoryClient:
     """
-    A thread-safe asynchronous in-memory cache client that mimics RedisClient.
+    An asynchronous in-memory cache client that mimics RedisClient.
 
     Features:
-        - Active expiration via background cleanup task
-        - Memory limits with LRU eviction
-        - Entry count limits
-        - Thread-safe operations via asyncio.Lock
-        - Pattern-based key scanning
+        - Active expiration via background cleanup task, driven by a min-heap
+          of expiry times so only expired keys are visited
+        - Memory and entry count limits enforced by a pluggable eviction policy
+          (LRU, FIFO or W-TinyLFU, see ``app.clients.eviction``)
+        - Lock-free reads; writes are serialized via asyncio.Lock
+        - Pattern-based key scanning; prefix patterns such as ``cache:blogs:*``
+          resolve through a prefix index in O(matches)
+        - Optional snapshot file written periodically and on close, so a restart
+          starts warm: the file is memory-mapped on start and each entry is
+          restored, with its remaining TTL, the first time its key is touched
+
+    Concurrency: the client is confined to one event loop, and no method awaits
+    between reading and updating its state, so every call is atomic with respect
+    to other coroutines. Reads (including lazy expiry and LRU touches) therefore
+    skip the lock and never queue behind writers or cleanup. The lock only orders
+    writers and maintenance work that may hold it across an await.
     """
 
     # Default limits - can be overridden via constructor
@@ -32,27 +120,58 @@ class MemoryClient:
     DEFAULT_MAX_MEMORY_MB: int = 100
     DEFAULT_CLEANUP_INTERVAL: int = 60  # seconds
     DEFAULT_CLEANUP_BATCH_SIZE: int = 1000
+    # Rebuild the expiry heap once stale entries outnumber live TTLs by this factor
+    HEAP_COMPACTION_FACTOR: int = 2
+    DEFAULT_SNAPSHOT_INTERVAL: int = 300  # seconds
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         max_entries: int = DEFAULT_MAX_ENTRIES,
         max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
         cleanup_interval: int = DEFAULT_CLEANUP_INTERVAL,
+        on_evict: Callable[[int], None] | None = None,
+        strategy: EvictionStrategy = "LRU",
+        *,
+        snapshot_path: str | None = None,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
     ) -> None:
         """
         Initialize the MemoryClient with configurable limits.
 
         Args:
-            max_entries: Maximum number of cache entries before LRU eviction.
+            max_entries: Maximum number of cache entries before eviction.
             max_memory_mb: Maximum memory usage in megabytes before eviction.
             cleanup_interval: Interval in seconds for background cleanup.
+            on_evict: Called with the number of keys removed by eviction or
+                expiry, e.g. ``CacheStatistics.record_eviction``.
+            strategy: Eviction policy: ``"LRU"``, ``"FIFO"`` or ``"TinyLFU"``.
+            snapshot_path: File the entries are saved to and restored from; None
+                disables snapshots.
+            snapshot_interval: Seconds between periodic snapshots.
         """
-        # Use OrderedDict for LRU eviction support
-        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache: dict[str, str | bytes] = {}
+        # Key order and access frequency live in the policy
+        self._policy: EvictionPolicy = make_policy(strategy, max_entries)
+        self._strategy = strategy
+        # "a:b:c" is indexed under "a:" and "a:b:" for prefix scans
+        self._prefix_index: dict[str, set[str]] = {}
         self._ttl: dict[str, float] = {}
+        # (expires_at, key) min-heap; entries whose time no longer matches _ttl are stale
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._on_evict = on_evict
+        self.expired_keys: int = 0
+        self.evicted_keys: int = 0
         self.is_connected: bool = True
         self._cleanup_task: Task[None] | None = None
 
+        # Snapshot of a previous run, mapped until every entry is restored or dropped
+        self._snapshot_path = snapshot_path
+        self._snapshot_interval = snapshot_interval
+        self._snapshot: mmap | None = None
+        self._pending: dict[str, PendingEntry] = {}
+        self._snapshot_task: Task[None] | None = None
+        self.restored_keys: int = 0
+
         # Configuration
         self._max_entries = max_entries
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
@@ -66,12 +185,128 @@ class MemoryClient:
         self._lock = Lock()
 
     async def start_lifecycle(self) -> None:
-        """Start background maintenance tasks."""
+        """Start background maintenance tasks, loading the snapshot on first start."""
         async with self._lock:
             if not self._cleanup_task:
                 self.is_connected = True
                 self._cleanup_task = create_task(self._cleanup_loop())
                 logger.info("MemoryClient active expiration task started.")
+            if self._snapshot_path and not self._snapshot_task:
+                self._load_snapshot(self._snapshot_path)
+                self._snapshot_task = create_task(self._snapshot_loop())
+
+    def _load_snapshot(self, path: str) -> None:
+        """
+        Map a snapshot and index its live entries; values stay in the file until used.
+
+        A missing, truncated or foreign file is ignored, so a bad snapshot only
+        costs a cold start. So is one older than two snapshot intervals: it was
+        left by an earlier run, and keys deleted since then must not come back.
+        """
+        try:
+            with Path(path).open("rb") as file:
+                if time() - stat(file.fileno()).st_mtime > 2 * self._snapshot_interval:
+                    logger.info("Ignoring stale MemoryClient snapshot %s.", path)
+                    return
+                snapshot = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except (OSError, ValueError):
+            # ValueError: the file is empty
+            logger.info("No MemoryClient snapshot to restore at %s.", path)
+            return
+
+        if snapshot[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            logger.warning("Ignoring MemoryClient snapshot %s: unknown format.", path)
+            snapshot.close()
+            return
+
+        now = time()
+        offset = len(SNAPSHOT_MAGIC)
+        size = len(snapshot)
+        while offset + SNAPSHOT_RECORD.size <= size:
+            expires_at, key_len, value_len, flags = SNAPSHOT_RECORD.unpack_from(snapshot, offset)
+            key_offset = offset + SNAPSHOT_RECORD.size
+            offset = key_offset + key_len + value_len
+            if offset > size:
+                logger.warning("MemoryClient snapshot %s is truncated.", path)
+                break
+            if not expires_at or expires_at > now:
+                key = snapshot[key_offset : key_offset + key_len].decode("utf-8")
+                self._pending[key] = (key_offset + key_len, value_len, flags, expires_at)
+
+        if self._pending:
+            self._snapshot = snapshot
+            logger.info("MemoryClient snapshot: %d entries to restore.", len(self._pending))
+        else:
+            snapshot.close()
+
+    def _restore(self, key: str) -> None:
+        """Move a key from the snapshot into the cache (internal, no lock)."""
+        if not self._pending or (entry := self._pending.pop(key, None)) is None:
+            return
+        offset, length, flags, expires_at = entry
+        if (not expires_at or expires_at > time()) and self._snapshot is not None:
+            value = self._snapshot[offset : offset + length]
+            self._set_internal(key, value.decode("utf-8") if flags & SNAPSHOT_TEXT_FLAG else value)
+            if expires_at:
+                self._set_expiry(key, expires_at)
+            self.restored_keys += 1
+        if not self._pending:
+            self._release_snapshot()
+
+    def _release_snapshot(self) -> None:
+        """Forget the entries not restored yet and unmap the snapshot."""
+        self._pending.clear()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _snapshot_entries(self) -> list[tuple[str, str | bytes, float]]:
+        """Collect live entries, and those still in the snapshot, for the next one."""
+        now = time()
+        entries = [
+            (key, value, self._ttl.get(key, 0.0))
+            for key, value in self._cache.items()
+            if not 0 < self._ttl.get(key, 0.0) <= now
+        ]
+        if self._snapshot is not None:
+            for key, (offset, length, flags, expires_at) in self._pending.items():
+                if not 0 < expires_at <= now:
+                    value = self._snapshot[offset : offset + length]
+                    text = flags & SNAPSHOT_TEXT_FLAG
+                    entries.append((key, value.decode("utf-8") if text else value, expires_at))
+        return entries
+
+    async def save_snapshot(self) -> int:
+        """
+        Write the entries and their expiry times to the snapshot file.
+
+        Entries are collected in one step on the event loop; the file is written
+        in a thread and replaces the previous snapshot once complete.
+
+        Returns:
+            Number of entries written; 0 when snapshots are disabled or failed.
+        """
+        if not self._snapshot_path:
+            return 0
+        try:
+            count = await to_thread(_write_snapshot, self._snapshot_path, self._snapshot_entries())
+        except OSError:
+            logger.exception("Failed to write MemoryClient snapshot to %s", self._snapshot_path)
+            return 0
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("MemoryClient snapshot: wrote %d entries.", count)
+        return count
+
+    async def _snapshot_loop(self) -> None:
+        """Background loop saving a snapshot every snapshot interval."""
+        while self.is_connected:
+            try:
+                await asyncio_sleep(self._snapshot_interval)
+                await self.save_snapshot()
+            except CancelledError:
+                break
+            except Exception:
+                logger.exception("Error in memory snapshot loop")
 
     async def _cleanup_loop(self) -> None:
         """Background loop to remove expired keys."""
@@ -84,24 +319,64 @@ class MemoryClient:
             except Exception:
                 logger.exception("Error in memory cleanup loop")
 
-    async def _active_expire(self) -> None:
-        """Scan and remove expired keys in batches for better performance."""
-        async with self._lock:
-            if not self._ttl:
-                return
-
-            # Process in batches to avoid blocking
-            keys = list(self._ttl.keys())
-            expired_keys: list[str] = []
+    async def _active_expire(self) -> int:
+        """
+        Remove expired keys, popping them off the expiry heap.
 
-            for i in range(0, len(keys), self._cleanup_batch_size):
-                batch = keys[i : i + self._cleanup_batch_size]
-                expired_keys.extend(k for k in batch if self._is_expired_internal(k))
+        Works in slices of at most ``_cleanup_batch_size`` heap entries and yields
+        to the event loop between slices, so cleanup never holds the lock for long.
 
-            if expired_keys:
-                count = self._delete_internal(*expired_keys)
-                if logger.isEnabledFor(DEBUG):
-                    logger.debug("Memory cleanup: removed %d expired keys.", count)
+        Returns:
+            Number of keys removed.
+        """
+        total = 0
+        while True:
+            async with self._lock:
+                count, done = self._expire_slice(time())
+            total += count
+            if done:
+                break
+            await asyncio_sleep(0)
+
+        if total and logger.isEnabledFor(DEBUG):
+            logger.debug("Memory cleanup: removed %d expired keys.", total)
+        return total
+
+    def _expire_slice(self, now: float) -> tuple[int, bool]:
+        """Pop one slice of due heap entries; return the removed count and whether done."""
+        heap = self._expiry_heap
+        expired: list[str] = []
+        popped = 0
+        while heap and heap[0][0] < now and popped < self._cleanup_batch_size:
+            expires_at, key = heappop(heap)
+            popped += 1
+            # Skip entries superseded by a later set/expire or a delete
+            if self._ttl.get(key) == expires_at:
+                expired.append(key)
+
+        done = not heap or heap[0][0] >= now
+        self._compact_expiry_heap()
+        return self._expire_keys(*expired), done
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop stale heap entries once they dominate the heap."""
+        if len(self._expiry_heap) > self.HEAP_COMPACTION_FACTOR * len(self._ttl) + 1024:
+            self._expiry_heap = [(expires_at, key) for key, expires_at in self._ttl.items()]
+            heapify(self._expiry_heap)
+
+    def _set_expiry(self, key: str, expires_at: float) -> None:
+        """Record a key's expiry time in the TTL map and the heap."""
+        self._ttl[key] = expires_at
+        heappush(self._expiry_heap, (expires_at, key))
+
+    def _expire_keys(self, *keys: str) -> int:
+        """Delete expired keys and report them (internal, no lock)."""
+        count = self._delete_internal(*keys)
+        if count:
+            self.expired_keys += count
+            if self._on_evict is not None:
+                self._on_evict(count)
+        return count
 
     def _is_expired_internal(self, key: str) -> bool:
         """Check if a key has expired (internal, no lock)."""
@@ -113,17 +388,39 @@ class MemoryClient:
         """Check if a key has expired (public method)."""
         return self._is_expired_internal(key)
 
-    def _estimate_entry_size(self, key: str, value: str) -> int:
-        """Estimate memory size of a cache entry."""
-        return getsizeof(key) + getsizeof(value)
-
-    def _evict_oldest(self) -> None:
-        """Evict the oldest entry (LRU policy) - internal, no lock."""
-        if self._cache:
-            key, value = self._cache.popitem(last=False)
-            self._current_memory -= self._estimate_entry_size(key, value)
-            if key in self._ttl:
-                del self._ttl[key]
+    def _estimate_entry_size(self, key: str, value: str | bytes) -> int:
+        """Estimate memory size of a cache entry, including container overhead."""
+        return (
+            getsizeof(key)
+            + getsizeof(value)
+            + ENTRY_OVERHEAD
+            + key.count(KEY_SEPARATOR) * INDEX_OVERHEAD
+        )
+
+    def _index_key(self, key: str) -> None:
+        """Add a new key to the prefix index (internal, no lock)."""
+        for prefix in _key_prefixes(key):
+            self._prefix_index.setdefault(prefix, set()).add(key)
+
+    def _unindex_key(self, key: str) -> None:
+        """Remove a key from the prefix index, dropping empty prefixes (internal, no lock)."""
+        for prefix in _key_prefixes(key):
+            keys = self._prefix_index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._prefix_index[prefix]
+
+    def _is_over_limits(self) -> bool:
+        """Check the entry count and memory limits (internal, no lock)."""
+        return len(self._cache) > self._max_entries or self._current_memory > self._max_memory_bytes
+
+    def _evict(self) -> None:
+        """Evict the policy's victim - internal, no lock."""
+        self._delete_internal(self._policy.victim())
+        self.evicted_keys += 1
+        if self._on_evict is not None:
+            self._on_evict(1)
 
     def _delete_internal(self, *keys: str) -> int:
         """Delete keys without acquiring lock (internal use only)."""
@@ -134,71 +431,122 @@ class MemoryClient:
                 self._current_memory -= self._estimate_entry_size(key, value)
                 if key in self._ttl:
                     del self._ttl[key]
+                self._policy.on_remove(key)
+                self._unindex_key(key)
                 count += 1
         return count
 
-    async def get(self, key: str) -> str | None:
-        """Get a value from the cache."""
-        async with self._lock:
-            if self._is_expired_internal(key):
-                self._delete_internal(key)
-                return None
-            value = self._cache.get(key)
-            if value is not None:
-                # Move to end for LRU tracking
-                self._cache.move_to_end(key)
-            return value
+    def _get_internal(self, key: str) -> str | bytes | None:
+        """Get a value without acquiring lock (internal use only)."""
+        self._restore(key)
+        if self._is_expired_internal(key):
+            self._expire_keys(key)
+            return None
+        value = self._cache.get(key)
+        if value is None:
+            self._policy.on_miss(key)
+        else:
+            self._policy.on_access(key)
+        return value
+
+    def _set_internal(self, key: str, value: str | bytes, ex: int | None = None) -> None:
+        """
+        Set a value without acquiring lock (internal use only).
 
-    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        The entry is stored first and the policy then evicts until the client is
+        back within its limits; TinyLFU may pick the new key itself, which like a
+        Redis eviction still counts as a successful set.
+        """
+        # The new value supersedes any not yet restored from the snapshot
+        if self._pending:
+            self._pending.pop(key, None)
+        if key in self._cache:
+            self._current_memory -= self._estimate_entry_size(key, self._cache[key])
+            self._policy.on_access(key)
+        else:
+            self._policy.on_insert(key)
+            self._index_key(key)
+
+        self._cache[key] = value
+        self._current_memory += self._estimate_entry_size(key, value)
+
+        if ex:
+            self._set_expiry(key, time() + ex)
+        elif key in self._ttl:
+            # Redis SET removes TTL unless KEEPTTL is used
+            del self._ttl[key]
+
+        while self._cache and self._is_over_limits():
+            self._evict()
+
+    async def get(self, key: str) -> str | bytes | None:
+        """Get a value from the cache without taking the lock."""
+        return self._get_internal(key)
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get a value from the cache as bytes, encoding text values."""
+        value = await self.get(key)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | bytes | None]:
+        """Get many values without taking the lock."""
+        return [self._get_internal(key) for key in keys]
+
+    async def get_many_bytes(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values as bytes without taking the lock."""
+        values = await self.get_many(keys)
+        return [value.encode("utf-8") if isinstance(value, str) else value for value in values]
+
+    async def set(self, key: str, value: str | bytes, ex: int | None = None) -> bool:
         """Set a value in the cache with optional TTL and automatic eviction."""
         async with self._lock:
-            entry_size = self._estimate_entry_size(key, value)
-
-            # If key already exists, subtract old size
-            if key in self._cache:
-                old_value = self._cache[key]
-                self._current_memory -= self._estimate_entry_size(key, old_value)
-
-            # Evict entries if we exceed limits
-            while (
-                len(self._cache) >= self._max_entries
-                and key not in self._cache
-                or self._current_memory + entry_size > self._max_memory_bytes
-            ) and self._cache:
-                self._evict_oldest()
-
-            # Store the value
-            self._cache[key] = value
-            self._cache.move_to_end(key)  # Mark as recently used
-            self._current_memory += entry_size
-
-            if ex:
-                self._ttl[key] = time() + ex
-            elif key in self._ttl:
-                # Redis SET removes TTL unless KEEPTTL is used
-                del self._ttl[key]
+            self._set_internal(key, value, ex)
+            return True
 
+    async def set_many(self, items: Mapping[str, tuple[str | bytes, int | None]]) -> bool:
+        """Set many values with per-key TTL under a single lock acquisition."""
+        async with self._lock:
+            for key, (value, ex) in items.items():
+                self._set_internal(key, value, ex)
             return True
 
+    async def incr(self, key: str) -> int:
+        """Increment an integer value, starting from 0; the TTL is kept like Redis INCR."""
+        async with self._lock:
+            current = self._get_internal(key)
+            value = int(current or 0) + 1
+            expires_at = self._ttl.get(key)
+            self._set_internal(key, str(value))
+            if expires_at is not None and key in self._cache:
+                # The heap still holds this expiry time
+                self._ttl[key] = expires_at
+            return value
+
     async def delete(self, *keys: str) -> int:
         """Delete one or more keys from the cache."""
         async with self._lock:
+            for key in keys:
+                self._restore(key)
             return self._delete_internal(*keys)
 
     async def exists(self, *keys: str) -> int:
         """Check if one or more keys exist in the cache."""
-        async with self._lock:
-            count = 0
-            for key in keys:
-                if key in self._cache and not self._is_expired_internal(key):
-                    count += 1
-            return count
+        count = 0
+        for key in keys:
+            self._restore(key)
+            if key in self._cache and not self._is_expired_internal(key):
+                count += 1
+        return count
 
     async def flush_all(self) -> bool:
         """Clear the entire cache."""
         async with self._lock:
             self._cache.clear()
             self._ttl.clear()
+            self._expiry_heap.clear()
+            self._policy.clear()
+            self._prefix_index.clear()
+            self._release_snapshot()
             self._current_memory = 0
             return True
 
@@ -208,37 +556,42 @@ class MemoryClient:
 
     async def info(self) -> dict[str, str | int]:
         """Get information about the in-memory cache."""
-        async with self._lock:
-            return {
-                "server": "In-Memory Cache",
-                "connected_clients": 1,
-                "used_memory_bytes": self._current_memory,
-                "used_memory_human": f"{self._current_memory / 1024 / 1024:.2f}MB",
-                "total_keys": len(self._cache),
-                "max_entries": self._max_entries,
-                "max_memory_mb": self._max_memory_bytes // 1024 // 1024,
-            }
+        return {
+            "server": "In-Memory Cache",
+            "connected_clients": 1,
+            "used_memory_bytes": self._current_memory,
+            "used_memory_human": f"{self._current_memory / 1024 / 1024:.2f}MB",
+            "total_keys": len(self._cache),
+            "max_entries": self._max_entries,
+            "max_memory_mb": self._max_memory_bytes // 1024 // 1024,
+            "eviction_policy": self._strategy,
+            "expired_keys": self.expired_keys,
+            "evicted_keys": self.evicted_keys,
+            "snapshot_pending_keys": len(self._pending),
+            "restored_keys": self.restored_keys,
+        }
 
     async def ttl(self, key: str) -> int:
         """Get the remaining time to live of a key."""
-        async with self._lock:
-            if self._is_expired_internal(key):
-                self._delete_internal(key)
-                return -2
+        self._restore(key)
+        if self._is_expired_internal(key):
+            self._expire_keys(key)
+            return -2
 
-            if key not in self._cache:
-                return -2
+        if key not in self._cache:
+            return -2
 
-            if key not in self._ttl:
-                return -1
+        if key not in self._ttl:
+            return -1
 
-            return int(self._ttl[key] - time())
+        return int(self._ttl[key] - time())
 
     async def expire(self, key: str, seconds: int) -> bool:
         """Set an expiration time on a key."""
         async with self._lock:
+            self._restore(key)
             if key in self._cache:
-                self._ttl[key] = time() + seconds
+                self._set_expiry(key, time() + seconds)
                 return True
             return False
 
@@ -251,6 +604,9 @@ class MemoryClient:
         Yield keys matching the pattern.
 
         Uses fnmatch for pattern matching (supports wildcards like * and ?).
+        Candidates come from the prefix index entry for the longest
+        separator-terminated literal prefix of the pattern, so ``ns:*`` visits
+        only the keys under ``ns:``; patterns without such a prefix scan all keys.
 
         Args:
             pattern: Glob-style pattern to match keys.
@@ -259,16 +615,31 @@ class MemoryClient:
         Yields:
             Keys matching the pattern.
         """
-        async with self._lock:
-            # Create a copy of keys to avoid modification during iteration
-            keys = list(self._cache.keys())
+        # Matching keys still in the snapshot are restored so they can be deleted
+        for key in [key for key in self._pending if fnmatch(key, pattern)]:
+            self._restore(key)
+
+        glob_at = min((i for i in map(pattern.find, GLOB_CHARS) if i != -1), default=-1)
+        if glob_at == -1:
+            if pattern in self._cache:
+                yield pattern
+            return
+
+        literal = pattern[:glob_at]
+        indexed = literal[: literal.rfind(KEY_SEPARATOR) + 1]
+        candidates = self._prefix_index.get(indexed, ()) if indexed else self._cache
+
+        # Copy the keys so writes between yields don't break iteration
+        if pattern == f"{indexed}*":
+            keys = list(candidates)
+        else:
+            keys = [key for key in candidates if key.startswith(literal) and fnmatch(key, pattern)]
 
         for key in keys:
-            if fnmatch(key, pattern):
-                yield key
+            yield key
 
     async def close(self) -> None:
-        """Stop the client and cleanup tasks."""
+        """Stop the client and cleanup tasks, saving a final snapshot if enabled."""
         async with self._lock:
             self.is_connected = False
             if self._cleanup_task:
@@ -276,3 +647,12 @@ class MemoryClient:
                 with suppress(CancelledError):
                     await self._cleanup_task
                 self._cleanup_task = None
+            snapshot_task, self._snapshot_task = self._snapshot_task, None
+
+        # Only a client that was started has entries worth replacing the file with
+        if snapshot_task is not None:
+            snapshot_task.cancel()
+            with suppress(CancelledError):
+                await snapshot_task
+            await self.save_snapshot()
+            self._release_snapshot()
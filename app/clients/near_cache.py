@@ -0,0 +1,144 @@
+"""In-process near cache (L1) that sits in front of the shared Redis tier (L2)."""
+
+from collections import OrderedDict
+from time import monotonic
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class NearCache[ValueT: (str, bytes) = str]:
+    """
+    Bounded, TTL-aware in-process map used as an L1 tier in each worker.
+
+    Entries hold the decompressed JSON payload rather than the deserialized object,
+    so every hit returns a fresh object and callers can never mutate a shared copy.
+    Client tracking reuses it as a mirror of Redis values, raw ones included
+    (``NearCache[bytes]``).
+
+    All methods are synchronous and never await, which makes each call atomic with
+    respect to the event loop; no lock is required.
+
+    Coherence across workers is handled by the owner (``CacheManager``), which calls
+    ``invalidate``/``invalidate_prefix``/``clear`` when it receives pub/sub messages.
+    The ``version`` counter guards against a read racing an invalidation: a value
+    fetched from L2 is only stored if no invalidation happened while it was in flight.
+
+    Features:
+        - LRU eviction bounded by entry count
+        - Per-entry expiry on a monotonic clock
+        - Version stamping for race-free population
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 10_000
+    DEFAULT_TTL: int = 30  # seconds
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: int = DEFAULT_TTL,
+    ) -> None:
+        """
+        Initialize the near cache.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction.
+            ttl: Upper bound in seconds for how long an entry is kept locally.
+        """
+        self._entries: OrderedDict[str, tuple[ValueT, float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._version: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def version(self) -> int:
+        """Current invalidation version; bumped on every invalidation."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> ValueT | None:
+        """Return the payload for a key, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: ValueT,
+        ttl: int | None = None,
+        version: int | None = None,
+    ) -> bool:
+        """
+        Store a payload locally.
+
+        Args:
+            key: Full cache key.
+            value: Decompressed JSON payload.
+            ttl: Remaining lifetime in L2; the local lifetime never exceeds it.
+            version: Version observed before the L2 read. When it no longer matches,
+                an invalidation raced the read and the value is discarded.
+
+        Returns:
+            True if the value was stored.
+        """
+        if version is not None and version != self._version:
+            return False
+
+        lifetime = self._ttl if ttl is None else min(ttl, self._ttl)
+        if lifetime <= 0:
+            return False
+
+        self._entries[key] = (value, monotonic() + lifetime)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, *keys: str) -> int:
+        """Drop specific keys and bump the version."""
+        self._version += 1
+        count = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                count += 1
+        return count
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every key starting with prefix and bump the version."""
+        self._version += 1
+        stale = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry and bump the version."""
+        self._version += 1
+        self._entries.clear()
+
+    def info(self) -> dict[str, int]:
+        """Return size and hit counters for health reporting."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
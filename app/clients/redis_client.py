@@ -1,21 +1,35 @@
 # app/clients/redis_client.py
 """Redis client module for cache operations with retry logic and health checks."""
 
-from collections.abc import AsyncGenerator, Awaitable
+from collections.abc import AsyncGenerator, Awaitable, Mapping, Sequence
 from logging import DEBUG
 from time import monotonic
 from typing import Any
 
 from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import PubSub
+from redis.asyncio.cluster import ClusterNode, RedisCluster
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 
-from app.configs.redis import pool_kwargs
+from app.clients.client_tracking import ClientTracking
+from app.clients.command_batcher import CommandBatcher
+from app.clients.replica_router import ReplicaRouter
+from app.configs.redis import cluster_kwargs, cluster_startup_nodes, pool_kwargs
 from app.decorators.with_retry import RETRIABLE_EXCEPTIONS, with_retry
 from app.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Delete a lease only if it is still held by the caller's token, so a worker whose
+# lease already expired can never release one that another worker has since taken.
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class RedisClient:
     """
@@ -26,19 +40,48 @@ class RedisClient:
         - Proper connection pool cleanup on disconnect
         - Health check endpoint for monitoring
         - Memory-efficient key scanning
+        - Second pool without response decoding for binary cache values
+        - Optional client tracking, serving repeated GETs from a local mirror
+        - Optional batching of concurrent GET/EXISTS/TTL calls into pipelines
+        - Redis Cluster mode, with scans and multi-key reads spread over the nodes
+        - Optional routing of GET/EXISTS/TTL/SCAN reads to read replicas
     """
 
-    def __init__(self) -> None:
-        """Initialize Redis client."""
+    def __init__(
+        self,
+        tracking: ClientTracking | None = None,
+        batcher: CommandBatcher | None = None,
+        replicas: ReplicaRouter | None = None,
+    ) -> None:
+        """
+        Initialize Redis client.
+
+        Args:
+            tracking: Client-side caching to enable on connect; reads fall back to
+                Redis whenever it is unavailable.
+            batcher: Coalesces single-key reads issued concurrently into one
+                pipelined round trip; each read is sent on its own when None.
+            replicas: Routes reads to read replicas within its lag and consistency
+                policy; everything is read from the primary when None.
+        """
         self.config = pool_kwargs
+        self.cluster_nodes = cluster_startup_nodes
+        self.tracking = tracking
+        self.batcher = batcher
+        self.replicas = replicas
         self._pool: ConnectionPool | None = None
-        self._redis: Redis | None = None
+        self._redis: Redis | RedisCluster | None = None
+        self._binary_pool: ConnectionPool | None = None
+        self._binary_redis: Redis | RedisCluster | None = None
 
     async def connect(self) -> None:
         """Establish Redis connection pool."""
         try:
-            self._pool = ConnectionPool(**self.config)
-            self._redis = Redis(connection_pool=self._pool)
+            if self.cluster_nodes:
+                self._redis = self._cluster(decode_responses=True)
+            else:
+                self._pool = ConnectionPool(**self.config)
+                self._redis = Redis(connection_pool=self._pool)
             # Test connection with ping
             ping_result = self._redis.ping()
             if isinstance(ping_result, Awaitable):
@@ -48,44 +91,146 @@ class RedisClient:
             if not result:
                 mssg = "Redis ping returned False"
                 raise RedisConnectionError(mssg)
+            # Binary values must not pass through UTF-8 decoding; connects lazily
+            if self.cluster_nodes:
+                self._binary_redis = self._cluster(decode_responses=False)
+            else:
+                self._binary_pool = ConnectionPool(**{**self.config, "decode_responses": False})
+                self._binary_redis = Redis(connection_pool=self._binary_pool)
+            await self._start_extensions()
             logger.info("Redis connection successful. Cache is using Redis.")
         except RETRIABLE_EXCEPTIONS + (RedisError,) as e:
             logger.exception("Failed to connect to Redis")
-            mssg = f"Cannot connect to Redis at {self.config.get('host')}:{self.config.get('port')}"
+            # A failed ping leaves no open connection; drop the half-made pool so
+            # the client does not look connected
+            if self._binary_redis is None:
+                self._pool = None
+                self._redis = None
+            mssg = f"Cannot connect to Redis at {self._address}"
             raise RedisConnectionError(mssg) from e
 
+    @property
+    def _address(self) -> str:
+        """Where connect() looks for Redis, for error messages."""
+        if self.cluster_nodes:
+            nodes = ",".join(f"{host}:{port}" for host, port in self.cluster_nodes)
+            return f"cluster {nodes}"
+        return f"{self.config.get('host')}:{self.config.get('port')}"
+
+    async def _start_extensions(self) -> None:
+        """Start client tracking and replica routing once the primary answers."""
+        if self.cluster_nodes:
+            if self.tracking is not None:
+                # Invalidations would have to be subscribed to on every node
+                logger.warning("Client tracking is not supported with Redis Cluster; disabled.")
+                self.tracking = None
+            if self.replicas is not None:
+                # RedisCluster discovers the replicas of each shard itself
+                logger.warning("Read replicas are not used with Redis Cluster; disabled.")
+                self.replicas = None
+        if self.tracking is not None:
+            await self.tracking.start(self.config)
+        if self.replicas is not None and isinstance(self._redis, Redis):
+            await self.replicas.start(self.config, self._redis)
+
+    def _cluster(self, *, decode_responses: bool) -> RedisCluster:
+        """Create a cluster client; it discovers the nodes and slots from the startup nodes."""
+        return RedisCluster(
+            startup_nodes=[ClusterNode(host, port) for host, port in self.cluster_nodes],
+            **{**cluster_kwargs, "decode_responses": decode_responses},
+        )
+
     async def disconnect(self) -> None:
         """Close Redis connection pool properly."""
+        if self.tracking is not None:
+            await self.tracking.stop()
+        if self.batcher is not None:
+            await self.batcher.close()
+        if self.replicas is not None:
+            await self.replicas.stop()
         if self._redis is not None:
             await self._redis.aclose()
             self._redis = None
         if self._pool is not None:
             await self._pool.disconnect()
             self._pool = None
+        if self._binary_redis is not None:
+            await self._binary_redis.aclose()
+            self._binary_redis = None
+        if self._binary_pool is not None:
+            await self._binary_pool.disconnect()
+            self._binary_pool = None
         logger.info("Redis connection and pool closed.")
 
     @property
-    def client(self) -> Redis:
+    def is_connected(self) -> bool:
+        """Whether connect() succeeded; the pools reconnect on their own after that."""
+        return self._binary_redis is not None
+
+    @property
+    def client(self) -> Redis | RedisCluster:
         """Get Redis client instance."""
         if self._redis is None:
             mssg = "Redis client not initialized. Call connect() first."
             raise RuntimeError(mssg)
         return self._redis
 
+    @property
+    def binary_client(self) -> Redis | RedisCluster:
+        """Get the Redis client whose responses are raw bytes."""
+        if self._binary_redis is None:
+            mssg = "Redis client not initialized. Call connect() first."
+            raise RuntimeError(mssg)
+        return self._binary_redis
+
     @with_retry(max_retries=3, base_delay=0.1)
-    async def get(self, key: str) -> str | None:
-        """Get value from cache with automatic retry."""
+    async def get(self, key: str, *, replica_ok: bool = False) -> str | None:
+        """Get value from cache with automatic retry; replica_ok allows a read replica."""
+        tracking = self.tracking
+        if tracking is not None and (mirrored := tracking.lookup(tracking.text, [key])[0]):
+            return mirrored
+        version = tracking.text.version if tracking is not None else 0
+        client = self._read_client([key], replica_ok=replica_ok)
         try:
-            return await self.client.get(key)
+            if self.batcher is None:
+                value = await client.get(key)
+            else:
+                value = await self.batcher.execute(client, "GET", key)
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to get key %s: %s", key, e)
+            mssg = f"Cache get operation failed for key {key}: {e}"
+            raise RedisConnectionError(mssg) from e
+        if tracking is not None and client is self.client:
+            tracking.store(tracking.text, [key], [value], version)
+        return value
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def get_bytes(self, key: str, *, replica_ok: bool = False) -> bytes | None:
+        """Get a raw value over the binary pool; replica_ok allows a read replica."""
+        tracking = self.tracking
+        if tracking is not None and (mirrored := tracking.lookup(tracking.binary, [key])[0]):
+            return mirrored
+        version = tracking.binary.version if tracking is not None else 0
+        client = self._read_client([key], binary=True, replica_ok=replica_ok)
+        try:
+            if self.batcher is None:
+                value = await client.get(key)
+            else:
+                value = await self.batcher.execute(client, "GET", key)
         except RedisError as e:
             if logger.isEnabledFor(DEBUG):
                 logger.debug("Failed to get key %s: %s", key, e)
             mssg = f"Cache get operation failed for key {key}: {e}"
             raise RedisConnectionError(mssg) from e
+        if tracking is not None and client is self.binary_client:
+            tracking.store(tracking.binary, [key], [value], version)
+        return value
 
     @with_retry(max_retries=3, base_delay=0.1)
-    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+    async def set(self, key: str, value: str | bytes, ex: int | None = None) -> bool:
         """Set value in cache with automatic retry."""
+        self._record_writes(key)
         try:
             return bool(await self.client.set(key, value, ex=ex))
         except RedisError as e:
@@ -93,24 +238,154 @@ class RedisClient:
                 logger.debug("Failed to set key %s: %s", key, e)
             mssg = f"Cache set operation failed for key {key}: {e}"
             raise RedisConnectionError(mssg) from e
+        finally:
+            # Reads of this process see the write before the server push arrives
+            if self.tracking is not None:
+                self.tracking.invalidate(key)
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def get_many(
+        self,
+        keys: Sequence[str],
+        *,
+        replica_ok: bool = False,
+    ) -> list[str | None]:
+        """Get many values with a single MGET; replica_ok allows a read replica."""
+        if not keys:
+            return []
+        tracking = self.tracking
+        if tracking is None:
+            return await self._mget(self._read_client(keys, replica_ok=replica_ok), keys)
+        values = tracking.lookup(tracking.text, keys)
+        missing = [key for key, value in zip(keys, values, strict=True) if value is None]
+        if not missing:
+            return values
+        version = tracking.text.version
+        client = self._read_client(missing, replica_ok=replica_ok)
+        fetched = await self._mget(client, missing)
+        if client is self.client:
+            tracking.store(tracking.text, missing, fetched, version)
+        remaining = iter(fetched)
+        return [next(remaining) if value is None else value for value in values]
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def get_many_bytes(
+        self,
+        keys: Sequence[str],
+        *,
+        replica_ok: bool = False,
+    ) -> list[bytes | None]:
+        """Get many raw values with a single MGET over the binary pool."""
+        if not keys:
+            return []
+        tracking = self.tracking
+        if tracking is None:
+            client = self._read_client(keys, binary=True, replica_ok=replica_ok)
+            return await self._mget(client, keys)
+        values = tracking.lookup(tracking.binary, keys)
+        missing = [key for key, value in zip(keys, values, strict=True) if value is None]
+        if not missing:
+            return values
+        version = tracking.binary.version
+        client = self._read_client(missing, binary=True, replica_ok=replica_ok)
+        fetched = await self._mget(client, missing)
+        if client is self.binary_client:
+            tracking.store(tracking.binary, missing, fetched, version)
+        remaining = iter(fetched)
+        return [next(remaining) if value is None else value for value in values]
+
+    def _read_client(
+        self,
+        keys: Sequence[str] | None,
+        *,
+        binary: bool = False,
+        replica_ok: bool = False,
+    ) -> Redis | RedisCluster:
+        """
+        Pick the client a read of keys goes to: a replica if allowed, else the primary.
+
+        Reads default to the primary; only callers that tolerate the replica lag
+        (cache lookups) pass replica_ok. Security checks such as the token
+        blacklist and login lockouts must see every write at once.
+        """
+        if (
+            replica_ok
+            and self.replicas is not None
+            and (replica := self.replicas.pick(keys, binary=binary))
+        ):
+            return replica
+        return self.binary_client if binary else self.client
+
+    def _record_writes(self, *keys: str) -> None:
+        """Let the replica router send later reads of keys in this request to the primary."""
+        if self.replicas is not None:
+            self.replicas.record_writes(*keys)
+
+    @staticmethod
+    async def _mget(client: Redis | RedisCluster, keys: Sequence[str]) -> list[Any]:
+        """Run one MGET, wrapping Redis errors like the other operations."""
+        try:
+            if isinstance(client, RedisCluster):
+                # Keys may live on several nodes; one MGET per hash slot, run in parallel
+                return await client.mget_nonatomic(keys)
+            return await client.mget(keys)
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to get %d keys: %s", len(keys), e)
+            mssg = f"Cache get_many operation failed for {len(keys)} keys: {e}"
+            raise RedisConnectionError(mssg) from e
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def set_many(self, items: Mapping[str, tuple[str | bytes, int | None]]) -> bool:
+        """
+        Set many values with per-key TTL in one pipelined round trip.
+
+        The pipeline is not transactional; SET is idempotent, so a retry after a
+        partial failure is safe.
+        """
+        if not items:
+            return True
+        self._record_writes(*items)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, (value, ex) in items.items():
+                    pipe.set(key, value, ex=ex)
+                results = await pipe.execute()
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to set %d keys: %s", len(items), e)
+            mssg = f"Cache set_many operation failed for {len(items)} keys: {e}"
+            raise RedisConnectionError(mssg) from e
+        finally:
+            if self.tracking is not None:
+                self.tracking.invalidate(*items)
+        return all(results)
 
     @with_retry(max_retries=3, base_delay=0.1)
     async def delete(self, *keys: str) -> int:
         """Delete keys from cache with automatic retry."""
         if not keys:
             return 0
+        self._record_writes(*keys)
         try:
             return await self.client.delete(*keys)
         except RedisError as e:
             logger.exception("Failed to delete keys")
             mssg = f"Cache delete operation failed for keys {keys}: {e}"
             raise RedisConnectionError(mssg) from e
+        finally:
+            if self.tracking is not None:
+                self.tracking.invalidate(*keys)
 
     @with_retry(max_retries=3, base_delay=0.1)
-    async def exists(self, *keys: str) -> int:
-        """Check if keys exist in cache with automatic retry."""
+    async def exists(self, *keys: str, replica_ok: bool = False) -> int:
+        """Check if keys exist with automatic retry; replica_ok allows a read replica."""
         try:
-            return await self.client.exists(*keys)
+            # Multi-key EXISTS is split per node by the cluster client, not batched
+            client = self._read_client(keys, replica_ok=replica_ok)
+            if self.batcher is None or len(keys) != 1:
+                return await client.exists(*keys)
+            return await self.batcher.execute(client, "EXISTS", *keys)
         except RedisError as e:
             logger.exception("Failed to check key existence")
             mssg = f"Cache exists operation failed for keys {keys}: {e}"
@@ -119,6 +394,7 @@ class RedisClient:
     @with_retry(max_retries=3, base_delay=0.1)
     async def expire(self, key: str, seconds: int) -> bool:
         """Set expiration on key with automatic retry."""
+        self._record_writes(key)
         try:
             return await self.client.expire(key, seconds)
         except RedisError as e:
@@ -128,10 +404,13 @@ class RedisClient:
             raise RedisConnectionError(mssg) from e
 
     @with_retry(max_retries=3, base_delay=0.1)
-    async def ttl(self, key: str) -> int:
-        """Get remaining time to live with automatic retry."""
+    async def ttl(self, key: str, *, replica_ok: bool = False) -> int:
+        """Get remaining time to live; replica_ok allows a read replica."""
         try:
-            return await self.client.ttl(key)
+            client = self._read_client([key], replica_ok=replica_ok)
+            if self.batcher is None:
+                return await client.ttl(key)
+            return await self.batcher.execute(client, "TTL", key)
         except RedisError as e:
             if logger.isEnabledFor(DEBUG):
                 logger.debug("Failed to get TTL for %s: %s", key, e)
@@ -141,6 +420,7 @@ class RedisClient:
     @with_retry(max_retries=3, base_delay=0.1)
     async def incr(self, key: str) -> int:
         """Increment value atomically with automatic retry."""
+        self._record_writes(key)
         try:
             return await self.client.incr(key)
         except RedisError as e:
@@ -200,14 +480,69 @@ class RedisClient:
             mssg = f"Cache zremrangebyscore operation failed for key {key}: {e}"
             raise RedisConnectionError(mssg) from e
 
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def acquire_lease(self, key: str, token: str, px: int) -> bool:
+        """Take a short-lived lease (SET NX PX); True if the caller now holds it."""
+        try:
+            return bool(await self.client.set(key, token, nx=True, px=px))
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to acquire lease %s: %s", key, e)
+            mssg = f"Cache lease acquire failed for key {key}: {e}"
+            raise RedisConnectionError(mssg) from e
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def release_lease(self, key: str, token: str) -> bool:
+        """Release a lease if it is still held by token."""
+        try:
+            released = await self.client.eval(_RELEASE_LEASE_SCRIPT, 1, key, token)
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to release lease %s: %s", key, e)
+            mssg = f"Cache lease release failed for key {key}: {e}"
+            raise RedisConnectionError(mssg) from e
+        return bool(released)
+
+    @with_retry(max_retries=3, base_delay=0.1)
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a channel with automatic retry."""
+        try:
+            return await self.client.publish(channel, message)
+        except RedisError as e:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to publish to channel %s: %s", channel, e)
+            mssg = f"Cache publish operation failed for channel {channel}: {e}"
+            raise RedisConnectionError(mssg) from e
+
+    async def subscribe(self, *channels: str) -> PubSub:
+        """
+        Open a dedicated pub/sub connection subscribed to the given channels.
+
+        The caller owns the returned PubSub and must close it with ``aclose()``.
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(*channels)
+        except RedisError as e:
+            await pubsub.aclose()
+            logger.exception("Failed to subscribe to channels %s", channels)
+            mssg = f"Cache subscribe operation failed for channels {channels}: {e}"
+            raise RedisConnectionError(mssg) from e
+        return pubsub
+
     async def flush_db(self) -> bool:
         """Flush current database."""
+        if self.replicas is not None:
+            self.replicas.record_flush()
         try:
             return await self.client.flushdb()
         except RedisError as e:
             logger.exception("Failed to flush database")
             mssg = f"Cache flush_db operation failed: {e}"
             raise RedisConnectionError(mssg) from e
+        finally:
+            if self.tracking is not None:
+                self.tracking.clear()
 
     async def flush_all(self) -> bool:
         """Flush all databases (alias for flush_db for protocol compatibility)."""
@@ -250,7 +585,7 @@ class RedisClient:
             latency_ms = (monotonic() - start) * 1000
 
             info = await self.info()
-            return {
+            result: dict[str, Any] = {
                 "status": "healthy",
                 "latency_ms": round(latency_ms, 2),
                 "connected_clients": info.get("connected_clients"),
@@ -258,27 +593,53 @@ class RedisClient:
                 "uptime_seconds": info.get("uptime_in_seconds"),
                 "redis_version": info.get("redis_version"),
             }
+            if self.tracking is not None:
+                result["client_tracking"] = self.tracking.info()
+            if self.batcher is not None:
+                result["command_batching"] = self.batcher.info()
+            if self.replicas is not None:
+                result["read_replicas"] = self.replicas.info()
+            return result
         except RedisError as e:
             return {
                 "status": "unhealthy",
                 "error": str(e),
             }
 
-    async def scan_iter(self, pattern: str, count: int = 100) -> AsyncGenerator[str]:
+    async def scan_iter(
+        self,
+        pattern: str,
+        count: int = 100,
+        *,
+        replica_ok: bool = False,
+    ) -> AsyncGenerator[str]:
         """
         Yield keys matching the pattern memory-efficiently.
 
         Args:
             pattern: Glob-style pattern to match keys.
             count: Hint for number of keys to return per iteration.
+            replica_ok: Allow a read replica; scans driving deletes must leave it
+                False, since keys written within the replica lag would be missed.
 
         Yields:
             Keys matching the pattern.
         """
+        client = self._read_client(None, replica_ok=replica_ok)
+        if isinstance(client, RedisCluster):
+            # Every primary holds part of the keyspace; the cluster client scans each
+            try:
+                async for key in client.scan_iter(match=pattern, count=count):
+                    yield key.decode("utf-8") if isinstance(key, bytes) else key
+            except RedisError as e:
+                logger.exception("Failed to scan keys with pattern %s", pattern)
+                mssg = f"Cache scan_iter operation failed for pattern {pattern}: {e}"
+                raise RedisConnectionError(mssg) from e
+            return
         cursor: int = 0
         while True:
             try:
-                scan_result: tuple[int, list[bytes | str]] = await self.client.scan(
+                scan_result: tuple[int, list[bytes | str]] = await client.scan(
                     cursor,
                     match=pattern,
                     count=count,
@@ -295,3 +656,37 @@ class RedisClient:
                 logger.exception("Failed to scan keys with pattern %s", pattern)
                 mssg = f"Cache scan_iter operation failed for pattern {pattern}: {e}"
                 raise RedisConnectionError(mssg) from e
+
+
+class ReplicaReader:
+    """
+    Read-only view of a RedisClient whose reads may be served by read replicas.
+
+    RedisClient reads go to the primary unless asked otherwise. Cache lookups,
+    which tolerate the bounded replica lag, read through this view instead.
+    """
+
+    def __init__(self, client: RedisClient) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            client: Client whose replica router, if any, serves the reads.
+        """
+        self.client = client
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get a raw value, possibly from a replica."""
+        return await self.client.get_bytes(key, replica_ok=True)
+
+    async def get_many_bytes(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many raw values, possibly from a replica."""
+        return await self.client.get_many_bytes(keys, replica_ok=True)
+
+    async def exists(self, *keys: str) -> int:
+        """Count existing keys, possibly on a replica."""
+        return await self.client.exists(*keys, replica_ok=True)
+
+    async def ttl(self, key: str) -> int:
+        """Get the remaining time to live, possibly from a replica."""
+        return await self.client.ttl(key, replica_ok=True)
@@ -0,0 +1,239 @@
+"""Routing of Redis cache reads to read replicas within a bounded staleness."""
+
+from asyncio import CancelledError, Task, create_task, gather
+from asyncio import sleep as asyncio_sleep
+from collections import deque
+from collections.abc import Sequence
+from contextlib import suppress
+from contextvars import ContextVar
+from math import inf
+from time import monotonic
+from typing import Any, Literal
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+ReplicaConsistency = Literal["read_your_writes", "bounded_lag"]
+
+#: Keys written during the current request; set per request by ContextMiddleware.
+#: The set is shared with the tasks a request spawns, so their writes count too.
+request_writes: ContextVar[set[str] | None] = ContextVar("redis_request_writes", default=None)
+
+# Recorded in request_writes when every key may have changed (FLUSHDB)
+_ALL_KEYS = "*"
+
+
+class _Replica:
+    """Clients of one replica and how recently it was known to be in sync."""
+
+    __slots__ = ("address", "binary_client", "client", "pools", "synced_at")
+
+    def __init__(self, pool_kwargs: dict[str, Any], host: str, port: int) -> None:
+        self.address = f"{host}:{port}"
+        kwargs = {**pool_kwargs, "host": host, "port": port}
+        self.pools = (
+            ConnectionPool(**kwargs),
+            ConnectionPool(**{**kwargs, "decode_responses": False}),
+        )
+        self.client = Redis(connection_pool=self.pools[0])
+        self.binary_client = Redis(connection_pool=self.pools[1])
+        # Monotonic time up to which the replica holds every write of the primary
+        self.synced_at: float = -inf
+
+    async def close(self) -> None:
+        for client in (self.client, self.binary_client):
+            with suppress(RedisError, OSError):
+                await client.aclose()
+        for pool in self.pools:
+            with suppress(RedisError, OSError):
+                await pool.disconnect()
+
+
+class ReplicaRouter:
+    """
+    Spreads cache reads over read replicas while bounding their staleness.
+
+    Every ``check_interval`` the primary's replication offset is sampled along
+    with the offset each replica has applied. A replica holding at least the
+    offset the primary had at some sample time has every write made before that
+    time, so its staleness is at most the time elapsed since. Reads only go to
+    replicas within ``max_lag`` of the primary; when none is, or the lag cannot
+    be measured, they fall back to the primary.
+
+    Two consistency policies are supported:
+        - ``read_your_writes``: keys written during the current request, and
+          scans once the request wrote anything, are read from the primary.
+        - ``bounded_lag``: every read may be served by a replica within
+          ``max_lag``, including keys the request has just written.
+
+    Only reads a caller explicitly opts in (cache lookups through
+    ``ReplicaReader``) are routed here; writes, Lua scripts, rate-limit counters
+    and security checks such as the token blacklist always use the primary.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[tuple[str, int]],
+        consistency: ReplicaConsistency = "read_your_writes",
+        max_lag: float = 1.0,
+        check_interval: float = 0.25,
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            nodes: (host, port) of each replica of the primary.
+            consistency: Policy for reads of keys the current request wrote.
+            max_lag: Seconds of staleness up to which a replica serves reads.
+            check_interval: Seconds between replication offset samples.
+        """
+        self.nodes = list(nodes)
+        self.consistency = consistency
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.replica_reads: int = 0
+        self.primary_reads: int = 0
+        self._replicas: list[_Replica] = []
+        self._next: int = 0
+        self._samples: deque[tuple[float, int]] = deque()
+        self._primary: Redis | None = None
+        self._task: Task[None] | None = None
+
+    async def start(self, pool_kwargs: dict[str, Any], primary: Redis) -> None:
+        """
+        Open the replica pools and start sampling replication lag.
+
+        Args:
+            pool_kwargs: Connection settings of the primary's pools.
+            primary: Client of the primary, whose offset the replicas are held to.
+        """
+        if self._task is not None:
+            return
+        # Replicas are reached over TCP even when the primary uses a Unix socket
+        kwargs = {k: v for k, v in pool_kwargs.items() if k not in {"path", "connection_class"}}
+        self._replicas = [_Replica(kwargs, host, port) for host, port in self.nodes]
+        self._primary = primary
+        await self._check()
+        self._task = create_task(self._monitor())
+        logger.info("Routing cache reads to %d Redis replicas.", len(self._replicas))
+
+    async def stop(self) -> None:
+        """Stop sampling and close the replica pools."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(CancelledError):
+                await self._task
+            self._task = None
+        for replica in self._replicas:
+            await replica.close()
+        self._replicas = []
+        self._samples.clear()
+        self._primary = None
+
+    def pick(self, keys: Sequence[str] | None, *, binary: bool = False) -> Redis | None:
+        """
+        Choose a replica for a read, or None to read from the primary.
+
+        Args:
+            keys: Keys the read touches; None for reads of unknown keys (scans).
+            binary: Whether the caller needs the client without response decoding.
+
+        Returns:
+            A client of a replica within max_lag, picked round-robin, or None.
+        """
+        if self.consistency == "read_your_writes" and self._wrote(keys):
+            self.primary_reads += 1
+            return None
+        replicas = self._replicas
+        now = monotonic()
+        for _ in range(len(replicas)):
+            replica = replicas[self._next % len(replicas)]
+            self._next += 1
+            if now - replica.synced_at <= self.max_lag:
+                self.replica_reads += 1
+                return replica.binary_client if binary else replica.client
+        self.primary_reads += 1
+        return None
+
+    @staticmethod
+    def record_writes(*keys: str) -> None:
+        """Remember keys written during the current request."""
+        written = request_writes.get()
+        if written is not None:
+            written.update(keys)
+
+    @staticmethod
+    def record_flush() -> None:
+        """Remember that every key may have changed during the current request."""
+        ReplicaRouter.record_writes(_ALL_KEYS)
+
+    @staticmethod
+    def _wrote(keys: Sequence[str] | None) -> bool:
+        """Whether the current request wrote any of keys (any key at all for None)."""
+        written = request_writes.get()
+        if not written:
+            return False
+        if keys is None or _ALL_KEYS in written:
+            return True
+        return not written.isdisjoint(keys)
+
+    async def _monitor(self) -> None:
+        """Sample replication offsets until stopped."""
+        while True:
+            await asyncio_sleep(self.check_interval)
+            await self._check()
+
+    async def _check(self) -> None:
+        """Sample the primary's offset and update how far each replica is in sync."""
+        if self._primary is None:
+            return
+        # The primary's offset is read after this instant, so it covers every
+        # write made before it
+        sampled_at = monotonic()
+        try:
+            info = await self._primary.info("replication")
+        except RedisError as e:
+            # Without the primary's offset no replica can be shown to be in sync
+            logger.debug("Failed to sample primary replication offset: %s", e)
+            return
+        self._samples.append((sampled_at, int(info.get("master_repl_offset", 0))))
+        # Samples older than max_lag can no longer make a replica eligible
+        while self._samples[0][0] < sampled_at - self.max_lag:
+            self._samples.popleft()
+        # One slow replica must not delay the others
+        await gather(*(self._check_replica(replica) for replica in self._replicas))
+
+    async def _check_replica(self, replica: _Replica) -> None:
+        """Advance synced_at to the latest sample whose offset the replica holds."""
+        try:
+            info = await replica.client.info("replication")
+        except RedisError as e:
+            logger.debug("Failed to check replica %s: %s", replica.address, e)
+            return
+        if info.get("master_link_status") != "up":
+            return
+        offset = int(info.get("slave_repl_offset", -1))
+        for synced_at, primary_offset in reversed(self._samples):
+            if offset >= primary_offset:
+                replica.synced_at = max(replica.synced_at, synced_at)
+                return
+
+    def info(self) -> dict[str, Any]:
+        """Return routing counters and replica lag for health reporting."""
+        now = monotonic()
+        return {
+            "consistency": self.consistency,
+            "max_lag_seconds": self.max_lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "replicas": {
+                replica.address: round(now - replica.synced_at, 3)
+                if replica.synced_at > -inf
+                else None
+                for replica in self._replicas
+            },
+        }
@@ -0,0 +1,538 @@
+"""Cache client over a memory-mapped region shared by every worker on the host."""
+
+from collections.abc import AsyncGenerator, Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from fcntl import LOCK_EX, LOCK_UN, lockf
+from fnmatch import fnmatch
+from hashlib import blake2b
+from math import inf
+from mmap import mmap
+from os import O_CREAT, O_RDWR, close, fstat, ftruncate, pread, pwrite
+from os import open as os_open
+from struct import Struct
+from time import time
+from typing import NamedTuple
+from zlib import crc32
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Region header: magic, layout version, slot count, slot size, slots per bucket
+REGION_HEADER = Struct("<8sIIII")
+REGION_MAGIC = b"BBCACHE\x00"
+LAYOUT_VERSION = 1
+# Slots start at this offset so every slot stays 8-byte aligned
+REGION_HEADER_SIZE = 64
+
+# Slot header: seqlock counter, key hash (0 = empty), expiry and write time
+# (epoch seconds, 0 = no expiry), value length, CRC32 of key + value, key length, flags
+SLOT_HEADER = Struct("<QQddIIHB5x")
+SEQ = Struct("<Q")
+KEY_HASH = Struct("<Q")
+# Flag bit set when the value was stored as text and is returned as str
+TEXT_FLAG = 1
+
+
+class SlotHeader(NamedTuple):
+    """Decoded ``SLOT_HEADER`` of a slot."""
+
+    seq: int
+    key_hash: int
+    expires_at: float
+    written_at: float
+    value_len: int
+    checksum: int
+    key_len: int
+    flags: int
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the entry has an expiry that has passed."""
+        return 0 < self.expires_at <= time()
+
+
+def _key_hash(key: bytes) -> int:
+    """Hash a key identically in every process (``hash()`` is salted per process)."""
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryClient:
+    """
+    An asynchronous cache client whose entries live in a shared memory-mapped file.
+
+    Every worker on the host maps the same file (on tmpfs, such as ``/dev/shm``),
+    so the fallback cache is shared instead of being duplicated per worker and a
+    value computed by one worker is a hit for the others.
+
+    Layout: a fixed number of fixed-size slots grouped into buckets of ``WAYS``
+    slots. A key's hash picks its bucket and the key may live in any slot of it,
+    so the bucket array doubles as the hash index and deletes leave no tombstones.
+    When a bucket is full, the entry closest to expiry (then the oldest) is evicted.
+    Values that do not fit in a slot are not cached, and ``set`` returns False.
+
+    Concurrency: writers lock the bucket's byte range with ``lockf``, which orders
+    writers across processes. Readers take no lock; each slot carries a seqlock
+    counter that writers make odd while the slot is inconsistent, and readers
+    retry when it was odd or changed during the read. A CRC32 of the key and value
+    is checked as well, so a torn read is never returned as a value. Expired
+    entries read as missing and their slots are reused by later writes.
+    """
+
+    DEFAULT_SLOTS: int = 8192
+    DEFAULT_SLOT_SIZE: int = 4096  # bytes, slot header included
+    # Slots per bucket; a key may be stored in any slot of its bucket
+    WAYS: int = 8
+    # Reads retried while a writer holds a slot before reporting a miss
+    READ_ATTEMPTS: int = 16
+
+    def __init__(
+        self,
+        path: str,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        on_evict: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Initialize the client; the region is mapped by ``start_lifecycle``.
+
+        Args:
+            path: File backing the region, shared by every worker; the layout
+                (version and geometry) is appended so each layout has its own file.
+            slots: Number of slots, rounded down to a multiple of ``WAYS``.
+            slot_size: Bytes per slot, including the slot header and the key.
+            on_evict: Called with the number of keys removed by eviction or
+                expiry, e.g. ``CacheStatistics.record_eviction``.
+
+        Raises:
+            ValueError: If there is not one full bucket or a slot cannot hold data.
+        """
+        if slots < self.WAYS or slot_size <= SLOT_HEADER.size:
+            mssg = f"Shared memory cache needs {self.WAYS}+ slots of over {SLOT_HEADER.size} bytes"
+            raise ValueError(mssg)
+        self._buckets = slots // self.WAYS
+        self._slots = self._buckets * self.WAYS
+        # Workers with another layout (e.g. mid rolling deploy) map another file,
+        # so a region is never resized or reformatted under a worker using it
+        self._path = f"{path}-v{LAYOUT_VERSION}-{self._slots}x{slot_size}"
+        self._slot_size = slot_size
+        # Room left in a slot for the key and the value
+        self._capacity = slot_size - SLOT_HEADER.size
+        self._size = REGION_HEADER_SIZE + self._slots * slot_size
+        self._on_evict = on_evict
+        self._fd: int | None = None
+        self._region: mmap | None = None
+        self.expired_keys: int = 0
+        self.evicted_keys: int = 0
+        self.oversized_values: int = 0
+        self.is_connected: bool = False
+
+    async def start_lifecycle(self) -> None:
+        """Map the shared region, creating it if needed."""
+        if self._region is None:
+            self._attach()
+            logger.info("Shared memory cache attached at %s.", self._path)
+        self.is_connected = True
+
+    def _attach(self) -> None:
+        """
+        Open and map the region; the first worker formats it.
+
+        Raises:
+            OSError: If the file exists but does not hold a region of this layout.
+        """
+        header = REGION_HEADER.pack(
+            REGION_MAGIC,
+            LAYOUT_VERSION,
+            self._slots,
+            self._slot_size,
+            self.WAYS,
+        )
+        fd = os_open(self._path, O_RDWR | O_CREAT, 0o600)
+        try:
+            # Serializes formatting against workers attaching at the same time
+            lockf(fd, LOCK_EX)
+            try:
+                size = fstat(fd).st_size
+                current = pread(fd, REGION_HEADER.size, 0)
+                # A new file, or one whose formatting was interrupted: nobody has
+                # mapped it, as workers only map a region with a valid header
+                if size == 0 or (size == self._size and not any(current)):
+                    ftruncate(fd, self._size)
+                    pwrite(fd, header, 0)
+                elif size != self._size or current != header:
+                    mssg = f"{self._path} is not a shared memory cache of this layout"
+                    raise OSError(mssg)
+            finally:
+                lockf(fd, LOCK_UN)
+            self._region = mmap(fd, self._size)
+        except OSError:
+            close(fd)
+            raise
+        self._fd = fd
+
+    @property
+    def _map(self) -> mmap:
+        """The mapped region; raises ConnectionError while detached."""
+        if self._region is None:
+            mssg = "Shared memory cache is not attached"
+            raise ConnectionError(mssg)
+        return self._region
+
+    def _offset(self, slot: int) -> int:
+        return REGION_HEADER_SIZE + slot * self._slot_size
+
+    def _bucket_slots(self, key_hash: int) -> range:
+        first = (key_hash % self._buckets) * self.WAYS
+        return range(first, first + self.WAYS)
+
+    @contextmanager
+    def _locked(self, key_hash: int | None = None) -> Iterator[None]:
+        """Hold the write lock of a key's bucket, or of every slot when key_hash is None."""
+        if self._fd is None:
+            mssg = "Shared memory cache is not attached"
+            raise ConnectionError(mssg)
+        if key_hash is None:
+            start, length = REGION_HEADER_SIZE, 0  # 0 locks to the end of the file
+        else:
+            start, length = (
+                self._offset(self._bucket_slots(key_hash)[0]),
+                self.WAYS * self._slot_size,
+            )
+        lockf(self._fd, LOCK_EX, length, start)
+        try:
+            yield
+        finally:
+            lockf(self._fd, LOCK_UN, length, start)
+
+    def _header(self, slot: int) -> SlotHeader:
+        """Read a slot header without synchronization, as writers and hints do."""
+        return SlotHeader._make(SLOT_HEADER.unpack_from(self._map, self._offset(slot)))
+
+    def _read_slot(self, slot: int) -> tuple[SlotHeader, bytes] | None:
+        """
+        Read a slot consistently without locking (seqlock read side).
+
+        Returns:
+            The slot header fields and the key + value bytes, or None when the slot
+            is empty or kept changing under concurrent writes.
+        """
+        region = self._map
+        offset = self._offset(slot)
+        data_offset = offset + SLOT_HEADER.size
+        for _ in range(self.READ_ATTEMPTS):
+            (seq,) = SEQ.unpack_from(region, offset)
+            if seq & 1:
+                continue
+            header = self._header(slot)
+            if not header.key_hash:
+                return None
+            end = data_offset + header.key_len + header.value_len
+            if end > offset + self._slot_size:
+                continue
+            data = region[data_offset:end]
+            if SEQ.unpack_from(region, offset)[0] == seq and crc32(data) == header.checksum:
+                return header, data
+        return None
+
+    def _slot_hash(self, slot: int) -> int:
+        """Read a slot's key hash without synchronization (0 for an empty slot)."""
+        return KEY_HASH.unpack_from(self._map, self._offset(slot) + SEQ.size)[0]
+
+    def _find(self, key: bytes, key_hash: int) -> tuple[int, SlotHeader, bytes] | None:
+        """Locate a live key in its bucket; return its slot, header and data."""
+        for slot in self._bucket_slots(key_hash):
+            # Cheap unsynchronized hash check before the consistent read
+            if self._slot_hash(slot) != key_hash or (read := self._read_slot(slot)) is None:
+                continue
+            header, data = read
+            if header.key_hash != key_hash or data[: header.key_len] != key:
+                continue
+            return None if header.is_expired else (slot, header, data)
+        return None
+
+    def _write_slot(  # noqa: PLR0913
+        self,
+        slot: int,
+        key_hash: int,
+        data: bytes,
+        *,
+        key_len: int,
+        flags: int,
+        expires_at: float,
+    ) -> None:
+        """Write a slot under its bucket lock (seqlock write side); key_hash 0 empties it."""
+        region = self._map
+        offset = self._offset(slot)
+        (seq,) = SEQ.unpack_from(region, offset)
+        # Odd while the slot is inconsistent, so readers retry
+        SEQ.pack_into(region, offset, seq + 1)
+        SLOT_HEADER.pack_into(
+            region,
+            offset,
+            seq + 1,
+            key_hash,
+            expires_at,
+            time(),
+            len(data) - key_len,
+            crc32(data),
+            key_len,
+            flags,
+        )
+        data_offset = offset + SLOT_HEADER.size
+        region[data_offset : data_offset + len(data)] = data
+        SEQ.pack_into(region, offset, seq + 2)
+
+    def _clear_slot(self, slot: int) -> None:
+        """Empty a slot under its bucket lock."""
+        self._write_slot(slot, 0, b"", key_len=0, flags=0, expires_at=0.0)
+
+    def _slot_for_write(self, key: bytes, key_hash: int) -> int:
+        """
+        Pick the slot to write a key to, under its bucket lock.
+
+        The key's own slot is reused, then an empty or expired one; otherwise the
+        entry closest to expiry, or the oldest one, is evicted.
+        """
+        region = self._map
+        free: int | None = None
+        victim, victim_rank = -1, (inf, inf)
+        for slot in self._bucket_slots(key_hash):
+            header = self._header(slot)
+            data_offset = self._offset(slot) + SLOT_HEADER.size
+            if header.key_hash == key_hash and (
+                region[data_offset : data_offset + header.key_len] == key
+            ):
+                return slot
+            if not header.key_hash or header.is_expired:
+                free = slot if free is None else free
+                continue
+            rank = (header.expires_at or inf, header.written_at)
+            if rank < victim_rank:
+                victim, victim_rank = slot, rank
+
+        if free is not None:
+            if self._slot_hash(free):
+                self._report_removed(expired=1)
+            return free
+        self._report_removed(evicted=1)
+        return victim
+
+    def _report_removed(self, expired: int = 0, evicted: int = 0) -> None:
+        self.expired_keys += expired
+        self.evicted_keys += evicted
+        if self._on_evict is not None:
+            self._on_evict(expired + evicted)
+
+    def _get_internal(self, key: str) -> str | bytes | None:
+        """Get a value without taking any lock (internal use only)."""
+        key_bytes = key.encode("utf-8")
+        if (found := self._find(key_bytes, _key_hash(key_bytes))) is None:
+            return None
+        _, header, data = found
+        value = data[header.key_len :]
+        return value.decode("utf-8") if header.flags & TEXT_FLAG else value
+
+    def _set_internal(
+        self,
+        key: str,
+        value: str | bytes,
+        ex: int | None = None,
+        expires_at: float | None = None,
+    ) -> bool:
+        """Store a value under its bucket lock; False when it does not fit in a slot."""
+        key_bytes = key.encode("utf-8")
+        is_text = isinstance(value, str)
+        data = key_bytes + (value.encode("utf-8") if is_text else value)
+        if len(data) > self._capacity:
+            self.oversized_values += 1
+            logger.debug("Value of %s (%d bytes) does not fit a shared slot.", key, len(data))
+            return False
+
+        if expires_at is None:
+            expires_at = time() + ex if ex else 0.0
+        key_hash = _key_hash(key_bytes)
+        with self._locked(key_hash):
+            slot = self._slot_for_write(key_bytes, key_hash)
+            self._write_slot(
+                slot,
+                key_hash,
+                data,
+                key_len=len(key_bytes),
+                flags=TEXT_FLAG if is_text else 0,
+                expires_at=expires_at,
+            )
+        return True
+
+    def _incr_internal(self, key: str) -> int:
+        """Increment an integer value under its bucket lock, keeping its expiry."""
+        key_bytes = key.encode("utf-8")
+        key_hash = _key_hash(key_bytes)
+        with self._locked(key_hash):
+            expires_at = 0.0
+            value = 1
+            if (found := self._find(key_bytes, key_hash)) is not None:
+                _, header, data = found
+                expires_at = header.expires_at
+                value = int(data[header.key_len :]) + 1
+            self._write_slot(
+                self._slot_for_write(key_bytes, key_hash),
+                key_hash,
+                key_bytes + str(value).encode("utf-8"),
+                key_len=len(key_bytes),
+                flags=TEXT_FLAG,
+                expires_at=expires_at,
+            )
+        return value
+
+    def _delete_internal(self, key: str) -> bool:
+        """Delete a key under its bucket lock."""
+        key_bytes = key.encode("utf-8")
+        key_hash = _key_hash(key_bytes)
+        with self._locked(key_hash):
+            if (found := self._find(key_bytes, key_hash)) is None:
+                return False
+            self._clear_slot(found[0])
+        return True
+
+    async def get(self, key: str) -> str | bytes | None:
+        """Get a value from the shared region without taking a lock."""
+        return self._get_internal(key)
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get a value as bytes, encoding text values."""
+        value = self._get_internal(key)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | bytes | None]:
+        """Get many values without taking a lock."""
+        return [self._get_internal(key) for key in keys]
+
+    async def get_many_bytes(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values as bytes without taking a lock."""
+        values = await self.get_many(keys)
+        return [value.encode("utf-8") if isinstance(value, str) else value for value in values]
+
+    async def set(self, key: str, value: str | bytes, ex: int | None = None) -> bool:
+        """Set a value with optional TTL; False if it is too large for a slot."""
+        return self._set_internal(key, value, ex)
+
+    async def set_many(self, items: Mapping[str, tuple[str | bytes, int | None]]) -> bool:
+        """Set many values with per-key TTL; False if any of them was not stored."""
+        results = [self._set_internal(key, value, ex) for key, (value, ex) in items.items()]
+        return all(results)
+
+    async def incr(self, key: str) -> int:
+        """Increment an integer value, starting from 0; the TTL is kept like Redis INCR."""
+        return self._incr_internal(key)
+
+    async def delete(self, *keys: str) -> int:
+        """Delete one or more keys."""
+        return sum(self._delete_internal(key) for key in keys)
+
+    async def exists(self, *keys: str) -> int:
+        """Count the keys that are present and not expired."""
+        count = 0
+        for key in keys:
+            key_bytes = key.encode("utf-8")
+            if self._find(key_bytes, _key_hash(key_bytes)) is not None:
+                count += 1
+        return count
+
+    async def flush_all(self) -> bool:
+        """Empty every slot, for all workers."""
+        with self._locked():
+            for slot in range(self._slots):
+                if self._slot_hash(slot):
+                    self._clear_slot(slot)
+        return True
+
+    async def ping(self) -> bool:
+        """Check if the region is mapped."""
+        return self.is_connected
+
+    async def info(self) -> dict[str, str | int]:
+        """Get information about the shared region, scanning every slot header."""
+        total_keys = used_bytes = 0
+        for slot in range(self._slots):
+            header = self._header(slot)
+            if header.key_hash and not header.is_expired:
+                total_keys += 1
+                used_bytes += header.key_len + header.value_len
+        return {
+            "server": "Shared-Memory Cache",
+            "path": self._path,
+            "used_memory_bytes": used_bytes,
+            "used_memory_human": f"{used_bytes / 1024 / 1024:.2f}MB",
+            "region_bytes": self._size,
+            "total_keys": total_keys,
+            "max_entries": self._slots,
+            "slot_size": self._slot_size,
+            "eviction_policy": "volatile-ttl",
+            "expired_keys": self.expired_keys,
+            "evicted_keys": self.evicted_keys,
+            "oversized_values": self.oversized_values,
+        }
+
+    async def ttl(self, key: str) -> int:
+        """Get the remaining time to live of a key (-2 if missing, -1 without expiry)."""
+        key_bytes = key.encode("utf-8")
+        if (found := self._find(key_bytes, _key_hash(key_bytes))) is None:
+            return -2
+        expires_at = found[1].expires_at
+        return int(expires_at - time()) if expires_at else -1
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        key_bytes = key.encode("utf-8")
+        key_hash = _key_hash(key_bytes)
+        with self._locked(key_hash):
+            if (found := self._find(key_bytes, key_hash)) is None:
+                return False
+            slot, header, data = found
+            self._write_slot(
+                slot,
+                key_hash,
+                data,
+                key_len=header.key_len,
+                flags=header.flags,
+                expires_at=time() + seconds,
+            )
+        return True
+
+    async def scan_iter(
+        self,
+        pattern: str,
+        count: int = 100,
+    ) -> AsyncGenerator[str]:
+        """
+        Yield keys matching a glob pattern, visiting every slot.
+
+        Args:
+            pattern: Glob-style pattern to match keys.
+            count: Batch size hint (ignored, kept for API compatibility).
+
+        Yields:
+            Keys matching the pattern.
+        """
+        keys = []
+        for slot in range(self._slots):
+            if (read := self._read_slot(slot)) is None or read[0].is_expired:
+                continue
+            header, data = read
+            key = data[: header.key_len].decode("utf-8")
+            if fnmatch(key, pattern):
+                keys.append(key)
+
+        for key in keys:
+            yield key
+
+    async def close(self) -> None:
+        """Unmap the region; entries stay in it for the other workers."""
+        self.is_connected = False
+        region, self._region = self._region, None
+        fd, self._fd = self._fd, None
+        if region is not None:
+            region.close()
+        if fd is not None:
+            close(fd)
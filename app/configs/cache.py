@@ -19,6 +19,80 @@ class CacheConfig(BaseSettings):
     key_prefix: str = "cache"
     compression_enabled: bool = True
     compression_threshold: int = 1024  # bytes
-    strategy: Literal["LRU", "FIFO"] = "LRU"
+    # Codec for values above the threshold; zstd/lz4 need their optional packages
+    # and fall back to zlib when missing
+    compression_codec: Literal["none", "zlib", "zstd", "lz4"] = "zlib"
+    # Eviction policy of the in-memory fallback; TinyLFU keeps frequently used keys
+    # when scans over many one-off keys would flush them out of a plain LRU
+    strategy: Literal["LRU", "FIFO", "TinyLFU"] = "LRU"
+    # Snapshot file of the in-memory fallback, written every snapshot interval and
+    # on shutdown, and restored lazily on start so restarts begin warm; empty
+    # disables it. Workers may share the path: each write replaces the file whole
+    memory_snapshot_path: str = ""
+    memory_snapshot_interval: int = 300  # seconds
     enable_statistics: bool = True
     cleanup_interval: int = 300  # 5 minutes
+    # Fraction of each TTL randomly shaved off on set (0.1 = up to 10% shorter)
+    # so that keys written in a burst do not all expire in the same second
+    ttl_jitter: float = 0.0
+    # Lifetime of cached "not found" results, kept short since a create may race
+    # the invalidation; 0 disables negative caching
+    negative_ttl: int = 60  # seconds
+
+    # Circuit breaker on Redis outages: after breaker_failure_threshold connection
+    # errors or timeouts within breaker_failure_window seconds, the cache is served
+    # from memory at once and Redis is pinged every breaker_probe_interval seconds
+    # until it answers; 0 disables tripping
+    breaker_failure_threshold: int = 3
+    breaker_failure_window: float = 30.0  # seconds
+    breaker_probe_interval: float = 5.0  # seconds
+
+    # Cross-worker single-flight for get_or_set: one worker holds a Redis lease
+    # (SET NX PX) and computes the value, the others poll the cache for its result
+    single_flight_distributed: bool = False
+    single_flight_lease_ms: int = 30_000
+    single_flight_wait_timeout: float = 30.0  # seconds before computing locally
+
+    # In-process near cache (L1) in front of Redis, kept coherent via pub/sub
+    near_cache_enabled: bool = False
+    near_cache_max_entries: int = 10_000
+    near_cache_ttl: int = 30  # seconds
+    near_cache_channel: str = "cache:invalidations"
+
+    # Fallback cache in a memory-mapped file shared by every worker on the host,
+    # instead of one MemoryClient per worker; values larger than a slot are not
+    # cached. slots * slot_size must fit in /dev/shm (64 MiB by default in Docker).
+    # The path gets a layout suffix, so changing slots or slot_size uses a new file
+    shared_memory_enabled: bool = False
+    shared_memory_path: str = "/dev/shm/baliblissed-cache"  # noqa: S108
+    shared_memory_slots: int = 8192
+    shared_memory_slot_size: int = 4096  # bytes, including the key
+
+    # Server-assisted client-side caching (Redis 6+): CLIENT TRACKING in broadcast
+    # mode on the key prefix pushes invalidations over a RESP3 connection, keeping
+    # a local mirror of read values coherent; reads go to Redis when unsupported
+    client_tracking_enabled: bool = False
+    client_tracking_max_entries: int = 10_000
+    client_tracking_ttl: int = 60  # seconds a value may stay mirrored
+
+    # Concurrent GET/EXISTS/TTL calls of a worker are queued and sent as one
+    # pipeline, at the end of the event-loop tick or after the window (0 = tick),
+    # trading up to the window in latency for fewer round trips and connections
+    command_batching_enabled: bool = False
+    command_batching_window_us: int = 0  # microseconds
+    command_batching_max_size: int = 128  # distinct commands per pipeline
+
+    # Per-namespace counters, hot keys and largest values for /cache/stats and
+    # Prometheus; only this fraction of reads is sampled into the hot-key top-K
+    telemetry_enabled: bool = True
+    telemetry_top_k: int = 50
+    telemetry_sample_rate: float = 0.1
+
+    # Warm-up of the endpoints registered for it, at startup (before readiness
+    # reports ready) and then every warmup_interval seconds; 0 warms only once
+    warmup_enabled: bool = False
+    warmup_concurrency: int = 4
+    warmup_interval: float = 600.0  # seconds
+    warmup_timeout: float = 30.0  # seconds the first pass may delay readiness
+    warmup_blog_pages: int = 3
+    warmup_top_blogs: int = 20
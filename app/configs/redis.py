@@ -6,7 +6,7 @@ along with connection pool kwargs for Redis client initialization.
 """
 
 from ssl import CERT_NONE, CERT_OPTIONAL, CERT_REQUIRED
-from typing import Any
+from typing import Any, Literal
 from warnings import warn
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,6 +26,22 @@ class RedisConfig(BaseSettings):
     password: str | None = settings.REDIS_PASSWORD
     username: str | None = None  # Redis ACL username (Redis 6+)
     url: str | None = settings.REDIS_URL
+    # Redis Cluster startup nodes ("host:port,host:port"); the client discovers the
+    # other nodes from them. Empty connects to the single node above
+    cluster_nodes: str = ""
+    # Read replicas of the node above ("host:port,host:port"); cache reads go to them
+    # while their replication lag stays within replica_max_lag seconds. Lookups that
+    # fill the near cache (cache.near_cache_enabled) still read the primary.
+    # read_your_writes reads keys the current request wrote from the primary;
+    # bounded_lag accepts up to replica_max_lag of staleness for those too
+    replica_nodes: str = ""
+    replica_consistency: Literal["read_your_writes", "bounded_lag"] = "read_your_writes"
+    replica_max_lag: float = 1.0
+    replica_check_interval: float = 0.25
+    # Also replay idempotency records stored before keys had hash tags. Costs a GET
+    # per idempotent request; enable for one record TTL (24h) after upgrading.
+    # Remove with the fallback in RedisIdempotencyStore once no deployment sets it
+    legacy_idempotency_keys: bool = False
 
     # SSL/TLS Settings
     ssl: bool = False
@@ -55,6 +71,28 @@ class RedisConfig(BaseSettings):
         }
         return mapping.get(self.ssl_cert_reqs.lower(), CERT_REQUIRED)
 
+    @property
+    def cluster_startup_nodes(self) -> list[tuple[str, int]]:
+        """Parse cluster_nodes into (host, port) pairs; a missing port defaults to port."""
+        return self._parse_nodes(self.cluster_nodes)
+
+    @property
+    def replica_addresses(self) -> list[tuple[str, int]]:
+        """Parse replica_nodes into (host, port) pairs; a missing port defaults to port."""
+        return self._parse_nodes(self.replica_nodes)
+
+    def _parse_nodes(self, value: str) -> list[tuple[str, int]]:
+        """Parse a comma-separated list of host[:port] entries."""
+        nodes: list[tuple[str, int]] = []
+        for node in filter(None, (node.strip() for node in value.split(","))):
+            host, _, port = node.rpartition(":")
+            if not host or host.endswith(":"):
+                # No port given (a bare IPv6 address has colons of its own)
+                nodes.append((node.strip("[]"), self.port))
+            else:
+                nodes.append((host.strip("[]"), int(port)))
+        return nodes
+
 
 # Create global Redis config instance
 redis_config = RedisConfig()
@@ -129,3 +167,12 @@ if redis_config.ssl:
         pool_kwargs["ssl_certfile"] = redis_config.ssl_certfile
     if redis_config.ssl_keyfile:
         pool_kwargs["ssl_keyfile"] = redis_config.ssl_keyfile
+
+# Redis Cluster: the settings above minus those that only apply to a single node
+# (cluster mode has database 0 only and no Unix sockets)
+cluster_startup_nodes = redis_config.cluster_startup_nodes
+cluster_kwargs: dict[str, Any] = {
+    key: value
+    for key, value in pool_kwargs.items()
+    if key not in {"host", "port", "db", "path", "connection_class"}
+}
@@ -1,3 +1,5 @@
+from app.data.cache_entry import CacheEntry
 from app.data.statistics import CacheStatistics
+from app.data.telemetry import KeyTelemetry
 
-__all__ = ["CacheStatistics"]
+__all__ = ["CacheEntry", "CacheStatistics", "KeyTelemetry"]
@@ -0,0 +1,89 @@
+"""Envelope for cached values that carry their own freshness metadata."""
+
+from dataclasses import dataclass
+from math import log
+from random import random
+from time import time
+
+# Reserved key marking a stored dict as an envelope rather than a plain value
+ENVELOPE_MARKER = "__cache_entry__"
+ENVELOPE_VERSION = 1
+# Reserved key marking a stored dict as a cached "not found" result
+NEGATIVE_MARKER = "__cache_negative__"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """
+    Cached value with a soft expiry.
+
+    The backend TTL acts as the hard expiry. Between the soft and the hard expiry
+    the value is stale: it can still be served while a refresh runs in the background.
+
+    ``delta`` is the time in seconds the value took to compute. It drives
+    probabilistic early expiration (XFetch): expensive values are refreshed
+    earlier, and each reader decides independently, so keys written together do
+    not all expire together.
+
+    Timestamps are wall-clock epoch seconds so that every worker agrees on them.
+
+    A ``negative`` entry records that the lookup found nothing; its ``value`` is
+    the detail of the not-found error, if any, rather than a cached value.
+    """
+
+    value: object
+    soft_expires_at: float | None = None
+    delta: float | None = None
+    negative: bool = False
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the soft TTL has elapsed."""
+        return self.soft_expires_at is not None and time() >= self.soft_expires_at
+
+    def should_refresh(self, beta: float | None = None) -> bool:
+        """
+        Whether a reader should trigger a refresh of this entry.
+
+        True once the entry is stale. With ``beta`` and a recorded ``delta``, it may
+        also be true shortly before: the check fires when
+        ``now - delta * beta * ln(rand()) >= soft_expires_at``. A larger ``beta``
+        refreshes earlier.
+        """
+        if self.soft_expires_at is None:
+            return False
+        now = time()
+        if beta is not None and self.delta:
+            now -= self.delta * beta * log(1.0 - random())  # noqa: S311
+        return now >= self.soft_expires_at
+
+    def to_payload(self) -> dict[str, object]:
+        """Convert the entry into a JSON-serializable envelope."""
+        return {
+            ENVELOPE_MARKER: ENVELOPE_VERSION,
+            "value": self.value,
+            "soft_expires_at": self.soft_expires_at,
+            "delta": self.delta,
+        }
+
+    @staticmethod
+    def negative_payload(detail: object = None) -> dict[str, object]:
+        """Build the JSON-serializable marker stored for a not-found lookup."""
+        return {NEGATIVE_MARKER: ENVELOPE_VERSION, "detail": detail}
+
+    @classmethod
+    def from_payload(cls, payload: object) -> "CacheEntry":
+        """
+        Build an entry from a deserialized cache payload.
+
+        Plain values written without an envelope are wrapped as always fresh.
+        """
+        if isinstance(payload, dict) and NEGATIVE_MARKER in payload:
+            return cls(value=payload.get("detail"), negative=True)
+        if isinstance(payload, dict) and ENVELOPE_MARKER in payload:
+            return cls(
+                value=payload.get("value"),
+                soft_expires_at=payload.get("soft_expires_at"),
+                delta=payload.get("delta"),
+            )
+        return cls(value=payload)
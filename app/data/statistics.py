@@ -20,6 +20,8 @@ class CacheStatistics:
     deletes: int = 0
     evictions: int = 0
     errors: int = 0
+    coalesced_waits: int = 0
+    negative_hits: int = 0
     total_bytes_written: int = 0
     total_bytes_read: int = 0
     created_at: str = field(default_factory=today_str)
@@ -56,10 +58,27 @@ class CacheStatistics:
             self.deletes += 1
             self.last_updated_at = today_str()
 
-    def record_eviction(self) -> None:
-        """Record cache eviction."""
+    def record_eviction(self, count: int = 1) -> None:
+        """
+        Record cache evictions.
+
+        Args:
+            count: Number of keys evicted or expired.
+        """
+        with self._lock:
+            self.evictions += count
+            self.last_updated_at = today_str()
+
+    def record_coalesced_wait(self) -> None:
+        """Record a miss served by another caller's in-flight computation."""
+        with self._lock:
+            self.coalesced_waits += 1
+            self.last_updated_at = today_str()
+
+    def record_negative_hit(self) -> None:
+        """Record a hit on a cached "not found" result."""
         with self._lock:
-            self.evictions += 1
+            self.negative_hits += 1
             self.last_updated_at = today_str()
 
     def record_error(self) -> None:
@@ -109,6 +128,8 @@ class CacheStatistics:
             self.deletes = 0
             self.evictions = 0
             self.errors = 0
+            self.coalesced_waits = 0
+            self.negative_hits = 0
             self.total_bytes_written = 0
             self.total_bytes_read = 0
             self.created_at = today_str()
@@ -129,6 +150,8 @@ class CacheStatistics:
                 deletes=self.deletes,
                 evictions=self.evictions,
                 errors=self.errors,
+                coalesced_waits=self.coalesced_waits,
+                negative_hits=self.negative_hits,
                 total_bytes_written=self.total_bytes_written,
                 total_bytes_read=self.total_bytes_read,
                 hit_rate=f"{self.hit_rate:.2f}%",
@@ -0,0 +1,229 @@
+"""
+Per-key cache telemetry in constant memory.
+
+``CacheStatistics`` only keeps global counters. ``KeyTelemetry`` adds what is
+needed to size TTLs and the near cache from data: exact hit/miss/byte counters
+per namespace, the most read keys (a Space-Saving top-K over a random sample of
+reads) and the largest values written. Memory is bounded by the configured
+number of tracked keys and namespaces, whatever the key space.
+"""
+
+from dataclasses import dataclass
+from random import random
+from threading import Lock
+
+from app.schemas.cache import (
+    CacheTelemetryData,
+    HotKeyData,
+    LargeKeyData,
+    NamespaceStatisticsData,
+)
+
+# Namespace label of keys stored without one
+DEFAULT_NAMESPACE = "default"
+# Bucket for namespaces beyond the tracked limit
+OTHER_NAMESPACE = "other"
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters: the approximate top-K of a stream in K counters.
+
+    When a new item arrives and every counter is taken, it replaces the item with
+    the smallest count and inherits that count as its error bound. Any item seen
+    more than ``total / capacity`` times is guaranteed to be tracked, and a
+    count overestimates the true one by at most its error.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the counters.
+
+        Args:
+            capacity: Number of items tracked.
+        """
+        self.capacity = max(1, capacity)
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self.total = 0
+
+    def add(self, item: str, weight: int = 1) -> None:
+        """Count ``weight`` occurrences of ``item``."""
+        self.total += weight
+        if item in self._counts:
+            self._counts[item] += weight
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[item] = weight
+            self._errors[item] = 0
+            return
+        victim = min(self._counts, key=self._counts.__getitem__)
+        floor = self._counts.pop(victim)
+        del self._errors[victim]
+        self._counts[item] = floor + weight
+        self._errors[item] = floor
+
+    def top(self, n: int | None = None) -> list[tuple[str, int, int]]:
+        """Return up to ``n`` ``(item, count, error)`` tuples, highest count first."""
+        ranked = sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return [(item, count, self._errors[item]) for item, count in ranked[:n]]
+
+    def clear(self) -> None:
+        """Forget all items."""
+        self._counts.clear()
+        self._errors.clear()
+        self.total = 0
+
+
+class LargestValues:
+    """Track the ``capacity`` keys whose latest written value is the largest."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            capacity: Number of keys tracked.
+        """
+        self.capacity = max(1, capacity)
+        self._sizes: dict[str, int] = {}
+
+    def add(self, key: str, size: int) -> None:
+        """Record the size of a value just written to ``key``."""
+        if key in self._sizes or len(self._sizes) < self.capacity:
+            self._sizes[key] = size
+            return
+        smallest = min(self._sizes, key=self._sizes.__getitem__)
+        if size > self._sizes[smallest]:
+            del self._sizes[smallest]
+            self._sizes[key] = size
+
+    def top(self) -> list[tuple[str, int]]:
+        """Return ``(key, size)`` pairs, largest first."""
+        return sorted(self._sizes.items(), key=lambda kv: kv[1], reverse=True)
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._sizes.clear()
+
+
+@dataclass
+class NamespaceStatistics:
+    """Exact counters of one namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def to_data(self) -> NamespaceStatisticsData:
+        """Convert the counters to their response model."""
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        return NamespaceStatisticsData(
+            hits=self.hits,
+            misses=self.misses,
+            bytes_read=self.bytes_read,
+            bytes_written=self.bytes_written,
+            hit_rate=f"{hit_rate:.2f}%",
+        )
+
+
+class KeyTelemetry:
+    """
+    Hot-key, key-size and per-namespace telemetry of a cache manager.
+
+    Namespace counters are exact. Reads are sampled with probability
+    ``sample_rate`` before entering the top-K, so the hot path usually costs a
+    random draw and a dict increment; reported read counts are scaled back up.
+    Writes always update the largest-values tracker, which is cheap unless a
+    value outgrows the smallest one tracked.
+    """
+
+    def __init__(
+        self,
+        top_k: int = 50,
+        sample_rate: float = 0.1,
+        max_namespaces: int = 64,
+    ) -> None:
+        """
+        Initialize the telemetry.
+
+        Args:
+            top_k: Number of hot keys and of largest keys tracked.
+            sample_rate: Probability that a read is counted in the top-K.
+            max_namespaces: Namespaces counted separately; the rest share a bucket.
+        """
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.max_namespaces = max_namespaces
+        self.hot_keys = SpaceSaving(top_k)
+        self.largest = LargestValues(top_k)
+        self.namespaces: dict[str, NamespaceStatistics] = {}
+        self._lock = Lock()
+
+    def _namespace(self, namespace: str | None) -> NamespaceStatistics:
+        name = namespace or DEFAULT_NAMESPACE
+        if (stats := self.namespaces.get(name)) is None:
+            if len(self.namespaces) >= self.max_namespaces:
+                name = OTHER_NAMESPACE
+            stats = self.namespaces.setdefault(name, NamespaceStatistics())
+        return stats
+
+    def record_hit(self, namespace: str | None, key: str, size: int = 0) -> None:
+        """Record a read of ``key`` that found ``size`` bytes."""
+        with self._lock:
+            stats = self._namespace(namespace)
+            stats.hits += 1
+            stats.bytes_read += size
+            if random() < self.sample_rate:  # noqa: S311
+                self.hot_keys.add(key)
+
+    def record_miss(self, namespace: str | None, key: str) -> None:
+        """Record a read of ``key`` that found nothing; misses count as reads too."""
+        with self._lock:
+            self._namespace(namespace).misses += 1
+            if random() < self.sample_rate:  # noqa: S311
+                self.hot_keys.add(key)
+
+    def record_write(self, namespace: str | None, key: str, size: int) -> None:
+        """Record a write of ``size`` bytes to ``key``."""
+        with self._lock:
+            self._namespace(namespace).bytes_written += size
+            self.largest.add(key, size)
+
+    def hot_key_share(self) -> float:
+        """Return the share of sampled reads that went to the tracked hot keys."""
+        with self._lock:
+            if not self.hot_keys.total:
+                return 0.0
+            tracked = sum(count - error for _, count, error in self.hot_keys.top())
+            return tracked / self.hot_keys.total
+
+    def to_data(self, limit: int | None = None) -> CacheTelemetryData:
+        """
+        Convert the telemetry to its response model.
+
+        Args:
+            limit: Maximum number of hot and largest keys listed.
+        """
+        scale = 1 / self.sample_rate if self.sample_rate else 0.0
+        with self._lock:
+            return CacheTelemetryData(
+                sample_rate=self.sample_rate,
+                hot_keys=[
+                    HotKeyData(key=key, reads=round(count * scale), error=round(error * scale))
+                    for key, count, error in self.hot_keys.top(limit)
+                ],
+                largest_keys=[
+                    LargeKeyData(key=key, size_bytes=size)
+                    for key, size in self.largest.top()[:limit]
+                ],
+                namespaces={name: stats.to_data() for name, stats in self.namespaces.items()},
+            )
+
+    def reset(self) -> None:
+        """Forget all keys and counters."""
+        with self._lock:
+            self.hot_keys.clear()
+            self.largest.clear()
+            self.namespaces.clear()
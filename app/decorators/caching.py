@@ -1,24 +1,32 @@
 # app/decorators/caching.py
 """FastAPI decorators for caching with rate limiting integration."""
 
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, fields, is_dataclass, replace
+from functools import cache, lru_cache, partial, wraps
 from hashlib import sha256
-from inspect import signature
+from inspect import Parameter, signature
+from itertools import chain
 from json import dumps
-from typing import Any
+from time import perf_counter
+from typing import Annotated, Any, get_args, get_origin
 
-from fastapi import Request
+from fastapi import BackgroundTasks, HTTPException, Request, Response
 from fastapi.exceptions import ResponseValidationError
 from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError, to_json
 from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
 
 from app.context import cache_manager_ctx
+from app.db import transaction
 from app.dependencies import get_cache_manager
 from app.errors import BASE_EXCEPTION, CacheKeyError
 from app.logging import get_logger
-from app.managers.cache_manager import CacheManager
+from app.managers.cache_manager import CacheCallback, CacheManager
 from app.monitoring import metrics
+from app.repositories.base import BaseRepository
 
 logger = get_logger(__name__)
 
@@ -28,9 +36,95 @@ exceptions = (
     *BASE_EXCEPTION,
     ValidationError,
     ResponseValidationError,
+    PydanticSerializationError,
     TypeError,
 )
 
+# Invalidation tags of a cached endpoint: fixed, or built from the call arguments
+CacheTags = Sequence[str] | Callable[..., Sequence[str]]
+
+# Finds an argument of a given type among (args, kwargs) of a call, or returns None
+type ArgLocator[T] = Callable[[tuple[Any, ...], dict[str, Any]], T | None]
+
+# Parameters that can be filled by position
+_POSITIONAL_KINDS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+# Request-scoped arguments that differ on every call and never identify a result
+_UNKEYED_TYPES = (Request, Response, BackgroundTasks, AsyncSession, BaseRepository)
+# Arguments whose repr is already a stable key part
+_KEY_SCALARS = (str, int, float, bool, type(None))
+
+# Reserved key marking a cached dict as a pre-rendered response body
+RENDERED_MARKER = "__rendered__"
+JSON_MEDIA_TYPE = "application/json"
+# Headers repeated on a 304, in the case used for responses
+VALIDATOR_HEADERS = ("ETag", "Last-Modified", "Cache-Control")
+
+
+@dataclass(frozen=True)
+class CacheOptions:
+    """Storage options shared by every call of a ``@cached`` endpoint."""
+
+    ttl: int | None = None
+    namespace: str | None = None
+    stale_ttl: int | None = None
+    beta: float | None = None
+    response_model: object | None = None
+    prerender: bool = False
+    cache_control: str | None = None
+    cache_not_found: bool = False
+    negative_ttl: int | None = None
+
+
+def _unwrap_annotation(annotation: object) -> object:
+    """Return the underlying type of an ``Annotated[...]`` dependency annotation."""
+    return get_args(annotation)[0] if get_origin(annotation) is Annotated else annotation
+
+
+def _is_annotated_as(annotation: object, types: type | tuple[type, ...]) -> bool:
+    """Check whether a parameter annotation is (a subclass of) one of ``types``."""
+    annotation = _unwrap_annotation(annotation)
+    return isinstance(annotation, type) and issubclass(annotation, types)
+
+
+def _scan_for[T](
+    arg_type: type[T],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> T | None:
+    """Find an argument of ``arg_type`` among the call arguments."""
+    for value in chain(args, kwargs.values()):
+        if isinstance(value, arg_type):
+            return value
+    return None
+
+
+@cache
+def _arg_locator[T](func: Callable[..., Any], arg_type: type[T]) -> ArgLocator[T]:
+    """
+    Compile the lookup of the ``arg_type`` argument of ``func`` from its signature.
+
+    A parameter annotated with that type is read by name (FastAPI passes endpoint
+    arguments as keywords) or by position; other functions, and calls where that
+    parameter holds something else, fall back to scanning the arguments by type.
+    """
+    params = list(signature(func).parameters.values())
+    position = next(
+        (i for i, param in enumerate(params) if _is_annotated_as(param.annotation, arg_type)),
+        None,
+    )
+    if position is None:
+        return partial(_scan_for, arg_type)
+    name = params[position].name
+    index = position if params[position].kind in _POSITIONAL_KINDS else None
+
+    def locate(args: tuple[Any, ...], kwargs: dict[str, Any]) -> T | None:
+        value = kwargs.get(name)
+        if value is None and index is not None and index < len(args):
+            value = args[index]
+        return value if isinstance(value, arg_type) else _scan_for(arg_type, args, kwargs)
+
+    return locate
+
 
 def get_request_arg(
     func: Callable[..., Any],
@@ -40,8 +134,10 @@ def get_request_arg(
     """
     Extract Request argument from function call by type.
 
-    Searches for an argument of type Request in the bound arguments.
+    Searches for an argument of type Request in the call arguments.
     This allows the parameter to be named anything (request, req, etc.).
+    The parameter is located from the signature once per function, so calls
+    do not bind the signature again.
 
     Parameters
     ----------
@@ -67,22 +163,11 @@ def get_request_arg(
     >>> async def handler(request: Request): ...
     >>> req = get_request_arg(handler, mock_request)
     """
-    try:
-        bound = signature(func).bind(*args, **kwargs)
-        bound.apply_defaults()
-
-        # Search by type instead of hardcoded name
-        for value in bound.arguments.values():
-            if isinstance(value, Request):
-                return value
-
-        # Not found
+    request = _arg_locator(func, Request)(args, kwargs)
+    if request is None:
         details = f"Request argument not found in {func.__name__} function"
         raise AttributeError(details)
-
-    except TypeError as e:
-        details = f"Cannot bind arguments for {func.__name__}: {e}"
-        raise AttributeError(details) from e
+    return request
 
 
 def _get_cache_manager(
@@ -143,9 +228,163 @@ def _infer_response_type_from_callable(func: Callable[..., Any]) -> object | Non
     return func.__annotations__.get("return")
 
 
+@lru_cache(maxsize=256)
+def _cached_type_adapter(type_annotation: object) -> TypeAdapter[Any]:
+    return TypeAdapter(type_annotation)
+
+
+def _type_adapter(type_annotation: object) -> TypeAdapter[Any]:
+    """Return a TypeAdapter for the annotation, built once per hashable annotation."""
+    try:
+        return _cached_type_adapter(type_annotation)
+    except TypeError:
+        # Unhashable annotation (e.g. Annotated with list metadata)
+        return TypeAdapter(type_annotation)
+
+
 def validate_cache(value: object, type_annotation: object) -> object:
-    adapter = TypeAdapter(type_annotation)
-    return adapter.validate_python(value)
+    return _type_adapter(type_annotation).validate_python(value)
+
+
+def _response_type(func: Callable[..., Any], options: CacheOptions) -> object | None:
+    return options.response_model or _infer_response_type_from_callable(func)
+
+
+def _etag(body: bytes) -> str:
+    """Return the strong entity tag of a response body."""
+    return f'"{sha256(body).hexdigest()[:32]}"'
+
+
+def _prerender(
+    result: object,
+    type_annotation: object | None,
+    headers: Mapping[str, str] | None = None,
+) -> dict[str, object]:
+    """
+    Render an endpoint result into the response body FastAPI would send.
+
+    Models are dumped by alias, as FastAPI does for ``response_model``, so a hit
+    can return the stored body without validating or serializing it again. The
+    body's ETag and the ``Last-Modified`` header the endpoint set on its response
+    are stored with it, since the endpoint does not run on hits.
+    """
+    if isinstance(result, Response):
+        body = bytes(result.body)
+        media_type = result.media_type or JSON_MEDIA_TYPE
+        status_code = result.status_code
+        headers = result.headers
+    else:
+        body = (
+            _type_adapter(type_annotation).dump_json(result, by_alias=True)
+            if type_annotation is not None
+            else to_json(result, by_alias=True)
+        )
+        media_type = JSON_MEDIA_TYPE
+        status_code = HTTP_200_OK
+    headers = headers or {}
+    return {
+        RENDERED_MARKER: 1,
+        "body": body.decode("utf-8"),
+        "media_type": media_type,
+        "status_code": status_code,
+        "etag": headers.get("etag") or _etag(body),
+        "last_modified": headers.get("last-modified"),
+    }
+
+
+def _to_payload(
+    func: Callable,
+    options: CacheOptions,
+    result: object,
+    response: Response | None = None,
+) -> object:
+    """Convert an endpoint result into the value stored in the cache."""
+    if options.prerender:
+        headers = response.headers if response is not None else None
+        return _prerender(result, _response_type(func, options), headers)
+    return _to_json_safe(result)
+
+
+def _not_modified(request: Request | None, etag: object) -> bool:
+    """Check an ETag against the request's ``If-None-Match`` (weak comparison)."""
+    if request is None or not etag:
+        return False
+    header = request.headers.get("if-none-match")
+    if not isinstance(header, str):
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def _validator_headers(headers: Mapping[str, str | None]) -> dict[str, str]:
+    """Pick the headers a 304 must repeat from a full response's headers."""
+    return {name: value for name in VALIDATOR_HEADERS if (value := headers.get(name))}
+
+
+def _rendered_response(
+    rendered: Mapping[str, Any],
+    options: CacheOptions,
+    request: Request | None = None,
+) -> Response:
+    """
+    Build the response for a pre-rendered entry.
+
+    The ETag is compared first, so a conditional request that matches gets an
+    empty 304 without the stored body being touched.
+    """
+    headers = _validator_headers(
+        {
+            "ETag": rendered.get("etag"),
+            "Last-Modified": rendered.get("last_modified"),
+            "Cache-Control": options.cache_control,
+        },
+    )
+    if rendered["status_code"] == HTTP_200_OK and _not_modified(request, rendered.get("etag")):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=rendered["body"],
+        status_code=rendered["status_code"],
+        media_type=rendered["media_type"],
+        headers=headers,
+    )
+
+
+def _revalidated(result: object, request: Request | None) -> object:
+    """Answer a conditional request with 304 if a freshly rendered result matches it."""
+    if (
+        isinstance(result, Response)
+        and result.status_code == HTTP_200_OK
+        and _not_modified(request, result.headers.get("etag"))
+    ):
+        return Response(
+            status_code=HTTP_304_NOT_MODIFIED,
+            headers=_validator_headers(result.headers),
+        )
+    return result
+
+
+def _from_cache(
+    func: Callable,
+    options: CacheOptions,
+    value: object,
+    request: Request | None = None,
+) -> object:
+    """
+    Turn a cached or shared value back into an endpoint result.
+
+    Pre-rendered bodies become a new ``Response`` per request, since middleware
+    may add headers to it, or an empty 304 if ``request`` already has the current
+    version; other values are validated against the response type.
+    """
+    if isinstance(value, dict) and RENDERED_MARKER in value:
+        return _rendered_response(value, options, request)
+    if isinstance(value, Response):
+        # A coalesced leader's pre-rendered response
+        return _rendered_response(_prerender(value, None), options, request)
+    if type_annotation := _response_type(func, options):
+        return validate_cache(value, type_annotation)
+    return value
 
 
 def _to_json_safe(value: object) -> object:
@@ -162,11 +401,67 @@ def _to_json_safe(value: object) -> object:
     return value
 
 
-def cached(
+def _rebind_repository(value: object, session: AsyncSession) -> object:
+    """Return value with any repository (direct or dataclass field) bound to session."""
+    if isinstance(value, BaseRepository):
+        return type(value)(session)
+    if is_dataclass(value) and not isinstance(value, type):
+        changes = {
+            f.name: type(attr)(session)
+            for f in fields(value)
+            if isinstance(attr := getattr(value, f.name), BaseRepository)
+        }
+        return replace(value, **changes) if changes else value
+    return value
+
+
+def _refresh_callback(
+    func: Callable,
+    options: CacheOptions,
+    *args: list[Any],
+    **kwargs: dict[str, Any],
+) -> CacheCallback:
+    """
+    Build a callback that recomputes an endpoint result outside its request.
+
+    The request-scoped database session is closed once the response is sent, so
+    repositories among the arguments are rebound to a fresh session.
+    """
+
+    async def refresh() -> object:
+        async with transaction() as session:
+            rebound_args = [_rebind_repository(arg, session) for arg in args]
+            rebound_kwargs = {k: _rebind_repository(v, session) for k, v in kwargs.items()}
+            result = await func(*rebound_args, **rebound_kwargs)
+            return _to_payload(func, options, result, _arg_locator(func, Response)(args, kwargs))
+
+    return refresh
+
+
+def _resolve_tags(
+    tags: CacheTags | None,
+    *args: list[Any],
+    **kwargs: dict[str, Any],
+) -> Sequence[str]:
+    """Return the tags for a call, invoking tags with the call arguments if it is callable."""
+    if tags is None:
+        return ()
+    return tags(*args, **kwargs) if callable(tags) else tags
+
+
+def cached(  # noqa: PLR0913
     ttl: int | None = None,
     namespace: str | None = None,
     key_builder: Callable[..., str] | None = None,
     response_model: object | None = None,
+    *,
+    stale_ttl: int | None = None,
+    beta: float | None = None,
+    tags: CacheTags | None = None,
+    prerender: bool = False,
+    cache_control: str | None = None,
+    cache_not_found: bool = False,
+    negative_ttl: int | None = None,
 ) -> Callable:
     """
     FastAPI endpoint result caching decorator.
@@ -174,9 +469,37 @@ def cached(
     Args:
         ttl: Time to live in seconds.
         namespace: Cache namespace.
-        key_builder: Custom function to build cache key from args/kwargs.
+        key_builder: Custom function to build cache key from args/kwargs. Defaults to
+                     a hash of the function name and its arguments, leaving out
+                     request-scoped ones such as the Request or repositories.
         response_model: Pydantic model or type to validate cached data against.
                         If None, returns the raw cached value (usually a dict).
+        stale_ttl: Extra seconds after ttl during which the stale value is still
+                   served while a single background task recomputes it.
+        beta: Enable probabilistic early expiration. The time taken by the endpoint
+              is stored with the result, and hits start the background refresh
+              early with a probability that grows near expiry and with that cost.
+              1.0 is the usual choice; larger values refresh earlier.
+        tags: Invalidation tags, or a function building them from args/kwargs.
+              The key is stamped with each tag's generation, so
+              ``CacheManager.invalidate_tags`` drops every entry at once.
+        prerender: Store the rendered JSON body instead of the result, and return it
+                   as a ``Response`` on hits without validating or serializing it
+                   again. The body is rendered with ``response_model`` (or the
+                   return annotation) by alias, as FastAPI does. A strong ETag of
+                   the body and the endpoint's ``Last-Modified`` header are stored
+                   with it, and requests whose ``If-None-Match`` matches get an
+                   empty 304 without the body being decoded.
+        cache_control: ``Cache-Control`` header of the pre-rendered responses.
+        cache_not_found: Also cache a 404 raised by the endpoint, and raise it again
+                         with the same detail on hits without running the endpoint.
+                         Whatever creates the resource must bust the key or its tags.
+        negative_ttl: Seconds a 404 stays cached; defaults to
+                      ``CacheConfig.negative_ttl``.
+
+    The decorated function also gets a ``warm(cache_manager, *args, **kwargs)``
+    coroutine that stores the entry for a call without a request, as the cache
+    warmer does; repositories among the arguments are bound to a fresh session.
 
     Returns:
         Decorated function.
@@ -188,80 +511,250 @@ def cached(
             return Item(id=item_id, name="Item")
     """
 
+    options = CacheOptions(
+        ttl=ttl,
+        namespace=namespace,
+        stale_ttl=stale_ttl,
+        beta=beta,
+        response_model=response_model,
+        prerender=prerender,
+        cache_control=cache_control,
+        cache_not_found=cache_not_found,
+        negative_ttl=negative_ttl,
+    )
+
+    if cache_control and not prerender:
+        mssg = "cache_control requires prerender=True"
+        raise ValueError(mssg)
+
     def decorator(func: Callable) -> Callable:
+        # Inspect the signature once here rather than on every call
+        locate_request = _arg_locator(func, Request)
+        _arg_locator(func, Response)
+        build_key = key_builder or _compile_key_builder(func)
+
         @wraps(func)
         async def wrapper(*args: list[Any], **kwargs: dict[str, Any]) -> object:
             cache_manager = _get_cache_manager(func, *args, **kwargs)
+            cache_key = build_key(*args, **kwargs)
+            request = locate_request(args, kwargs) if options.prerender else None
+
+            # Stamp tag generations; without them nothing can be safely cached
+            if tags is not None:
+                try:
+                    cache_key = await cache_manager.tagged_key(
+                        cache_key,
+                        _resolve_tags(tags, *args, **kwargs),
+                    )
+                except exceptions as e:
+                    logger.warning(f"Cache tag lookup failed: {e}")
+                    return await func(*args, **kwargs)
 
-            # Build cache key
-            if key_builder:
-                cache_key = key_builder(*args, **kwargs)
-            else:
-                # Auto-generate key from function name and arguments
-                cache_key = _generate_cache_key(func.__name__, *args, **kwargs)
             # Try to get from cache
+            skip = bool(kwargs.get("refresh", False))
             try:
-                skip = bool(kwargs.get("refresh", False))
-                if not skip and (cached_value := await cache_manager.get(cache_key, namespace)):
+                if not skip and (
+                    cached_value := await _get_cached_value(
+                        func,
+                        cache_manager,
+                        cache_key,
+                        options,
+                        *args,
+                        **kwargs,
+                    )
+                ):
                     metrics.record_cache_hit()
                     logger.debug(f"Cache hit for key: {cache_key}")
-
-                    type_annotation = response_model or _infer_response_type_from_callable(func)
-                    if type_annotation:
-                        return validate_cache(cached_value, type_annotation)
-
-                    return cached_value
+                    return _from_cache(func, options, cached_value, request)
             except exceptions as e:
                 logger.warning(f"Cache retrieval failed: {e}")
 
             # Cache miss - record metric before fetching new value
             metrics.record_cache_miss()
-            return await cache_new_value(
+            compute_new_value = cache_new_value if skip else _coalesced_new_value
+            result = await compute_new_value(
                 func,
                 cache_manager,
                 cache_key,
-                ttl,
-                namespace,
+                options,
                 *args,
                 **kwargs,
             )
-
+            return _revalidated(result, request)
+
+        async def warm(
+            cache_manager: CacheManager,
+            *args: list[Any],
+            **kwargs: dict[str, Any],
+        ) -> None:
+            """Recompute and store the entry for a call, outside any request."""
+            async with transaction() as session:
+                rebound_args = [_rebind_repository(arg, session) for arg in args]
+                rebound_kwargs = {k: _rebind_repository(v, session) for k, v in kwargs.items()}
+                cache_key = build_key(*rebound_args, **rebound_kwargs)
+                if tags is not None:
+                    cache_key = await cache_manager.tagged_key(
+                        cache_key,
+                        _resolve_tags(tags, *rebound_args, **rebound_kwargs),
+                    )
+                await cache_new_value(
+                    func,
+                    cache_manager,
+                    cache_key,
+                    options,
+                    *rebound_args,
+                    **rebound_kwargs,
+                )
+
+        # Copied onto outer decorators by functools.wraps, so routes expose it too
+        wrapper.warm = warm  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
 
 
+async def _get_cached_value(
+    func: Callable,
+    cache_manager: CacheManager,
+    cache_key: str,
+    options: CacheOptions,
+    *args: list[Any],
+    **kwargs: dict[str, Any],
+) -> object | None:
+    """
+    Read a cached value, scheduling a background refresh when it is due.
+
+    Raises:
+        HTTPException: 404 replayed from a cached "not found" result.
+    """
+    if options.stale_ttl is None and options.beta is None and not options.cache_not_found:
+        return await cache_manager.get(cache_key, options.namespace)
+
+    entry = await cache_manager.get_entry(cache_key, options.namespace)
+    if entry is None:
+        return None
+    if entry.negative:
+        if not options.cache_not_found:
+            return None
+        metrics.record_cache_hit()
+        logger.debug(f"Negative cache hit for key: {cache_key}")
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=entry.value)
+    if entry.value and entry.should_refresh(options.beta):
+        cache_manager.refresh_in_background(
+            cache_key,
+            _refresh_callback(func, options, *args, **kwargs),
+            options.ttl,
+            options.namespace,
+            stale_ttl=options.stale_ttl,
+            beta=options.beta,
+        )
+    return entry.value
+
+
 async def cache_new_value(
     func: Callable,
     cache_manager: CacheManager,
     cache_key: str,
-    ttl: int | None = None,
-    namespace: str | None = None,
+    options: CacheOptions,
     *args: list[Any],
     **kwargs: dict[str, Any],
 ) -> object:
-    result = await func(*args, **kwargs)
+    started = perf_counter()
+    try:
+        result = await func(*args, **kwargs)
+    except HTTPException as e:
+        if options.cache_not_found and e.status_code == HTTP_404_NOT_FOUND:
+            await _cache_not_found(cache_manager, cache_key, options, e.detail)
+        raise
+    delta = perf_counter() - started if options.beta is not None else None
     # logger.debug(f"{result=}, {type(result)=}")
 
     try:
-        payload = _to_json_safe(result)
+        payload = _to_payload(func, options, result, _arg_locator(func, Response)(args, kwargs))
         if await cache_manager.set(
             cache_key,
             payload,
-            ttl=ttl,
-            namespace=namespace,
+            ttl=options.ttl,
+            namespace=options.namespace,
+            stale_ttl=options.stale_ttl,
+            delta=delta,
         ):
             logger.debug(f"Cached result for key: {cache_key}")
     except exceptions as e:
         logger.warning(f"{e}")
+        return result
 
-    return result
+    return _from_cache(func, options, payload) if options.prerender else result
+
+
+async def _cache_not_found(
+    cache_manager: CacheManager,
+    cache_key: str,
+    options: CacheOptions,
+    detail: object,
+) -> None:
+    """Store a 404 raised by the endpoint; cache failures never replace the 404."""
+    try:
+        if await cache_manager.set_negative(
+            cache_key,
+            options.namespace,
+            ttl=options.negative_ttl,
+            detail=detail,
+        ):
+            logger.debug(f"Cached not found for key: {cache_key}")
+    except exceptions as e:
+        logger.warning(f"{e}")
+
+
+async def _coalesced_new_value(
+    func: Callable,
+    cache_manager: CacheManager,
+    cache_key: str,
+    options: CacheOptions,
+    *args: list[Any],
+    **kwargs: dict[str, Any],
+) -> object:
+    """
+    Compute a missed value once for every concurrent caller of the key.
+
+    The caller that runs the endpoint returns its own result. Callers that waited
+    for it, in this worker or in another one through the distributed lease, get a
+    copy validated like a cache hit, so requests never share a mutable object.
+    """
+    is_leader = False
+
+    async def compute() -> object:
+        nonlocal is_leader
+        is_leader = True
+        return await cache_new_value(func, cache_manager, cache_key, options, *args, **kwargs)
+
+    started = perf_counter()
+    try:
+        value = await cache_manager.coalesce(cache_key, compute, options.namespace)
+    except exceptions as e:
+        if is_leader:
+            raise
+        # Coalescing itself failed, or the leader hit a cache-layer error
+        logger.warning(f"Cache coalescing failed: {e}")
+        return await cache_new_value(func, cache_manager, cache_key, options, *args, **kwargs)
+    if is_leader:
+        return value
+
+    metrics.record_cache_coalesced_wait(perf_counter() - started)
+    logger.debug(f"Coalesced miss for key: {cache_key}")
+    try:
+        return _from_cache(func, options, _to_json_safe(value))
+    except exceptions as e:
+        logger.warning(f"Coalesced value validation failed: {e}")
+        return await func(*args, **kwargs)
 
 
 def cache_busting(
     keys: list[str] | None = None,
     namespace: str | None = None,
     key_builder: Callable[..., list[str]] | None = None,
+    *,
+    tags: CacheTags | None = None,
 ) -> Callable:
     """
     Busting on mutations (POST, PUT, DELETE) cache decorator.
@@ -270,12 +763,16 @@ def cache_busting(
         keys: List of cache keys to bust.
         namespace: Cache namespace.
         key_builder: Custom function to build keys to bust from args/kwargs.
+        tags: Tags to invalidate, or a function building them from args/kwargs.
 
     Returns:
         Decorated function.
     """
 
     def decorator(func: Callable) -> Callable:
+        # Inspect the signature once here rather than on every call
+        _arg_locator(func, Request)
+
         @wraps(func)
         async def wrapper(*args: list[Any], **kwargs: dict[str, Any]) -> object:
             cache_manager = _get_cache_manager(func, *args, **kwargs)
@@ -295,6 +792,14 @@ def cache_busting(
                 except exceptions as e:
                     logger.warning(f"Cache busting failed: {e}")
 
+            # Invalidate tags
+            if tags_to_bust := _resolve_tags(tags, *args, **kwargs):
+                try:
+                    await cache_manager.invalidate_tags(*tags_to_bust)
+                    logger.debug(f"Cache tags invalidated: {tags_to_bust}")
+                except exceptions as e:
+                    logger.warning(f"Cache tag invalidation failed: {e}")
+
             return result
 
         return wrapper
@@ -302,41 +807,70 @@ def cache_busting(
     return decorator
 
 
-def _generate_cache_key(func_name: str, *args: list[Any], **kwargs: dict[str, Any]) -> str:
+def _key_part(value: object) -> str | None:
     """
-    Generate cache key from function name and arguments.
+    Render one argument for a generated cache key.
+
+    Returns:
+        The rendered argument, or None if it is request-scoped or not serializable.
+    """
+    if isinstance(value, _KEY_SCALARS):
+        return repr(value)
+    if isinstance(value, _UNKEYED_TYPES):
+        return None
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    try:
+        return dumps(value, default=str, sort_keys=True)
+    except (TypeError, ValueError):
+        logger.warning(f"Argument {value} is not serializable, skipping for cache key.")
+        return None
+
+
+def _compile_key_builder(func: Callable[..., Any]) -> Callable[..., str]:
+    """
+    Build the default cache key function of ``func`` once, at decoration time.
+
+    Arguments are matched to parameter names from the signature, so positional and
+    keyword calls give the same key, and parameters annotated with request-scoped
+    types (request, response, session, repositories) are left out up front.
 
     Args:
-        func_name: Name of the function.
-        *args: Function arguments.
-        **kwargs: Function keyword arguments.
+        func: The decorated function.
 
     Returns:
-        Generated cache key.
+        Function building the cache key from the call's args/kwargs.
     """
-    key_parts = [func_name]
-
-    # Process args
-    for arg in args:
-        try:
-            key_parts.append(dumps(arg, default=str, sort_keys=True))
-        except (TypeError, ValueError):
-            logger.warning(f"Argument {arg} is not serializable, skipping for cache key.")
-
-    # Process kwargs
-    if kwargs:
-        try:
-            key_parts.append(dumps(kwargs, default=str, sort_keys=True))
-        except (TypeError, ValueError):
-            # Fallback for kwargs if full dict fails
-            safe_kwargs = {}
-            for k, v in kwargs.items():
-                try:
-                    dumps(v, default=str, sort_keys=True)
-                    safe_kwargs[k] = v
-                except (TypeError, ValueError):
-                    logger.warning(f"Keyword argument {k}={v} is not serializable, skipping.")
-            key_parts.append(dumps(safe_kwargs, default=str, sort_keys=True))
-
-    key_string = ":".join(key_parts)
-    return sha256(key_string.encode()).hexdigest()[:16]
+    params = signature(func).parameters.values()
+    positional = tuple(param.name for param in params if param.kind in _POSITIONAL_KINDS)
+    named = frozenset(
+        param.name
+        for param in params
+        if param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    )
+    keyed = tuple(
+        param.name
+        for param in params
+        if param.name in named and not _is_annotated_as(param.annotation, _UNKEYED_TYPES)
+    )
+    func_name = func.__name__
+
+    def build_key(*args: list[Any], **kwargs: dict[str, Any]) -> str:
+        values = dict(zip(positional, args, strict=False))
+        values.update(kwargs)
+        key_parts = [func_name]
+        for name in keyed:
+            if name in values and (part := _key_part(values[name])) is not None:
+                key_parts.append(f"{name}={part}")
+        # Extra *args / **kwargs the signature does not name
+        key_parts.extend(
+            part for arg in args[len(positional) :] if (part := _key_part(arg)) is not None
+        )
+        key_parts.extend(
+            f"{name}={part}"
+            for name in sorted(kwargs.keys() - named)
+            if (part := _key_part(kwargs[name])) is not None
+        )
+        return sha256(":".join(key_parts).encode()).hexdigest()[:16]
+
+    return build_key
@@ -1,6 +1,6 @@
 """Protocol definitions for cache client implementations."""
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Mapping, Sequence
 from logging import DEBUG
 from typing import Any, Protocol, runtime_checkable
 
@@ -11,20 +11,40 @@ class CacheClientProtocol(Protocol):
     Protocol for cache client implementations.
 
     This protocol defines the interface that all cache clients must implement.
-    Both RedisClient and MemoryClient conform to this protocol.
+    RedisClient, MemoryClient and SharedMemoryClient conform to this protocol.
 
     Note: All methods return Awaitable to be compatible with both sync-wrapped
     and native async implementations.
     """
 
-    def get(self, key: str) -> Awaitable[str | None]:
+    def get(self, key: str) -> Awaitable[str | bytes | None]:
         """Get a value from the cache."""
         ...
 
-    def set(self, key: str, value: str, ex: int | None = None) -> Awaitable[bool]:
+    def get_bytes(self, key: str) -> Awaitable[bytes | None]:
+        """Get a value from the cache as raw bytes."""
+        ...
+
+    def set(self, key: str, value: str | bytes, ex: int | None = None) -> Awaitable[bool]:
         """Set a value in the cache with optional TTL."""
         ...
 
+    def get_many(self, keys: Sequence[str]) -> Awaitable[list[str | bytes | None]]:
+        """Get many values at once, in the order of keys (None for missing keys)."""
+        ...
+
+    def get_many_bytes(self, keys: Sequence[str]) -> Awaitable[list[bytes | None]]:
+        """Get many values at once as raw bytes, in the order of keys."""
+        ...
+
+    def set_many(self, items: Mapping[str, tuple[str | bytes, int | None]]) -> Awaitable[bool]:
+        """Set many values at once; items maps each key to its value and optional TTL."""
+        ...
+
+    def incr(self, key: str) -> Awaitable[int]:
+        """Atomically increment an integer value, creating it at 0 if missing."""
+        ...
+
     def delete(self, *keys: str) -> Awaitable[int]:
         """Delete one or more keys from the cache."""
         ...
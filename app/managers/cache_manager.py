@@ -1,33 +1,67 @@
 # app/managers/cache_manager.py
 """Main cache manager for Redis caching operations with circuit breaker support."""
 
+from asyncio import (
+    CancelledError,
+    Future,
+    Task,
+    create_task,
+    current_task,
+    get_running_loop,
+    shield,
+)
 from asyncio import Lock as AsyncLock
+from asyncio import sleep as asyncio_sleep
 from collections import OrderedDict
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from contextlib import suppress
+from hashlib import sha256
 from logging import DEBUG
+from random import random
 from threading import Lock as ThreadLock
+from time import monotonic, perf_counter, time
 from typing import Any
+from uuid import uuid4
 
 from pydantic_core import ValidationError
 from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
 from starlette import status
 
+from app.clients.client_tracking import ClientTracking
+from app.clients.command_batcher import CommandBatcher
 from app.clients.memory_client import MemoryClient
-from app.clients.redis_client import RedisClient
+from app.clients.near_cache import NearCache
+from app.clients.redis_client import RedisClient, ReplicaReader
+from app.clients.replica_router import ReplicaRouter
+from app.clients.shared_memory_client import SharedMemoryClient
 from app.configs.cache import CacheConfig
+from app.configs.redis import redis_config
 from app.configs.settings import settings
-from app.data import CacheStatistics
-from app.errors import BASE_EXCEPTION, CacheDeserializationError, CacheKeyError
+from app.data import CacheEntry, CacheStatistics, KeyTelemetry
+from app.decorators.with_retry import RETRIABLE_EXCEPTIONS
+from app.errors import (
+    BASE_EXCEPTION,
+    CacheCompressionError,
+    CacheDecompressionError,
+    CacheDeserializationError,
+    CacheKeyError,
+)
 from app.interfaces import CacheClientProtocol
 from app.logging import get_logger
+from app.managers.circuit_breaker import CircuitState
+from app.monitoring.prometheus import metrics
 from app.schemas import CacheToggleResponse
-from app.schemas.cache import CacheStatisticsData
+from app.schemas.cache import CacheStatisticsData, CacheTelemetryData
 from app.utils.cache_serializer import (
-    compress,
-    decompress,
+    NO_CODEC,
+    Codec,
+    decode_frame,
     deserialize,
-    do_compress,
+    encode_frame,
+    get_codec,
     serialize,
+    serialize_bytes,
 )
 
 logger = get_logger(__name__)
@@ -41,32 +75,164 @@ class CacheManager:
     Main cache manager for Redis operations with advanced features.
 
     Features:
-        - Request coalescing (Thundering Herd protection)
-        - Automatic fallback to in-memory cache
-        - Circuit breaker for Redis failures
+        - Request coalescing (Thundering Herd protection): concurrent misses
+          share one in-flight result, optionally across workers via a Redis lease
+        - Stale-while-revalidate with soft/hard TTL envelopes
+        - Negative caching: "not found" results kept for a short TTL
+        - Probabilistic early expiration (XFetch) and TTL jitter
+        - Automatic fallback to in-memory cache, optionally shared by the
+          workers of a host through a memory-mapped region
+        - Circuit breaker for Redis outages: serves from memory at once and
+          switches back when a background probe reaches Redis again
         - LRU-based lock eviction to prevent memory leaks
-        - Compression for large values
-        - Statistics tracking
+        - Binary framed values with pluggable compression codecs
+        - Tag invalidation through generation counters stamped into keys
+        - Statistics tracking, with sampled hot-key and per-namespace telemetry
+        - Optional in-process near cache (L1) kept coherent via Redis pub/sub
+        - Optional Redis client tracking, mirroring read values until the server
+          pushes their invalidation
     """
 
     # Maximum number of locks to keep in memory (LRU eviction)
     MAX_LOCKS: int = 10_000
+    # Delay before re-subscribing to the invalidation channel after a failure
+    INVALIDATION_RETRY_DELAY: float = 1.0
+    # Backoff bounds while waiting for another worker's single-flight lease
+    LEASE_POLL_MIN_DELAY: float = 0.025
+    LEASE_POLL_MAX_DELAY: float = 0.5
+    # Keys longer than this are stored under a digest so Redis key memory stays bounded
+    MAX_KEY_LENGTH: int = 200
+    # Leading characters of a long key kept in front of its digest, for debugging
+    HASHED_KEY_HEAD: int = 64
+    # Namespace holding the generation counter of each invalidation tag
+    TAG_NAMESPACE: str = "tags"
+    # Name of the Redis circuit breaker in logs and metrics
+    BREAKER_NAME: str = "redis_cache"
 
     def __init__(self) -> None:
         """Initialize cache manager."""
-        self.redis_client = RedisClient()
-        self.memory_client = MemoryClient()
+        self.statistics = CacheStatistics()
+        self.cache_config = CacheConfig()
+        self.redis_client = RedisClient(
+            tracking=ClientTracking(
+                prefix=f"{self.cache_config.key_prefix}:",
+                max_entries=self.cache_config.client_tracking_max_entries,
+                ttl=self.cache_config.client_tracking_ttl,
+            )
+            if self.cache_config.client_tracking_enabled
+            else None,
+            batcher=CommandBatcher(
+                window=self.cache_config.command_batching_window_us / 1_000_000,
+                max_batch=self.cache_config.command_batching_max_size,
+            )
+            if self.cache_config.command_batching_enabled
+            else None,
+            replicas=ReplicaRouter(
+                nodes=redis_config.replica_addresses,
+                consistency=redis_config.replica_consistency,
+                max_lag=redis_config.replica_max_lag,
+                check_interval=redis_config.replica_check_interval,
+            )
+            if redis_config.replica_nodes
+            else None,
+        )
+        self.memory_client: MemoryClient | SharedMemoryClient = (
+            SharedMemoryClient(
+                path=self.cache_config.shared_memory_path,
+                slots=self.cache_config.shared_memory_slots,
+                slot_size=self.cache_config.shared_memory_slot_size,
+                on_evict=self.statistics.record_eviction,
+            )
+            if self.cache_config.shared_memory_enabled
+            else self._worker_memory_client()
+        )
         self._client: CacheClientProtocol = self.redis_client
+        # Cache lookups may use read replicas; other Redis reads stay on the primary
+        self._replica_reader = ReplicaReader(self.redis_client)
         self.is_redis_available = False
-        self.cache_config = CacheConfig()
-        self.statistics = CacheStatistics()
+        self._codec = self._resolve_codec()
+
+        # Circuit breaker: recent Redis outage errors and the task probing Redis
+        self.breaker_state = CircuitState.CLOSED
+        self.breaker_trips: int = 0
+        self._redis_failures: int = 0
+        self._last_redis_failure: float = 0.0
+        self._probe_task: Task[None] | None = None
+        metrics.set_circuit_breaker_state(self.BREAKER_NAME, 0)
+
+        # Hot keys, largest values and per-namespace counters, also scraped by Prometheus
+        self.telemetry: KeyTelemetry | None = None
+        if self.cache_config.telemetry_enabled:
+            self.telemetry = KeyTelemetry(
+                top_k=self.cache_config.telemetry_top_k,
+                sample_rate=self.cache_config.telemetry_sample_rate,
+            )
+            metrics.track_cache_telemetry(self.telemetry)
 
-        # Locks for request coalescing (Thundering Herd protection)
+        # Per-key locks serializing background refreshes
         # Using OrderedDict for LRU eviction
         self._locks: OrderedDict[str, AsyncLock] = OrderedDict()
         # Thread lock to protect the locks dictionary
         self._locks_lock = ThreadLock()
 
+        # Near cache (L1) in front of Redis, only used while Redis is the backend
+        self._instance_id = uuid4().hex
+        self.near_cache: NearCache | None = (
+            NearCache(
+                max_entries=self.cache_config.near_cache_max_entries,
+                ttl=self.cache_config.near_cache_ttl,
+            )
+            if self.cache_config.near_cache_enabled
+            else None
+        )
+        self._near_cache_ready = False
+        self._invalidation_task: Task[None] | None = None
+
+        # Background refreshes for stale entries, one per key
+        self._refresh_tasks: dict[str, Task[None]] = {}
+        # In-flight computations shared by concurrent misses, one per key
+        self._flights: dict[str, Future[object]] = {}
+
+    def _worker_memory_client(self) -> MemoryClient:
+        """Create the per-worker in-memory fallback cache."""
+        return MemoryClient(
+            on_evict=self.statistics.record_eviction,
+            strategy=self.cache_config.strategy,
+            snapshot_path=self.cache_config.memory_snapshot_path or None,
+            snapshot_interval=self.cache_config.memory_snapshot_interval,
+        )
+
+    async def _start_memory_client(self) -> None:
+        """
+        Start the in-memory fallback cache.
+
+        A shared memory region that cannot be mapped, e.g. a file of another
+        layout at its path, is replaced by a per-worker MemoryClient.
+        """
+        try:
+            await self.memory_client.start_lifecycle()
+        except OSError as e:
+            if not isinstance(self.memory_client, SharedMemoryClient):
+                raise
+            logger.warning("Shared memory cache unavailable: %s. Using a per-worker cache.", e)
+            shared, self.memory_client = self.memory_client, self._worker_memory_client()
+            if self._client is shared:
+                self._client = self.memory_client
+            await self.memory_client.start_lifecycle()
+
+    def _resolve_codec(self) -> Codec:
+        """Pick the configured compression codec, falling back to zlib."""
+        if not self.cache_config.compression_enabled:
+            return NO_CODEC
+        try:
+            return get_codec(self.cache_config.compression_codec)
+        except CacheCompressionError:
+            logger.warning(
+                "Cache codec %s is not installed; using zlib.",
+                self.cache_config.compression_codec,
+            )
+            return get_codec("zlib")
+
     async def initialize(self) -> None:
         """
         Initialize cache manager by connecting to Redis.
@@ -78,96 +244,412 @@ class CacheManager:
                 await self.redis_client.connect()
                 self._client = self.redis_client
                 self.is_redis_available = True
+                self._start_invalidation_listener()
                 return
             logger.info("Redis disabled. Using in-memory cache.")
             self._client = self.memory_client
             self.is_redis_available = False
             # Also start memory client in case we need to fallback later
-            await self.memory_client.start_lifecycle()
+            await self._start_memory_client()
         except RedisConnectionError as e:
             logger.warning(f"Redis connection failed: {e}. Falling back to in-memory cache.")
             self._client = self.memory_client
             self.is_redis_available = False
-            await self.memory_client.start_lifecycle()
+            await self._start_memory_client()
+            # Keep trying, so a Redis that starts after the app is picked up
+            self._open_breaker()
         logger.info("Cache manager initialized successfully.")
 
     async def shutdown(self) -> None:
         """Shutdown cache manager by closing the client connection."""
+        await self._stop_redis_probe()
+        await self._stop_invalidation_listener()
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+            with suppress(CancelledError):
+                await task
         if isinstance(self._client, RedisClient):
             await self._client.disconnect()
         # Ensure memory client is also closed properly
         await self.memory_client.close()
         logger.info("Cache manager shutdown successfully.")
 
+    def _reader(self, near_cache: NearCache | None = None) -> CacheClientProtocol | ReplicaReader:
+        """
+        Client for cache lookups: the backend, via read replicas when it is Redis.
+
+        Reads that fill the near cache go to the primary: an invalidation is
+        published once the primary has the write, so a replica may still return
+        the old value, which the near cache would then keep for its whole TTL.
+        """
+        if near_cache is not None or self._client is not self.redis_client:
+            return self._client
+        return self._replica_reader
+
     def _build_key(self, key: str, namespace: str | None = None) -> str:
-        """Build full cache key with prefix and namespace."""
+        """Build full cache key with prefix and namespace, hashing overlong keys."""
         prefix = self.cache_config.key_prefix
+        if len(key) > self.MAX_KEY_LENGTH:
+            key = f"{key[: self.HASHED_KEY_HEAD]}#{sha256(key.encode()).hexdigest()}"
         return f"{prefix}:{namespace}:{key}" if namespace else f"{prefix}:{key}"
 
+    def _active_near_cache(self) -> NearCache | None:
+        """Return the near cache only while it is subscribed to invalidations."""
+        if self.near_cache is not None and self.is_redis_available and self._near_cache_ready:
+            return self.near_cache
+        return None
+
+    def _start_invalidation_listener(self) -> None:
+        """Start the background task that applies near cache invalidations."""
+        if self.near_cache is None or self._invalidation_task is not None:
+            return
+        self._invalidation_task = create_task(self._invalidation_loop())
+
+    async def _stop_invalidation_listener(self) -> None:
+        """Stop the invalidation listener and drop all near cache entries."""
+        self._near_cache_ready = False
+        if self.near_cache is not None:
+            self.near_cache.clear()
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            with suppress(CancelledError):
+                await self._invalidation_task
+            self._invalidation_task = None
+
+    async def _invalidation_loop(self) -> None:
+        """
+        Subscribe to the invalidation channel and apply incoming messages.
+
+        The near cache is only served while the subscription is live. Any
+        disconnect flushes it, since invalidations may have been missed.
+        """
+        channel = self.cache_config.near_cache_channel
+        while self.is_redis_available and self.near_cache is not None:
+            pubsub = None
+            try:
+                pubsub = await self.redis_client.subscribe(channel)
+                self._near_cache_ready = True
+                async for message in pubsub.listen():
+                    self._apply_invalidation(message.get("data"))
+            except (RedisError, CacheDeserializationError) + BASE_EXCEPTION as e:
+                logger.warning("Near cache invalidation listener failed: %s", e)
+            finally:
+                self._near_cache_ready = False
+                self.near_cache.clear()
+                if pubsub is not None:
+                    with suppress(RedisError, *BASE_EXCEPTION):
+                        await pubsub.aclose()
+            await asyncio_sleep(self.INVALIDATION_RETRY_DELAY)
+
+    def _apply_invalidation(self, payload: object) -> None:
+        """Apply an invalidation message published by another worker."""
+        if self.near_cache is None or not isinstance(payload, (str, bytes)):
+            return
+        message = deserialize(payload)
+        if not isinstance(message, dict) or message.get("origin") == self._instance_id:
+            return
+        if keys := message.get("keys"):
+            self.near_cache.invalidate(*keys)
+        elif (prefix := message.get("prefix")) is not None:
+            self.near_cache.invalidate_prefix(prefix)
+
+    async def _publish_invalidation(
+        self,
+        keys: list[str] | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Invalidate near cache entries locally and in every other worker."""
+        if self.near_cache is None or not self.is_redis_available:
+            return
+        if keys:
+            self.near_cache.invalidate(*keys)
+        elif prefix is not None:
+            self.near_cache.invalidate_prefix(prefix)
+
+        message = serialize({"origin": self._instance_id, "keys": keys, "prefix": prefix})
+        try:
+            await self.redis_client.publish(self.cache_config.near_cache_channel, message)
+        except (RedisError,) + BASE_EXCEPTION as e:
+            logger.warning("Failed to publish near cache invalidation: %s", e)
+
     async def get(
         self,
         key: str,
         namespace: str | None = None,
     ) -> object | None:
-        """Get value from cache."""
+        """Get value from cache; a cached "not found" result reads as a miss."""
+        entry = await self.get_entry(key, namespace)
+        return entry.value if entry is not None and not entry.negative else None
+
+    async def get_entry(
+        self,
+        key: str,
+        namespace: str | None = None,
+    ) -> CacheEntry | None:
+        """
+        Get value from cache along with its freshness metadata.
+
+        A cached "not found" result is returned as an entry with ``negative`` set.
+        """
         try:
             full_key = self._build_key(key, namespace)
             if logger.isEnabledFor(DEBUG):
                 logger.debug("Getting from cache: %s", full_key)
-            cached_value = await self._client.get(full_key)
-
-            if cached_value is None:
-                self.statistics.record_miss()
-                return None
-
-            self.statistics.record_hit()
-            read_bytes = len(cached_value.encode("utf-8")) if isinstance(cached_value, str) else 0
-            self.statistics.record_read(read_bytes)
 
-            # Decompress if needed
-            if isinstance(cached_value, str):
-                cached_value = decompress(cached_value)
-
-            # Deserialize
-            return deserialize(cached_value)
-        except BASE_EXCEPTION + (ValidationError, CacheDeserializationError) as e:
+            # L1: serve hot keys without a network round trip or decompression
+            near_cache = self._active_near_cache()
+            version = 0
+            entry: CacheEntry | None = None
+            if near_cache is not None:
+                if (payload := near_cache.get(full_key)) is not None:
+                    self.statistics.record_hit()
+                    self._track_read(namespace, full_key, len(payload))
+                    entry = CacheEntry.from_payload(deserialize(payload))
+                version = near_cache.version
+
+            if entry is None:
+                cached_value = await self._reader(near_cache).get_bytes(full_key)
+
+                if cached_value is None:
+                    self.statistics.record_miss()
+                    self._track_read(namespace, full_key, None)
+                    return None
+
+                self._track_read(namespace, full_key, len(cached_value))
+                entry = self._load(full_key, cached_value, near_cache, version)
+
+            if entry.negative:
+                self.statistics.record_negative_hit()
+        except BASE_EXCEPTION + (
+            RedisConnectionError,
+            ValidationError,
+            CacheDeserializationError,
+            CacheDecompressionError,
+        ) as e:
             logger.exception("Cache get failed for key: %s", key)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = f"Cache get failed for key {key}, {e}"
             raise CacheKeyError(mssg) from e
+        return entry
 
-    async def set(
+    async def get_many(
+        self,
+        keys: Sequence[str],
+        namespace: str | None = None,
+    ) -> dict[str, object]:
+        """
+        Get many values in a single round trip.
+
+        Keys served by the near cache are skipped; the rest are fetched with one
+        MGET. Missing keys and cached "not found" results are left out of the result.
+        """
+        try:
+            full_keys = {self._build_key(key, namespace): key for key in keys}
+            result: dict[str, object] = {}
+
+            near_cache = self._active_near_cache()
+            version = 0
+            pending = list(full_keys)
+            if near_cache is not None:
+                version = near_cache.version
+                pending = []
+                for full_key, key in full_keys.items():
+                    if (payload := near_cache.get(full_key)) is not None:
+                        self.statistics.record_hit()
+                        self._track_read(namespace, full_key, len(payload))
+                        entry = CacheEntry.from_payload(deserialize(payload))
+                        if not entry.negative:
+                            result[key] = entry.value
+                    else:
+                        pending.append(full_key)
+
+            cached_values = (
+                await self._reader(near_cache).get_many_bytes(pending) if pending else []
+            )
+            for full_key, cached_value in zip(pending, cached_values, strict=True):
+                if cached_value is None:
+                    self.statistics.record_miss()
+                    self._track_read(namespace, full_key, None)
+                    continue
+                self._track_read(namespace, full_key, len(cached_value))
+                entry = self._load(full_key, cached_value, near_cache, version)
+                if not entry.negative:
+                    result[full_keys[full_key]] = entry.value
+        except BASE_EXCEPTION + (
+            RedisConnectionError,
+            ValidationError,
+            CacheDeserializationError,
+            CacheDecompressionError,
+        ) as e:
+            logger.exception("Cache get_many failed for keys: %s", keys)
+            self.statistics.record_error()
+            self._record_redis_failure(e)
+            mssg = f"Cache get_many failed, {e}"
+            raise CacheKeyError(mssg) from e
+        return result
+
+    def _track_read(
+        self,
+        namespace: str | None,
+        full_key: str,
+        size: int | None,
+    ) -> None:
+        """Feed a read into the key telemetry; ``size`` is None on a miss."""
+        if self.telemetry is None:
+            return
+        if size is None:
+            self.telemetry.record_miss(namespace, full_key)
+        else:
+            self.telemetry.record_hit(namespace, full_key, size)
+
+    def _load(
+        self,
+        full_key: str,
+        cached_value: bytes,
+        near_cache: NearCache | None,
+        version: int,
+    ) -> CacheEntry:
+        """Record a hit and decode a value read from the backend, filling the near cache."""
+        self.statistics.record_hit()
+        self.statistics.record_read(len(cached_value))
+
+        # Unframe and decompress (legacy text entries are handled too)
+        data = decode_frame(cached_value)
+        if near_cache is not None:
+            near_cache.set(full_key, data.decode("utf-8"), version=version)
+
+        # Deserialize
+        return CacheEntry.from_payload(deserialize(data))
+
+    def _expiry(self, ttl: int | None) -> int:
+        """Resolve a TTL against the defaults, cap it and apply jitter."""
+        ex = ttl if ttl is not None else self.cache_config.default_ttl
+        ex = min(ex, self.cache_config.max_ttl)
+        if self.cache_config.ttl_jitter > 0:
+            ex = max(1, round(ex * (1 - random() * self.cache_config.ttl_jitter)))  # noqa: S311
+        return ex
+
+    def _encode(self, value: object) -> tuple[bytes, bytes]:
+        """Serialize a value; return the JSON bytes and the framed stored form."""
+        data = serialize_bytes(value)
+
+        # Compress only above the threshold; small values are cheaper stored raw
+        codec = self._codec if len(data) > self.cache_config.compression_threshold else NO_CODEC
+        return data, encode_frame(data, codec)
+
+    async def set(  # noqa: PLR0913
         self,
         key: str,
         value: object,
         ttl: int | None = None,
         namespace: str | None = None,
+        *,
+        stale_ttl: int | None = None,
+        delta: float | None = None,
     ) -> bool:
-        """Set value in cache."""
+        """
+        Set value in cache.
+
+        With ``stale_ttl``, the value is wrapped in an envelope whose soft TTL is
+        ``ttl`` and the backend key lives for ``ttl + stale_ttl`` (the hard TTL).
+        With ``delta`` (the recompute cost in seconds), the envelope records it for
+        probabilistic early expiration. ``CacheConfig.ttl_jitter`` randomly
+        shortens the TTL so keys written together do not expire together.
+        """
         try:
             full_key = self._build_key(key, namespace)
-            serialized = serialize(value)
-
-            # Determine compression
-            if self.cache_config.compression_enabled and do_compress(
-                serialized,
-                self.cache_config.compression_threshold,
-            ):
-                serialized = compress(serialized)
 
             # Set expiration
-            ex = ttl if ttl is not None else self.cache_config.default_ttl
-            ex = min(ex, self.cache_config.max_ttl)
-
-            success = await self._client.set(full_key, serialized, ex=ex)
-            self.statistics.record_set(len(serialized.encode("utf-8")))
+            ex = self._expiry(ttl)
+            if stale_ttl is not None or delta is not None:
+                value = CacheEntry(value, soft_expires_at=time() + ex, delta=delta).to_payload()
+                ex = min(ex + (stale_ttl or 0), self.cache_config.max_ttl)
+
+            data, framed = self._encode(value)
+            success = await self._client.set(full_key, framed, ex=ex)
+            self.statistics.record_set(len(framed))
+            if self.telemetry is not None:
+                self.telemetry.record_write(namespace, full_key, len(framed))
+
+            if success and self.near_cache is not None:
+                await self._publish_invalidation(keys=[full_key])
+                if (near_cache := self._active_near_cache()) is not None:
+                    near_cache.set(full_key, data.decode("utf-8"), ttl=ex)
         except (RedisConnectionError,) + BASE_EXCEPTION as e:
             logger.exception("Cache set failed for key %s", key)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = f"Cache set failed for key {key}"
             raise CacheKeyError(mssg) from e
         return success
 
+    async def set_negative(
+        self,
+        key: str,
+        namespace: str | None = None,
+        ttl: int | None = None,
+        detail: object = None,
+    ) -> bool:
+        """
+        Cache a "not found" result so repeated lookups of a missing key skip the source.
+
+        ``ttl`` defaults to ``CacheConfig.negative_ttl``; a TTL of 0 stores nothing.
+        ``detail`` is kept with the marker so the same error can be replayed.
+        Whatever creates the missing record must delete the key (or bump its tags).
+        """
+        ttl = self.cache_config.negative_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return False
+        return await self.set(key, CacheEntry.negative_payload(detail), ttl, namespace)
+
+    async def set_many(
+        self,
+        items: Mapping[str, object],
+        ttl: int | None = None,
+        namespace: str | None = None,
+        *,
+        ttls: Mapping[str, int] | None = None,
+    ) -> bool:
+        """
+        Set many values in a single round trip.
+
+        ``ttls`` overrides ``ttl`` for individual keys. Each value is serialized,
+        compressed, jittered and counted in the statistics on its own.
+        """
+        if not items:
+            return True
+        ttls = ttls or {}
+        try:
+            payloads: dict[str, bytes] = {}
+            batch: dict[str, tuple[str | bytes, int | None]] = {}
+            for key, value in items.items():
+                full_key = self._build_key(key, namespace)
+                payloads[full_key], framed = self._encode(value)
+                batch[full_key] = (framed, self._expiry(ttls.get(key, ttl)))
+                self.statistics.record_set(len(framed))
+                if self.telemetry is not None:
+                    self.telemetry.record_write(namespace, full_key, len(framed))
+
+            success = await self._client.set_many(batch)
+
+            if success and self.near_cache is not None:
+                await self._publish_invalidation(keys=list(batch))
+                if (near_cache := self._active_near_cache()) is not None:
+                    for full_key, (_, ex) in batch.items():
+                        near_cache.set(full_key, payloads[full_key].decode("utf-8"), ttl=ex)
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
+            logger.exception("Cache set_many failed for keys %s", list(items))
+            self.statistics.record_error()
+            self._record_redis_failure(e)
+            mssg = "Cache set_many failed"
+            raise CacheKeyError(mssg) from e
+        return success
+
+    async def delete_many(self, keys: Sequence[str], namespace: str | None = None) -> int:
+        """Delete many keys with a single DEL."""
+        return await self.delete(*keys, namespace=namespace)
+
     async def delete(self, *keys: str, namespace: str | None = None) -> int:
         """Delete keys from cache."""
         try:
@@ -175,9 +657,11 @@ class CacheManager:
             deleted_count = await self._client.delete(*full_keys)
             if deleted_count:
                 self.statistics.record_delete()
-        except BASE_EXCEPTION as e:
+            await self._publish_invalidation(keys=full_keys)
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
             logger.exception("Cache delete failed for keys: %s", keys)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = "Cache delete failed"
             raise CacheKeyError(mssg) from e
         return deleted_count
@@ -186,13 +670,79 @@ class CacheManager:
         """Check if keys exist."""
         try:
             full_keys = [self._build_key(key, namespace) for key in keys]
-            return await self._client.exists(*full_keys)
-        except BASE_EXCEPTION as e:
+            return await self._reader().exists(*full_keys)
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
             logger.exception("Cache exists check failed for keys: %s", keys)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = "Cache exists check failed"
             raise CacheKeyError(mssg) from e
 
+    async def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """
+        Get the current generation of each tag, in order.
+
+        Tags that were never invalidated are at generation 0. Generations are
+        served from the near cache when it is active; ``invalidate_tags`` evicts them.
+        """
+        try:
+            full_keys = [self._build_key(tag, self.TAG_NAMESPACE) for tag in tags]
+            versions: dict[str, int] = {}
+
+            near_cache = self._active_near_cache()
+            version = 0
+            pending = full_keys
+            if near_cache is not None:
+                version = near_cache.version
+                pending = []
+                for full_key in full_keys:
+                    if (cached := near_cache.get(full_key)) is not None:
+                        versions[full_key] = int(cached)
+                    else:
+                        pending.append(full_key)
+
+            values = await self._reader(near_cache).get_many_bytes(pending) if pending else []
+            for full_key, value in zip(pending, values, strict=True):
+                versions[full_key] = int(value) if value is not None else 0
+                if near_cache is not None:
+                    near_cache.set(full_key, str(versions[full_key]), version=version)
+        except BASE_EXCEPTION + (RedisConnectionError, ValueError) as e:
+            logger.exception("Cache tag lookup failed for tags: %s", tags)
+            self.statistics.record_error()
+            self._record_redis_failure(e)
+            mssg = "Cache tag lookup failed"
+            raise CacheKeyError(mssg) from e
+        return [versions[full_key] for full_key in full_keys]
+
+    async def tagged_key(self, key: str, tags: Sequence[str]) -> str:
+        """
+        Stamp a key with the current generation of each tag.
+
+        Invalidating any of the tags moves readers to a new key; entries under the
+        old key are never read again and simply expire.
+        """
+        if not tags:
+            return key
+        versions = await self.tag_versions(tags)
+        stamp = ",".join(f"{tag}={version}" for tag, version in zip(tags, versions, strict=True))
+        return f"{key}@{stamp}"
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Invalidate every key stamped with any of the tags with one INCR per tag."""
+        try:
+            full_keys = [self._build_key(tag, self.TAG_NAMESPACE) for tag in tags]
+            for full_key in full_keys:
+                await self._client.incr(full_key)
+            if full_keys:
+                self.statistics.record_delete()
+            await self._publish_invalidation(keys=full_keys)
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
+            logger.exception("Cache tag invalidation failed for tags: %s", tags)
+            self.statistics.record_error()
+            self._record_redis_failure(e)
+            mssg = "Cache tag invalidation failed"
+            raise CacheKeyError(mssg) from e
+
     def _get_or_create_lock(self, key: str) -> AsyncLock:
         """
         Get or create a lock for a key in a thread-safe manner.
@@ -214,7 +764,7 @@ class CacheManager:
             self._locks[key] = lock
             return lock
 
-    async def get_or_set(
+    async def get_or_set(  # noqa: PLR0913
         self,
         key: str,
         callback: CacheCallback,
@@ -222,53 +772,339 @@ class CacheManager:
         namespace: str | None = None,
         *,
         force_refresh: bool = False,
+        stale_ttl: int | None = None,
+        beta: float | None = None,
     ) -> object:
         """
         Get from cache or set using callback if not found.
 
-        Implements Request Coalescing (SingleFlight) to prevent Thundering Herd.
-        Uses thread-safe lock creation with LRU eviction to prevent memory leaks.
-        """
-        full_key = self._build_key(key, namespace)
+        Implements Request Coalescing (SingleFlight) to prevent Thundering Herd:
+        concurrent misses share one callback run via ``coalesce``.
 
+        With ``stale_ttl``, entries past their soft TTL but within the hard TTL are
+        returned immediately while a single background task refreshes them.
+
+        With ``beta``, the callback's duration is recorded next to the value and
+        readers start that background refresh early, with a probability that grows
+        as expiry approaches and with the recompute cost (XFetch). 1.0 is the usual
+        choice; larger values refresh earlier.
+
+        With ``CacheConfig.single_flight_distributed``, coalescing also spans
+        workers: only the worker holding the Redis lease runs the callback.
+
+        A callback returning None is cached as "not found" for
+        ``CacheConfig.negative_ttl`` seconds, during which None is returned
+        without calling it again.
+        """
         # 1. Optimistic Check (Fast Path)
         if not force_refresh:
             try:
-                cached = await self.get(key, namespace)
-                if cached is not None:
-                    return cached
+                entry = await self.get_entry(key, namespace)
+                if entry is not None and entry.negative:
+                    return None
+                if entry is not None and entry.value is not None:
+                    if (stale_ttl is not None or beta is not None) and entry.should_refresh(beta):
+                        self.refresh_in_background(
+                            key,
+                            callback,
+                            ttl,
+                            namespace,
+                            stale_ttl=stale_ttl,
+                            beta=beta,
+                        )
+                    return entry.value
             except BASE_EXCEPTION as e:
                 logger.warning("Failed to retrieve from cache: %s", e)
 
-        # 2. Acquire Lock for this key (thread-safe with LRU eviction)
-        lock = self._get_or_create_lock(full_key)
+        # 2. Execute Callback (Heavy Operation) and store its result
+        async def compute() -> object:
+            started = perf_counter()
+            value = await callback()
+            delta = perf_counter() - started if beta is not None else None
+            if value is None:
+                await self.set_negative(key, namespace)
+            else:
+                await self.set(key, value, ttl, namespace, stale_ttl=stale_ttl, delta=delta)
+            return value
 
-        async with lock:
-            # 3. Double Check after acquiring lock (in case another req filled it)
-            if not force_refresh:
-                cached = await self.get(key, namespace)
-                if cached is not None:
-                    return cached
+        if force_refresh:
+            return await compute()
+        # 3. Concurrent misses wait for the first caller's result
+        return await self.coalesce(key, compute, namespace)
 
-            # 4. Execute Callback (Heavy Operation)
-            value = await callback()
-            await self.set(key, value, ttl, namespace)
+    async def coalesce(
+        self,
+        key: str,
+        compute: CacheCallback,
+        namespace: str | None = None,
+    ) -> object:
+        """
+        Run compute once for concurrent callers of a key and share its result.
 
+        Callers that arrive while a computation for the key is in flight in this
+        worker await its result (or its exception) instead of running compute or
+        re-reading the cache. If the leading caller is cancelled, a waiter takes
+        over. With ``CacheConfig.single_flight_distributed``, the leader also takes
+        the Redis lease, so other workers wait for the value it stores.
+
+        compute is responsible for storing the value.
+        """
+        full_key = self._build_key(key, namespace)
+        while (flight := self._flights.get(full_key)) is not None:
+            self.statistics.record_coalesced_wait()
+            try:
+                return await shield(flight)
+            except CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The leader was cancelled; take over unless another waiter did
+
+        flight = get_running_loop().create_future()
+        self._flights[full_key] = flight
+        try:
+            if self._distributed_single_flight():
+                value = await self._single_flight(key, namespace, compute)
+            else:
+                value = await compute()
+        except CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Mark it retrieved so a leader without waiters does not log it again
+            flight.exception()
+            raise
+        else:
+            flight.set_result(value)
             return value
+        finally:
+            self._flights.pop(full_key, None)
+
+    def _distributed_single_flight(self) -> bool:
+        """Whether coalescing should span workers through a Redis lease."""
+        return self.cache_config.single_flight_distributed and self.is_redis_available
+
+    @staticmethod
+    def _lease_key(full_key: str) -> str:
+        """Build the lease key; kept outside the cache prefix so clears skip it."""
+        return f"lease:{full_key}"
+
+    async def _try_acquire_lease(self, lease_key: str, token: str) -> bool:
+        """
+        Try to take the single-flight lease for a key.
+
+        Redis errors count as acquired, so a failing lease never blocks callers;
+        at worst the callback runs in more than one worker.
+        """
+        try:
+            return await self.redis_client.acquire_lease(
+                lease_key,
+                token,
+                self.cache_config.single_flight_lease_ms,
+            )
+        except (RedisError,) + BASE_EXCEPTION as e:
+            logger.warning("Failed to acquire lease %s: %s", lease_key, e)
+            return True
+
+    async def _release_lease(self, lease_key: str, token: str) -> None:
+        """Release the lease; an unreleased lease simply expires."""
+        try:
+            await self.redis_client.release_lease(lease_key, token)
+        except (RedisError,) + BASE_EXCEPTION as e:
+            logger.warning("Failed to release lease %s: %s", lease_key, e)
+
+    async def _single_flight(
+        self,
+        key: str,
+        namespace: str | None,
+        compute: CacheCallback,
+    ) -> object:
+        """
+        Run compute in one worker cluster-wide and hand its result to the others.
+
+        The worker that takes the lease computes and stores the value. The others
+        poll the cache with exponential backoff and return the stored value. If the
+        leader dies, its lease expires and a waiter takes over. If nothing shows up
+        within ``single_flight_wait_timeout``, the waiter computes the value itself.
+        """
+        lease_key = self._lease_key(self._build_key(key, namespace))
+        token = uuid4().hex
+        deadline = monotonic() + self.cache_config.single_flight_wait_timeout
+        delay = self.LEASE_POLL_MIN_DELAY
+
+        while monotonic() < deadline:
+            if await self._try_acquire_lease(lease_key, token):
+                try:
+                    return await compute()
+                finally:
+                    await self._release_lease(lease_key, token)
+
+            await asyncio_sleep(delay)
+            delay = min(delay * 2, self.LEASE_POLL_MAX_DELAY)
+            try:
+                cached = await self.get_entry(key, namespace)
+            except BASE_EXCEPTION as e:
+                logger.warning("Failed to poll cache for key %s: %s", key, e)
+                break
+            if cached is not None and (cached.negative or cached.value is not None):
+                self.statistics.record_coalesced_wait()
+                return None if cached.negative else cached.value
+
+        logger.warning("Timed out waiting for lease holder of key %s", key)
+        return await compute()
+
+    def refresh_in_background(  # noqa: PLR0913
+        self,
+        key: str,
+        callback: CacheCallback,
+        ttl: int | None = None,
+        namespace: str | None = None,
+        *,
+        stale_ttl: int | None = None,
+        beta: float | None = None,
+    ) -> bool:
+        """
+        Schedule a background refresh of a stale entry.
+
+        At most one refresh per key runs at a time in this worker; further calls
+        while it is in flight are ignored.
+
+        Returns:
+            True if a new refresh task was scheduled.
+        """
+        full_key = self._build_key(key, namespace)
+        if full_key in self._refresh_tasks:
+            return False
+
+        task = create_task(
+            self._refresh(key, callback, ttl, namespace, stale_ttl=stale_ttl, beta=beta),
+        )
+        self._refresh_tasks[full_key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(full_key, None))
+        return True
+
+    async def _refresh(  # noqa: PLR0913
+        self,
+        key: str,
+        callback: CacheCallback,
+        ttl: int | None,
+        namespace: str | None,
+        *,
+        stale_ttl: int | None,
+        beta: float | None,
+    ) -> None:
+        """
+        Run the callback and store its result; failures keep the stale value.
+
+        In distributed single-flight mode the refresh is skipped when another
+        worker already holds the lease for this key.
+        """
+        full_key = self._build_key(key, namespace)
+        lease_key = self._lease_key(full_key)
+        token = uuid4().hex
+        lock = self._get_or_create_lock(full_key)
+        async with lock:
+            distributed = self._distributed_single_flight()
+            if distributed and not await self._try_acquire_lease(lease_key, token):
+                return
+            try:
+                started = perf_counter()
+                value = await callback()
+                delta = perf_counter() - started if beta is not None else None
+                await self.set(key, value, ttl, namespace, stale_ttl=stale_ttl, delta=delta)
+            except Exception:
+                logger.exception("Background refresh failed for key %s", key)
+            finally:
+                if distributed:
+                    await self._release_lease(lease_key, token)
 
     async def _fallback_to_memory(self) -> None:
         """
         Fallback to in-memory cache when Redis fails at runtime.
 
-        This implements a simple circuit breaker pattern.
+        Opens the circuit breaker at once, so Redis is probed in the background
+        and used again as soon as it answers.
         """
         if self.is_redis_available:
             logger.warning("Redis connection lost. Falling back to in-memory cache.")
-            self._client = self.memory_client
-            self.is_redis_available = False
-            # Ensure memory client is running
-            if not self.memory_client.is_connected:
-                await self.memory_client.start_lifecycle()
+            self._open_breaker()
+            await self._stop_invalidation_listener()
+            await self._start_memory_client()
+
+    def _record_redis_failure(self, error: BaseException) -> None:
+        """
+        Count a Redis outage error and open the breaker at the threshold.
+
+        Only connection errors and timeouts count, and only while Redis is the
+        backend; errors of a single command say nothing about reachability.
+        """
+        threshold = self.cache_config.breaker_failure_threshold
+        if threshold <= 0 or self._client is not self.redis_client:
+            return
+        if not isinstance(error.__cause__ or error, RETRIABLE_EXCEPTIONS):
+            return
+        now = monotonic()
+        if now - self._last_redis_failure > self.cache_config.breaker_failure_window:
+            self._redis_failures = 0
+        self._redis_failures += 1
+        self._last_redis_failure = now
+        if self._redis_failures >= threshold:
+            logger.error(
+                "Circuit breaker '%s' OPENED after %d Redis failures; serving from memory.",
+                self.BREAKER_NAME,
+                self._redis_failures,
+            )
+            self._open_breaker()
+
+    def _open_breaker(self) -> None:
+        """
+        Route every cache operation to memory now and start probing Redis.
+
+        Switching is synchronous, so requests arriving after the trip never wait
+        on Redis retries or socket timeouts; the probe task does the rest.
+        """
+        self._client = self.memory_client
+        self.is_redis_available = False
+        self._redis_failures = 0
+        self.breaker_trips += 1
+        self._set_breaker_state(CircuitState.OPEN)
+        if self._probe_task is None:
+            self._probe_task = create_task(self._probe_redis())
+
+    def _set_breaker_state(self, state: CircuitState) -> None:
+        """Move the breaker to state and export the transition as metrics."""
+        if state is self.breaker_state:
+            return
+        self.breaker_state = state
+        metrics.record_circuit_breaker_transition(self.BREAKER_NAME, state.value)
+
+    async def _probe_redis(self) -> None:
+        """
+        Ping Redis every probe interval and switch back to it once it answers.
+
+        Writes made to memory meanwhile are not copied to Redis; entries there
+        expire on their own TTL, as after ``enable_redis``.
+        """
+        await self._stop_invalidation_listener()
+        await self._start_memory_client()
+        try:
+            while True:
+                await asyncio_sleep(self.cache_config.breaker_probe_interval)
+                self._set_breaker_state(CircuitState.HALF_OPEN)
+                if await self._try_reconnect_redis():
+                    logger.info("Circuit breaker '%s' recovered, now CLOSED", self.BREAKER_NAME)
+                    return
+                self._set_breaker_state(CircuitState.OPEN)
+        finally:
+            self._probe_task = None
+
+    async def _stop_redis_probe(self) -> None:
+        """Cancel the Redis probe, if one is running."""
+        task, self._probe_task = self._probe_task, None
+        if task is not None and task is not current_task():
+            task.cancel()
+            with suppress(CancelledError):
+                await task
 
     async def disable_redis(self) -> CacheToggleResponse:
         """
@@ -278,6 +1114,9 @@ class CacheManager:
             Dictionary with status and message.
         """
         if not self.is_redis_available:
+            # An administrator's choice outlasts an outage: stop switching back
+            await self._stop_redis_probe()
+            self._set_breaker_state(CircuitState.CLOSED)
             return CacheToggleResponse(
                 status="unchanged",
                 message="Redis is already disabled. Using in-memory cache.",
@@ -286,15 +1125,19 @@ class CacheManager:
             )
 
         # Disconnect from Redis
+        self.is_redis_available = False
+        await self._stop_redis_probe()
+        await self._stop_invalidation_listener()
         await self.redis_client.disconnect()
 
         # Switch to in-memory client
         self._client = self.memory_client
         self.is_redis_available = False
+        self._set_breaker_state(CircuitState.CLOSED)
 
         # Ensure memory client is running
         if not self.memory_client.is_connected:
-            await self.memory_client.start_lifecycle()
+            await self._start_memory_client()
 
         logger.info("Redis disabled. Switched to in-memory cache.")
         return CacheToggleResponse(
@@ -320,9 +1163,15 @@ class CacheManager:
             )
 
         try:
+            # Pools left behind by an outage are replaced, not leaked
+            if self.redis_client.is_connected:
+                await self.redis_client.disconnect()
             await self.redis_client.connect()
+            await self._stop_redis_probe()
             self._client = self.redis_client
             self.is_redis_available = True
+            self._set_breaker_state(CircuitState.CLOSED)
+            self._start_invalidation_listener()
             logger.info("Redis enabled. Switched from in-memory cache.")
             return CacheToggleResponse(
                 status="success",
@@ -343,6 +1192,9 @@ class CacheManager:
         """
         Attempt to reconnect to Redis.
 
+        Pools that were already set up are pinged rather than recreated, since
+        they reconnect on their own once Redis is back.
+
         Returns:
             True if reconnection was successful.
         """
@@ -350,16 +1202,45 @@ class CacheManager:
             return True
 
         try:
-            await self.redis_client.connect()
+            if not self.redis_client.is_connected:
+                await self.redis_client.connect()
+            elif not await self.redis_client.ping():
+                return False
             self._client = self.redis_client
             self.is_redis_available = True
+            self._set_breaker_state(CircuitState.CLOSED)
+            self._start_invalidation_listener()
             logger.info("Successfully reconnected to Redis.")
             return True
-        except RedisConnectionError:
+        except (RedisConnectionError,) + BASE_EXCEPTION:
             if logger.isEnabledFor(DEBUG):
                 logger.debug("Redis reconnection attempt failed.")
             return False
 
+    async def _delete_matching(self, pattern: str) -> int:
+        """Delete keys matching a pattern in batches and return the count."""
+        deleted_total = 0
+        keys_batch: list[str] = []
+
+        # Scans on the primary, so keys written within the replica lag are deleted too
+        async for key in self._client.scan_iter(pattern):
+            keys_batch.append(key)
+
+            if len(keys_batch) >= 1000:
+                await self._client.delete(*keys_batch)
+                deleted_total += len(keys_batch)
+                keys_batch = []
+
+        # Delete remaining
+        if keys_batch:
+            await self._client.delete(*keys_batch)
+            deleted_total += len(keys_batch)
+
+        if deleted_total > 0:
+            self.statistics.record_delete()
+            logger.info("Cleared %d keys for pattern '%s'.", deleted_total, pattern)
+        return deleted_total
+
     async def clear(self, namespace: str | None = None) -> int:
         """
         Clear all cache entries, optionally for a namespace.
@@ -367,36 +1248,23 @@ class CacheManager:
         Uses batched deletion to ensure memory safety.
         """
         try:
+            prefix = self.cache_config.key_prefix
             if self.is_redis_available and isinstance(self._client, RedisClient):
-                prefix = self.cache_config.key_prefix
                 pattern = f"{prefix}:{namespace}:*" if namespace else f"{prefix}:*"
-
-                deleted_total = 0
-                keys_batch: list[str] = []
-
-                # Use the new async iterator
-                async for key in self._client.scan_iter(pattern):
-                    keys_batch.append(key)
-
-                    if len(keys_batch) >= 1000:
-                        await self._client.delete(*keys_batch)
-                        deleted_total += len(keys_batch)
-                        keys_batch = []
-
-                # Delete remaining
-                if keys_batch:
-                    await self._client.delete(*keys_batch)
-                    deleted_total += len(keys_batch)
-
-                if deleted_total > 0:
-                    self.statistics.record_delete()
-                    logger.info("Cleared %d keys for pattern '%s'.", deleted_total, pattern)
+                deleted_total = await self._delete_matching(pattern)
+                await self._publish_invalidation(prefix=pattern.removesuffix("*"))
 
                 self.statistics.reset()
                 return deleted_total
 
             # Fallback for in-memory
-            if isinstance(self._client, MemoryClient):
+            if self._client is self.memory_client:
+                if namespace:
+                    # MemoryClient resolves prefix patterns through its prefix index
+                    deleted_total = await self._delete_matching(f"{prefix}:{namespace}:*")
+                    self.statistics.reset()
+                    return deleted_total
+
                 await self._client.flush_all()
                 self.statistics.reset()
                 logger.info("In-memory cache cleared (flushed all).")
@@ -417,9 +1285,10 @@ class CacheManager:
         try:
             full_key = self._build_key(key, namespace)
             return await self._client.expire(full_key, seconds)
-        except BASE_EXCEPTION as e:
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
             logger.exception("Cache expire failed for key %s", key)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = f"Cache expire failed for key {key}"
             raise CacheKeyError(mssg) from e
 
@@ -427,10 +1296,11 @@ class CacheManager:
         """Get remaining time to live."""
         try:
             full_key = self._build_key(key, namespace)
-            return await self._client.ttl(full_key)
-        except BASE_EXCEPTION as e:
+            return await self._reader().ttl(full_key)
+        except (RedisConnectionError,) + BASE_EXCEPTION as e:
             logger.exception("Cache ttl check failed for key %s", key)
             self.statistics.record_error()
+            self._record_redis_failure(e)
             mssg = f"Cache ttl check failed for key {key}"
             raise CacheKeyError(mssg) from e
 
@@ -452,7 +1322,14 @@ class CacheManager:
         result: dict[str, Any] = {
             "backend": "redis" if self.is_redis_available else "in-memory",
             "statistics": self.get_statistics(),
+            "circuit_breaker": {
+                "state": self.breaker_state.value,
+                "trips": self.breaker_trips,
+                "recent_failures": self._redis_failures,
+            },
         }
+        if self.near_cache is not None:
+            result["near_cache"] = self.near_cache.info()
 
         try:
             if self.is_redis_available and isinstance(self._client, RedisClient):
@@ -470,7 +1347,21 @@ class CacheManager:
         """Get cache statistics."""
         return self.statistics.to_dict()
 
+    def get_telemetry(self, limit: int | None = None) -> CacheTelemetryData | None:
+        """
+        Get hot-key, largest-key and per-namespace telemetry.
+
+        Args:
+            limit: Maximum number of hot and largest keys listed.
+
+        Returns:
+            The telemetry, or None when it is disabled.
+        """
+        return self.telemetry.to_data(limit) if self.telemetry is not None else None
+
     def reset_statistics(self) -> None:
-        """Reset cache statistics."""
+        """Reset cache statistics and telemetry."""
         self.statistics.reset()
+        if self.telemetry is not None:
+            self.telemetry.reset()
         logger.info("Cache statistics reset.")
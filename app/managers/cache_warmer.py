@@ -0,0 +1,148 @@
+"""
+Cache warming for cached endpoints.
+
+After a deploy or a cache clear every key misses at once and the first wave of
+traffic all lands on the database. ``CacheWarmer`` fills the hottest entries
+ahead of that traffic: routes register ``WarmupEntry`` objects naming a
+``@cached`` endpoint's ``warm`` hook and the calls to warm it with, and the
+warmer runs them with bounded concurrency once at startup and then periodically.
+"""
+
+from asyncio import CancelledError, Semaphore, Task, create_task, gather, shield, wait_for
+from asyncio import sleep as asyncio_sleep
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.configs.cache import CacheConfig
+from app.db import transaction
+from app.logging import get_logger
+from app.managers.cache_manager import CacheManager
+
+logger = get_logger(__name__)
+
+# Keyword arguments of the endpoint calls to warm, looked up with a database session
+WarmupCalls = Callable[[AsyncSession, CacheConfig], Awaitable[Iterable[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class WarmupEntry:
+    """
+    A cached endpoint and the calls that warm it.
+
+    Attributes:
+        name: Label used in logs.
+        warm: The endpoint's ``warm`` hook added by ``@cached``; it builds the key
+              and the stored value exactly as a request would.
+        calls: Returns the keyword arguments of each call to warm, e.g. one per
+               list page or per most-viewed slug. Repositories among them are
+               rebound to a fresh session for every call.
+    """
+
+    name: str
+    warm: Callable[..., Awaitable[None]]
+    calls: WarmupCalls
+
+
+class CacheWarmer:
+    """
+    Warm registered cache entries at startup and then periodically.
+
+    Failures are logged and never propagate: warming only saves work the
+    requests would otherwise do themselves.
+    """
+
+    def __init__(self, cache_manager: CacheManager, entries: Sequence[WarmupEntry]) -> None:
+        """
+        Initialize the warmer.
+
+        Args:
+            cache_manager: Cache manager the entries are stored in.
+            entries: Registry of endpoints to warm.
+        """
+        self.cache_manager = cache_manager
+        self.entries = tuple(entries)
+        self._config = cache_manager.cache_config
+        self._semaphore = Semaphore(max(1, self._config.warmup_concurrency))
+        self._task: Task[None] | None = None
+        self._pass: Task[int] | None = None
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        """Whether the first warm-up pass has finished, failed or timed out."""
+        return self._ready
+
+    async def warm(self) -> int:
+        """
+        Run one warm-up pass over every entry.
+
+        Returns:
+            Number of endpoint calls that were warmed successfully.
+        """
+        started = perf_counter()
+        results = await gather(*(self._warm_entry(entry) for entry in self.entries))
+        warmed = sum(results)
+        logger.info(f"Cache warm-up stored {warmed} entries in {perf_counter() - started:.2f}s")
+        return warmed
+
+    async def _warm_entry(self, entry: WarmupEntry) -> int:
+        """Look up an entry's calls and warm them, at most ``warmup_concurrency`` at a time."""
+        try:
+            async with self._semaphore, transaction() as session:
+                calls = list(await entry.calls(session, self._config))
+        except Exception:  # noqa: BLE001
+            logger.warning(f"Cache warm-up of {entry.name} could not list its calls", exc_info=True)
+            return 0
+        results = await gather(*(self._warm_call(entry, kwargs) for kwargs in calls))
+        return sum(results)
+
+    async def _warm_call(self, entry: WarmupEntry, kwargs: dict[str, Any]) -> bool:
+        async with self._semaphore:
+            try:
+                await entry.warm(self.cache_manager, **kwargs)
+            except Exception:  # noqa: BLE001
+                logger.warning(f"Cache warm-up call of {entry.name} failed", exc_info=True)
+                return False
+            return True
+
+    def start(self) -> None:
+        """Start warming in the background: a first pass, then one every interval."""
+        if self._task is None:
+            self._task = create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            await wait_for(shield(self.trigger()), timeout=self._config.warmup_timeout)
+        except TimeoutError:
+            logger.warning("Cache warm-up is still running after its timeout; reporting ready")
+        finally:
+            # Readiness must not wait on an optimization forever
+            self._ready = True
+
+        while self._config.warmup_interval > 0:
+            await asyncio_sleep(self._config.warmup_interval)
+            await self.trigger()
+
+    def trigger(self) -> Task[int]:
+        """
+        Start a warm-up pass, or return the one already running.
+
+        Used after the cache is cleared, so a pass is never run twice at once.
+        """
+        if self._pass is None or self._pass.done():
+            self._pass = create_task(self.warm())
+        return self._pass
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and any pass in flight."""
+        for task in (self._task, self._pass):
+            if task is not None:
+                task.cancel()
+                with suppress(CancelledError):
+                    await task
+        self._task = self._pass = None
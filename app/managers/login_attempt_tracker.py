@@ -8,7 +8,8 @@ from app.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Key prefixes for login attempts
+# Key prefixes for login attempts; the identifier is a hash tag so both keys of a
+# user share a Redis Cluster slot and can be deleted together
 ATTEMPTS_PREFIX = "login:attempts:"
 LOCKOUT_PREFIX = "login:lockout:"
 
@@ -34,11 +35,27 @@ class LoginAttemptTracker:
 
     def _get_attempts_key(self, identifier: str) -> str:
         """Get Redis key for attempt count."""
-        return f"{ATTEMPTS_PREFIX}{identifier}"
+        return f"{ATTEMPTS_PREFIX}{{{identifier}}}"
 
     def _get_lockout_key(self, identifier: str) -> str:
         """Get Redis key for lockout status."""
-        return f"{LOCKOUT_PREFIX}{identifier}"
+        return f"{LOCKOUT_PREFIX}{{{identifier}}}"
+
+    # Keys written before the identifier became a hash tag are still honoured until
+    # they expire: at most LOCKOUT_DURATION_MINUTES for counts and 24 hours for
+    # lockouts after the upgrade. The legacy fallbacks can be removed after that.
+
+    @staticmethod
+    def _get_legacy_keys(identifier: str) -> tuple[str, str]:
+        """Get the attempts and lockout keys of the format without hash tag."""
+        return f"{ATTEMPTS_PREFIX}{identifier}", f"{LOCKOUT_PREFIX}{identifier}"
+
+    async def _get_attempts(self, identifier: str) -> int:
+        """Read the attempt count, falling back to the legacy key."""
+        current = await self._redis.get(self._get_attempts_key(identifier))
+        if current is None:
+            current = await self._redis.get(self._get_legacy_keys(identifier)[0])
+        return int(current) if current else 0
 
     async def record_failed_attempt(self, identifier: str) -> int:
         """
@@ -54,8 +71,7 @@ class LoginAttemptTracker:
             key = self._get_attempts_key(identifier)
 
             # Get current count
-            current = await self._redis.get(key)
-            attempts = int(current) + 1 if current else 1
+            attempts = await self._get_attempts(identifier) + 1
 
             # Store updated count with expiration
             await self._redis.set(key, str(attempts), ex=self._lockout_duration)
@@ -117,6 +133,8 @@ class LoginAttemptTracker:
         try:
             lockout_key = self._get_lockout_key(identifier)
             ttl = await self._redis.ttl(lockout_key)
+            if ttl <= 0:
+                ttl = await self._redis.ttl(self._get_legacy_keys(identifier)[1])
 
             if ttl > 0:
                 return (True, ttl)
@@ -140,7 +158,8 @@ class LoginAttemptTracker:
             attempts_key = self._get_attempts_key(identifier)
             lockout_key = self._get_lockout_key(identifier)
 
-            await self._redis.delete(attempts_key, lockout_key)
+            # The legacy keys may sit in other cluster slots; the client splits them
+            await self._redis.delete(attempts_key, lockout_key, *self._get_legacy_keys(identifier))
             logger.debug("Reset login attempts for %s", identifier)
             return True
         except RedisError:
@@ -158,9 +177,7 @@ class LoginAttemptTracker:
             int: Number of failed attempts
         """
         try:
-            key = self._get_attempts_key(identifier)
-            current = await self._redis.get(key)
-            return int(current) if current else 0
+            return await self._get_attempts(identifier)
         except RedisError:
             logger.exception("Failed to get attempts for %s", identifier)
             return 0
@@ -9,6 +9,7 @@ Request parameters in function signatures.
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.clients.replica_router import request_writes
 from app.context import cache_manager_ctx
 from app.managers.cache_manager import CacheManager
 
@@ -18,8 +19,10 @@ class ContextMiddleware:
     Middleware to set context variables for request lifecycle.
 
     Sets cache_manager in ContextVars so decorators can access it
-    without requiring Request parameter. Uses try/finally to ensure
-    context is always reset after request processing.
+    without requiring Request parameter, and starts the set of Redis keys
+    the request writes, which read-your-writes replica routing consults.
+    Uses try/finally to ensure context is always reset after request
+    processing.
 
     Examples
     --------
@@ -58,11 +61,13 @@ class ContextMiddleware:
             None,
         )
 
-        # Set context variable
+        # Set context variables
         token = cache_manager_ctx.set(cache_manager)
+        writes_token = request_writes.set(set())
 
         try:
             await self._app(scope, receive, send)
         finally:
             # Always reset context to prevent leakage between requests
+            request_writes.reset(writes_token)
             cache_manager_ctx.reset(token)
@@ -318,9 +318,10 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         # At this point, raw_key is validated as a non-None UUID v4.
         assert raw_key is not None
 
-        # 4. Derive user-scoped Redis key and hash the request body.
+        # 4. Derive user-scoped Redis key and hash the request body. The scope is a
+        #    hash tag, keeping a user's keys on one Redis Cluster node.
         scope = _extract_user_scope(request)
-        redis_key = f"idemp:{scope}:{raw_key}"
+        redis_key = f"idemp:{{{scope}}}:{raw_key}"
         body = await request.body()
         req_hash = sha256(body).hexdigest()
 
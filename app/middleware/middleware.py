@@ -48,11 +48,13 @@ from app.configs.settings import settings
 from app.db import close_db, init_db
 from app.logging import bind_request_id, clear_context, get_logger
 from app.managers.cache_manager import CacheManager
+from app.managers.cache_warmer import CacheWarmer
 from app.managers.login_attempt_tracker import init_login_tracker
 from app.managers.password_manager import Argon2Hasher
 from app.managers.rate_limiter import close_limiter
 from app.managers.token_blacklist import init_token_blacklist
 from app.monitoring import HealthChecker
+from app.routes import WARMUP_ENTRIES
 from app.stores.idempotency import RedisIdempotencyStore
 from app.utils.helpers import host, mask_ip_address, time_taken
 from app.utils.timezone import format_logs
@@ -140,6 +142,7 @@ async def _init_services(app: FastAPI) -> CacheManager:
     app.state.cache_manager = cache_manager
 
     _blacklist_and_tracker_init(app, cache_manager)
+    _cache_warmer_init(app, cache_manager)
 
     logger.info(f"is uvloop: {type(get_running_loop()) is Loop}")
 
@@ -164,10 +167,23 @@ def _blacklist_and_tracker_init(app: FastAPI, cache_manager: CacheManager) -> No
         app.state.login_tracker = login_tracker
 
         # Idempotency store — backed by the same Redis connection.
-        app.state.idempotency_store = RedisIdempotencyStore(redis_client.client)
+        app.state.idempotency_store = RedisIdempotencyStore(
+            redis_client.client,
+            legacy_keys=redis_client.config.legacy_idempotency_keys,
+        )
         logger.info("Idempotency store initialized")
 
 
+def _cache_warmer_init(app: FastAPI, cache_manager: CacheManager) -> None:
+    """Start warming the registered cache entries; readiness waits for the first pass."""
+    app.state.cache_warmer = None
+    if cache_manager.cache_config.warmup_enabled:
+        cache_warmer = CacheWarmer(cache_manager, WARMUP_ENTRIES)
+        cache_warmer.start()
+        app.state.cache_warmer = cache_warmer
+        logger.info("Cache warmer started")
+
+
 def _show_links() -> None:
     """Show links to services."""
     logger.info("Services:")
@@ -187,6 +203,8 @@ def _show_links() -> None:
 
 async def _cleanup_services(app: FastAPI, cache_manager: CacheManager) -> None:
     """Cleanup services on shutdown."""
+    if cache_warmer := app.state.cache_warmer:
+        await cache_warmer.stop()
     if ai_client := app.state.ai_client:
         await ai_client.close()
     await close_db()
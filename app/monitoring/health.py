@@ -244,6 +244,12 @@ class HealthChecker:
         if disk_check.status == CheckStatus.FAIL:
             overall_status = OverallStatus.NOT_READY
 
+        # Check cache warm-up, when enabled
+        if (warmup_check := self._check_cache_warmup()) is not None:
+            checks["cache_warmup"] = warmup_check
+            if warmup_check.status == CheckStatus.FAIL:
+                overall_status = OverallStatus.NOT_READY
+
         return HealthStatus(
             status=overall_status,
             timestamp=datetime.now(UTC).isoformat(),
@@ -348,6 +354,20 @@ class HealthChecker:
                 message=f"Redis check failed: {e!s}",
             )
 
+    def _check_cache_warmup(self) -> ComponentCheck | None:
+        """
+        Check whether the first cache warm-up pass has finished.
+
+        Returns:
+            ComponentCheck with warm-up status, or None if warming is disabled.
+        """
+        cache_warmer = getattr(self.app.state, "cache_warmer", None)
+        if cache_warmer is None:
+            return None
+        if cache_warmer.ready:
+            return ComponentCheck(status=CheckStatus.PASS)
+        return ComponentCheck(status=CheckStatus.FAIL, message="Cache warm-up in progress")
+
     def _check_disk(self) -> ComponentCheck:
         """
         Check disk space usage.
@@ -4,7 +4,7 @@ Prometheus metrics collection with cardinality protection.
 This module provides Prometheus metrics collection for the BaliBlissed backend
 with built-in cardinality protection and custom metrics for:
 - HTTP request metrics (handled by prometheus-fastapi-instrumentator)
-- Cache hit/miss rates
+- Cache hit/miss rates, per namespace, and hot-key concentration
 - AI request duration and token usage
 - Circuit breaker states
 - System metrics (CPU, memory, disk)
@@ -22,19 +22,24 @@ Examples
 >>> metrics.record_ai_request(duration=1.5, tokens=150)
 """
 
+from collections.abc import Iterator
 from re import IGNORECASE, sub
 
 from fastapi import FastAPI
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
+    REGISTRY,
     Counter,
     Gauge,
     Histogram,
     generate_latest,
 )
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.configs.settings import settings
+from app.data.telemetry import KeyTelemetry
 
 # Cardinality protection - NEVER use these as labels
 HIGH_CARDINALITY_LABELS: frozenset[str] = frozenset(
@@ -89,6 +94,63 @@ AI_LATENCY_BUCKETS: tuple[float, ...] = (
     60.0,
 )
 
+# Gauge value of each circuit breaker state
+CIRCUIT_STATE_VALUES: dict[str, int] = {"closed": 0, "open": 1, "half_open": 2}
+
+
+class CacheTelemetryCollector(Collector):
+    """
+    Export a cache manager's key telemetry when Prometheus scrapes.
+
+    Reading the telemetry at scrape time keeps the cache hot path free of
+    Prometheus calls. Only namespaces become labels; individual keys are
+    unbounded and are listed by ``/cache/stats`` instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the collector with no telemetry attached."""
+        self.telemetry: KeyTelemetry | None = None
+
+    def collect(self) -> Iterator[Metric]:
+        """
+        Yield per-namespace counters and hot-key gauges.
+
+        Returns:
+            Metric families built from the current telemetry.
+        """
+        if (telemetry := self.telemetry) is None:
+            return
+        data = telemetry.to_data(limit=1)
+        requests = CounterMetricFamily(
+            "baliblissed_cache_namespace_requests",
+            "Cache reads per namespace",
+            labels=["namespace", "result"],
+        )
+        transferred = CounterMetricFamily(
+            "baliblissed_cache_namespace_bytes",
+            "Bytes read from and written to the cache per namespace",
+            labels=["namespace", "direction"],
+        )
+        for name, stats in data.namespaces.items():
+            namespace = MetricsCollector._validate_label_value(name)
+            requests.add_metric([namespace, "hit"], stats.hits)
+            requests.add_metric([namespace, "miss"], stats.misses)
+            transferred.add_metric([namespace, "read"], stats.bytes_read)
+            transferred.add_metric([namespace, "written"], stats.bytes_written)
+        yield requests
+        yield transferred
+
+        yield GaugeMetricFamily(
+            "baliblissed_cache_hot_keys_read_share",
+            "Share of sampled cache reads that went to the tracked hot keys",
+            value=telemetry.hot_key_share(),
+        )
+        yield GaugeMetricFamily(
+            "baliblissed_cache_largest_value_bytes",
+            "Size of the largest value written to the cache",
+            value=data.largest_keys[0].size_bytes if data.largest_keys else 0,
+        )
+
 
 class MetricsCollector:
     """
@@ -103,6 +165,12 @@ class MetricsCollector:
         Total number of cache hits
     cache_misses_total : Counter
         Total number of cache misses
+    cache_coalesced_waits_total : Counter
+        Total number of cache misses served by another request's computation
+    cache_coalesced_wait_seconds : Histogram
+        Time spent waiting for another request's computation
+    cache_telemetry : CacheTelemetryCollector
+        Per-namespace and hot-key cache telemetry, read at scrape time
     ai_requests_total : Counter
         Total number of AI API requests
     ai_request_duration_seconds : Histogram
@@ -111,6 +179,10 @@ class MetricsCollector:
         Total tokens used in AI requests
     circuit_breaker_state : Gauge
         Current state of circuit breakers (0=closed, 1=open, 2=half-open)
+    circuit_breaker_opens_total : Counter
+        Total number of circuit breaker opens
+    circuit_breaker_transitions_total : Counter
+        Total number of circuit breaker state changes, by state entered
     rate_limit_hits_total : Counter
         Total number of rate limit hits
     system_cpu_percent : Gauge
@@ -132,6 +204,17 @@ class MetricsCollector:
             "baliblissed_cache_misses_total",
             "Total number of cache misses",
         )
+        self.cache_coalesced_waits_total = Counter(
+            "baliblissed_cache_coalesced_waits_total",
+            "Total number of cache misses served by another request's computation",
+        )
+        self.cache_coalesced_wait_seconds = Histogram(
+            "baliblissed_cache_coalesced_wait_seconds",
+            "Time spent waiting for another request's computation",
+            buckets=LATENCY_BUCKETS,
+        )
+        self.cache_telemetry = CacheTelemetryCollector()
+        REGISTRY.register(self.cache_telemetry)
 
         # AI metrics
         self.ai_requests_total = Counter(
@@ -162,6 +245,11 @@ class MetricsCollector:
             "Total number of circuit breaker opens",
             ["breaker_name"],
         )
+        self.circuit_breaker_transitions_total = Counter(
+            "baliblissed_circuit_breaker_transitions_total",
+            "Total number of circuit breaker state changes, by state entered",
+            ["breaker_name", "state"],  # closed, open, half_open
+        )
 
         # Rate limiting metrics
         self.rate_limit_hits_total = Counter(
@@ -242,6 +330,33 @@ class MetricsCollector:
         """
         self.cache_misses_total.inc()
 
+    def record_cache_coalesced_wait(self, duration: float) -> None:
+        """
+        Record a cache miss that waited for another request's computation.
+
+        Args:
+            duration: Seconds spent waiting.
+
+        Examples:
+        --------
+        >>> metrics.record_cache_coalesced_wait(duration=0.2)
+        """
+        self.cache_coalesced_waits_total.inc()
+        self.cache_coalesced_wait_seconds.observe(duration)
+
+    def track_cache_telemetry(self, telemetry: KeyTelemetry) -> None:
+        """
+        Export a cache manager's key telemetry on the next scrapes.
+
+        Args:
+            telemetry: Telemetry of the application's cache manager.
+
+        Examples:
+        --------
+        >>> metrics.track_cache_telemetry(cache_manager.telemetry)
+        """
+        self.cache_telemetry.telemetry = telemetry
+
     def record_ai_request(
         self,
         request_type: str,
@@ -288,6 +403,29 @@ class MetricsCollector:
         breaker_name = self._validate_label_value(breaker_name)
         self.circuit_breaker_state.labels(breaker_name=breaker_name).set(state)
 
+    def record_circuit_breaker_transition(self, breaker_name: str, state: str) -> None:
+        """
+        Record a circuit breaker entering a new state.
+
+        Updates the state gauge and counts the transition; entering ``open``
+        also counts as an open.
+
+        Args:
+            breaker_name: Name of the circuit breaker.
+            state: State entered (closed, open or half_open).
+
+        Examples:
+        --------
+        >>> metrics.record_circuit_breaker_transition("redis_cache", "open")
+        """
+        breaker_name = self._validate_label_value(breaker_name)
+        self.circuit_breaker_state.labels(breaker_name=breaker_name).set(
+            CIRCUIT_STATE_VALUES.get(state, 0),
+        )
+        self.circuit_breaker_transitions_total.labels(breaker_name=breaker_name, state=state).inc()
+        if state == "open":
+            self.circuit_breaker_opens_total.labels(breaker_name=breaker_name).inc()
+
     def record_rate_limit_hit(self, endpoint: str) -> None:
         """
         Record a rate limit hit.
@@ -165,6 +165,25 @@ class BlogRepository(BaseRepository[BlogDB, BlogSchema, BlogUpdate]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_most_viewed_slugs(self, limit: int = 20) -> list[str]:
+        """
+        Get the slugs of the most viewed published blogs.
+
+        Args:
+            limit: Maximum number of slugs to return
+
+        Returns:
+            list[str]: Slugs ordered by view count, highest first
+        """
+        query = (
+            select(BlogDB.slug)
+            .where(cast(ColumnElement[bool], BlogDB.status == "published"))
+            .order_by(desc(cast(ColumnElement[int], BlogDB.view_count)))
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def get_by_author(
         self,
         author_id: UUID,
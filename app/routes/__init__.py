@@ -1,6 +1,7 @@
 from app.routes.admin import router as admin_router
 from app.routes.ai import router as ai_router
 from app.routes.auth import router as auth_router
+from app.routes.blog import BLOG_WARMUP_ENTRIES
 from app.routes.blog import router as blog_router
 from app.routes.cache import router as cache_router
 from app.routes.email import router as email_router
@@ -9,9 +10,14 @@ from app.routes.items import router as items_router
 from app.routes.limiter import router as limiter_router
 from app.routes.oauth import router as oauth_router
 from app.routes.review import router as review_router
+from app.routes.user import USER_WARMUP_ENTRIES
 from app.routes.user import router as user_router
 
+# Cached endpoints warmed at startup and periodically, see CacheWarmer
+WARMUP_ENTRIES = (*BLOG_WARMUP_ENTRIES, *USER_WARMUP_ENTRIES)
+
 __all__ = [
+    "WARMUP_ENTRIES",
     "admin_router",
     "ai_router",
     "auth_router",
@@ -346,6 +346,7 @@ async def email_inquiry_confirmation_message(
     ttl=3600,
     key_builder=lambda itinerary_req, **kw: itinerary_md_key(itinerary_req),
     namespace="itinerary-md",
+    stale_ttl=600,
     response_model=ItineraryMD,
 )
 async def itinerary(
@@ -463,6 +464,7 @@ async def itinerary(
     ttl=3600,
     key_builder=lambda itinerary_md, **kw: itinerary_md_key(itinerary_md),
     namespace="itinerary-txt",
+    stale_ttl=600,
     response_model=ItineraryTXT,
 )
 async def itinerary_txt(
@@ -85,7 +85,7 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserCreate, UserResponse, validate_user_response
 from app.services.geo_timezone import detect_timezone_by_ip
-from app.utils.cache_keys import user_id_key, username_key, users_list_key
+from app.utils.cache_keys import USERS_LIST_TAG, user_id_key, username_key
 
 router = APIRouter(prefix="/auth", tags=["🔐 Auth"])
 logger = get_logger(__name__)
@@ -1154,12 +1154,13 @@ async def register_user(
         await deps.auth_service.send_verification_email(user)
         await deps.auth_service.record_verification_sent(user.uuid)
 
-        await get_cache_manager(request).delete(
+        cache_manager = get_cache_manager(request)
+        await cache_manager.delete(
             user_id_key(user.uuid),
             username_key(user.username),
-            users_list_key(0, 10),
             namespace="users",
         )
+        await cache_manager.invalidate_tags(USERS_LIST_TAG)
         return validate_user_response(user)
     except Exception as e:
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -31,12 +31,13 @@ authenticated/identified clients.
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Annotated, Literal, Never, cast
+from typing import Annotated, Any, Literal, Never, cast
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, UploadFile
 from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 from starlette.status import (
     HTTP_201_CREATED,
@@ -46,6 +47,7 @@ from starlette.status import (
     HTTP_409_CONFLICT,
 )
 
+from app.configs.cache import CacheConfig
 from app.decorators.caching import cache_busting, cached, get_cache_manager
 from app.decorators.metrics import timed
 from app.dependencies import (
@@ -68,18 +70,24 @@ from app.errors.upload import (
     VideoTooLargeError,
 )
 from app.logging import get_logger
+from app.managers.cache_warmer import WarmupEntry
 from app.managers.rate_limiter import limiter
 from app.models import BlogDB
+from app.repositories import BlogRepository
 from app.repositories.base import CreateUpdate
 from app.schemas import BlogCreate, BlogListResponse, BlogResponse, BlogSchema, BlogUpdate
 from app.schemas.review import MediaUploadResponse
 from app.services import MediaService
-from app.utils.helpers import response_datetime
+from app.utils.cache_keys import BLOGS_LIST_TAG
+from app.utils.helpers import response_datetime, set_last_modified
 
 router = APIRouter(prefix="/blogs", tags=["📝 Blogs"])
 
 logger = get_logger(__name__)
 
+# Published posts are public; clients revalidate with the ETag after a minute
+BLOGS_CACHE_CONTROL = "public, max-age=60"
+
 
 @dataclass(frozen=True)
 class BlogOpsDeps:
@@ -358,6 +366,9 @@ async def delete_cache_keys(
     """
     Delete cache keys for a blog.
 
+    Detail entries are deleted by slug; every list, author and tag search page
+    is invalidated at once through the blogs list tag.
+
     Parameters
     ----------
     existing : BlogDB
@@ -368,44 +379,12 @@ async def delete_cache_keys(
         Request object.
 
     """
-    keys: list[str] = []
-    keys.extend(
-        [
-            blog_slug_key(existing.slug),
-            blogs_by_author_key(existing.author_id, PaginationQuery(skip=0, limit=10)),
-            blogs_list_key(
-                BlogListQuery(
-                    skip=0,
-                    limit=10,
-                    status_filter=cast(
-                        Literal["draft", "published", "archived"] | None,
-                        existing.status,
-                    ),
-                ),
-            ),
-            blogs_search_tags_key(existing.tags, PaginationQuery(skip=0, limit=10)),
-        ],
-    )
-    if db_blog:
-        keys.extend(
-            [
-                blog_slug_key(db_blog.slug),
-                blogs_by_author_key(db_blog.author_id, PaginationQuery(skip=0, limit=10)),
-                blogs_list_key(
-                    BlogListQuery(
-                        skip=0,
-                        limit=10,
-                        status_filter=cast(
-                            Literal["draft", "published", "archived"] | None,
-                            db_blog.status,
-                        ),
-                    ),
-                ),
-                blogs_search_tags_key(db_blog.tags, PaginationQuery(skip=0, limit=10)),
-            ],
-        )
-    if keys:
-        await get_cache_manager(request).delete(*keys, namespace="blogs")
+    keys = [blog_slug_key(existing.slug)]
+    if db_blog and db_blog.slug != existing.slug:
+        keys.append(blog_slug_key(db_blog.slug))
+    cache_manager = get_cache_manager(request)
+    await cache_manager.delete(*keys, namespace="blogs")
+    await cache_manager.invalidate_tags(BLOGS_LIST_TAG)
 
 
 # =============================================================================
@@ -478,15 +457,9 @@ async def delete_cache_keys(
 @timed("/blogs/create")
 @limiter.limit(lambda key: "10/minute" if "apikey" in key else "2/minute")
 @cache_busting(
-    key_builder=lambda blog, **kw: [
-        blog_slug_key(blog.slug),
-        blogs_list_key(
-            BlogListQuery(skip=0, limit=10, status_filter=blog.status, author_id=blog.author_id),
-        ),
-        blogs_by_author_key(blog.author_id, PaginationQuery(skip=0, limit=10)),
-        blogs_search_tags_key(blog.tags, PaginationQuery(skip=0, limit=10)),
-    ],
+    key_builder=lambda blog, **kw: [blog_slug_key(blog.slug)],
     namespace="blogs",
+    tags=[BLOGS_LIST_TAG],
 )
 async def create_blog(
     request: Request,
@@ -664,6 +637,9 @@ async def get_blog(
     namespace="blogs",
     key_builder=lambda **kw: blog_slug_key(kw["slug"]),
     response_model=BlogResponse,
+    prerender=True,
+    cache_control=BLOGS_CACHE_CONTROL,
+    cache_not_found=True,
 )
 async def get_blog_by_slug(
     request: Request,
@@ -698,6 +674,7 @@ async def get_blog_by_slug(
     """
     if not (db_blog := await repo.get_by_slug(slug)):
         _404_not_found(slug, by="slug")
+    set_last_modified(response, db_blog)
     return cast(BlogResponse, _validate_blog_response(BlogResponse, db_blog))
 
 
@@ -741,6 +718,11 @@ async def get_blog_by_slug(
     ttl=3600,
     namespace="blogs",
     key_builder=lambda **kw: blogs_list_key(kw["query"]),
+    tags=[BLOGS_LIST_TAG],
+    stale_ttl=300,
+    beta=1.0,
+    prerender=True,
+    cache_control=BLOGS_CACHE_CONTROL,
 )
 async def get_blogs(
     request: Request,
@@ -774,6 +756,7 @@ async def get_blogs(
         status=query.status_filter,
         author_id=query.author_id,
     )
+    set_last_modified(response, *db_blogs)
     return [
         cast(BlogListResponse, _validate_blog_response(BlogListResponse, blog)) for blog in db_blogs
     ]
@@ -819,6 +802,9 @@ async def get_blogs(
     ttl=3600,
     namespace="blogs",
     key_builder=lambda **kw: blogs_by_author_key(kw["author_id"], kw["pagination"]),
+    tags=[BLOGS_LIST_TAG],
+    prerender=True,
+    cache_control=BLOGS_CACHE_CONTROL,
 )
 async def get_blogs_by_author(
     request: Request,
@@ -854,6 +840,7 @@ async def get_blogs_by_author(
         skip=pagination.skip,
         limit=pagination.limit,
     )
+    set_last_modified(response, *db_blogs)
     return [
         cast(BlogListResponse, _validate_blog_response(BlogListResponse, blog)) for blog in db_blogs
     ]
@@ -899,6 +886,9 @@ async def get_blogs_by_author(
     ttl=3600,
     namespace="blogs",
     key_builder=lambda **kw: blogs_search_tags_key(kw["tags"], kw["pagination"]),
+    tags=[BLOGS_LIST_TAG],
+    prerender=True,
+    cache_control=BLOGS_CACHE_CONTROL,
 )
 async def search_blogs_by_tags(
     request: Request,
@@ -934,6 +924,7 @@ async def search_blogs_by_tags(
         skip=pagination.skip,
         limit=pagination.limit,
     )
+    set_last_modified(response, *db_blogs)
     return [
         cast(BlogListResponse, _validate_blog_response(BlogListResponse, blog)) for blog in db_blogs
     ]
@@ -985,12 +976,6 @@ async def search_blogs_by_tags(
 )
 @timed("/blogs/update")
 @limiter.limit(lambda key: "20/minute" if "apikey" in key else "5/minute")
-@cache_busting(
-    key_builder=lambda deps, **kw: [
-        blogs_list_key(BlogListQuery(skip=0, limit=10)),
-    ],
-    namespace="blogs",
-)
 async def update_blog(
     request: Request,
     response: Response,
@@ -1068,12 +1053,6 @@ async def update_blog(
 )
 @timed("/blogs/delete")
 @limiter.limit(lambda key: "10/minute" if "apikey" in key else "2/minute")
-@cache_busting(
-    key_builder=lambda *args, **kwargs: [
-        blogs_list_key(BlogListQuery(skip=0, limit=10)),
-    ],
-    namespace="blogs",
-)
 async def delete_blog(
     request: Request,
     response: Response,
@@ -1127,7 +1106,10 @@ async def delete_blog(
     "/bust-list",
     response_class=ORJSONResponse,
     summary="Bust blogs list cache page",
-    description="Invalidate cached blogs list page for given filters and pagination.",
+    description=(
+        "Invalidate every cached blogs list page at once; "
+        "filters and pagination are accepted for compatibility."
+    ),
     responses={
         200: {
             "content": {"application/json": {"example": {"status": "success"}}},
@@ -1141,10 +1123,7 @@ async def delete_blog(
 )
 @timed("/blogs/bust-list")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda **kw: [blogs_list_key(kw["query"])],
-    namespace="blogs",
-)
+@cache_busting(tags=[BLOGS_LIST_TAG])
 async def bust_blogs_list(
     request: Request,
     response: Response,
@@ -1235,7 +1214,10 @@ async def bust_blog_by_slug(
     "/bust-by-author",
     response_class=ORJSONResponse,
     summary="Bust cached blogs by author",
-    description="Invalidate cached blogs listing for a given author and pagination.",
+    description=(
+        "Invalidate every cached blogs list page at once; "
+        "author and pagination are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1255,12 +1237,7 @@ async def bust_blog_by_slug(
 )
 @timed("/blogs/bust-by-author")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda author_id, pagination, **kw: [
-        blogs_by_author_key(author_id, pagination),
-    ],
-    namespace="blogs",
-)
+@cache_busting(tags=[BLOGS_LIST_TAG])
 async def bust_blogs_by_author(
     request: Request,
     response: Response,
@@ -1297,7 +1274,10 @@ async def bust_blogs_by_author(
     "/bust-by-tags",
     response_class=ORJSONResponse,
     summary="Bust cached blogs by tags",
-    description="Invalidate cached blogs search results for given tags and pagination.",
+    description=(
+        "Invalidate every cached blogs list page at once; "
+        "tags and pagination are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1317,12 +1297,7 @@ async def bust_blogs_by_author(
 )
 @timed("/blogs/bust-by-tags")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda tags, pagination, **kw: [
-        blogs_search_tags_key(tags, pagination),
-    ],
-    namespace="blogs",
-)
+@cache_busting(tags=[BLOGS_LIST_TAG])
 async def bust_blogs_by_tags(
     request: Request,
     response: Response,
@@ -1359,7 +1334,9 @@ async def bust_blogs_by_tags(
     "/bust-list-multi",
     response_class=ORJSONResponse,
     summary="Bust multiple blogs list cache pages",
-    description="Invalidate cached blogs list pages across multiple `limit` values.",
+    description=(
+        "Invalidate every cached blogs list page at once; `limits` are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1379,20 +1356,7 @@ async def bust_blogs_by_tags(
 )
 @timed("/blogs/bust-list-multi")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda query, limits, **kw: [
-        blogs_list_key(
-            BlogListQuery(
-                skip=query.skip,
-                limit=limit,
-                status_filter=query.status_filter,
-                author_id=query.author_id,
-            ),
-        )
-        for limit in limits
-    ],
-    namespace="blogs",
-)
+@cache_busting(tags=[BLOGS_LIST_TAG])
 async def bust_blogs_list_multi(
     request: Request,
     response: Response,
@@ -1429,7 +1393,10 @@ async def bust_blogs_list_multi(
     "/bust-list-grid",
     response_class=ORJSONResponse,
     summary="Bust blogs list pages across limits and skips",
-    description="Invalidate cached blogs list pages across multiple `limit` and `skip` values.",
+    description=(
+        "Invalidate every cached blogs list page at once; "
+        "`limit` and `skip` values are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1449,21 +1416,7 @@ async def bust_blogs_list_multi(
 )
 @timed("/blogs/bust-list-grid")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda query, grid_query, **kw: [
-        blogs_list_key(
-            BlogListQuery(
-                skip=s,
-                limit=limit_value,
-                status_filter=query.status_filter,
-                author_id=query.author_id,
-            ),
-        )
-        for limit_value in grid_query.limits
-        for s in grid_query.skips
-    ],
-    namespace="blogs",
-)
+@cache_busting(tags=[BLOGS_LIST_TAG])
 async def bust_blogs_list_grid(
     request: Request,
     response: Response,
@@ -1901,3 +1854,69 @@ async def delete_blog_media(
     await _cleanup_media(folder, deps.repo, deps.blog_id, media_id)
 
     return ORJSONResponse(content={"status": f"{folder} deleted"})
+
+
+# --- Cache warm-up ---
+async def _blog_list_warmup_calls(
+    session: AsyncSession,
+    config: CacheConfig,
+) -> list[dict[str, Any]]:
+    """
+    Build the `get_blogs` calls for the first pages of the default listing.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Session of the warm-up lookup.
+    config : CacheConfig
+        Cache configuration with the number of pages to warm.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Keyword arguments of one call per page.
+
+    """
+    page_size = BlogListQuery.limit
+    return [
+        {
+            "request": None,
+            "response": Response(),
+            "repo": BlogRepository(session),
+            "query": BlogListQuery(skip=page * page_size),
+        }
+        for page in range(config.warmup_blog_pages)
+    ]
+
+
+async def _top_blog_warmup_calls(
+    session: AsyncSession,
+    config: CacheConfig,
+) -> list[dict[str, Any]]:
+    """
+    Build the `get_blog_by_slug` calls for the most viewed blogs.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Session of the warm-up lookup.
+    config : CacheConfig
+        Cache configuration with the number of blogs to warm.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Keyword arguments of one call per slug.
+
+    """
+    repo = BlogRepository(session)
+    return [
+        {"request": None, "response": Response(), "slug": slug, "repo": repo}
+        for slug in await repo.get_most_viewed_slugs(config.warmup_top_blogs)
+    ]
+
+
+BLOG_WARMUP_ENTRIES = (
+    WarmupEntry("blogs list pages", get_blogs.warm, _blog_list_warmup_calls),
+    WarmupEntry("most viewed blogs", get_blog_by_slug.warm, _top_blog_warmup_calls),
+)
@@ -40,7 +40,28 @@ router = APIRouter(prefix="/cache", tags=["🧰 Cache"])
         200: {
             "content": {
                 "application/json": {
-                    "example": {"status": "success", "data": {"hits": 10, "misses": 2}},
+                    "example": {
+                        "status": "success",
+                        "data": {"hits": 10, "misses": 2},
+                        "telemetry": {
+                            "sample_rate": 0.1,
+                            "hot_keys": [
+                                {"key": "cache:blogs:blog_by_slug_bali", "reads": 40, "error": 0},
+                            ],
+                            "largest_keys": [
+                                {"key": "cache:blogs:blogs_all_0_10_any_any", "size_bytes": 5120},
+                            ],
+                            "namespaces": {
+                                "blogs": {
+                                    "hits": 10,
+                                    "misses": 2,
+                                    "bytes_read": 51200,
+                                    "bytes_written": 10240,
+                                    "hit_rate": "83.33%",
+                                },
+                            },
+                        },
+                    },
                 },
             },
         },
@@ -81,14 +102,20 @@ async def get_cache_stats(
     Returns
     -------
     ORJSONResponse
-        Cache statistics payload.
+        Cache statistics payload, with the most read keys, the largest values
+        and per-namespace counters when telemetry is enabled.
 
     Notes
     -----
-    Rate limited to 10 requests per minute.
+    Rate limited to 10 requests per minute. Hot-key read counts are estimated
+    from a sample of reads; ``error`` bounds how much a count may be overstated.
     """
     stats = manager.get_statistics()
-    response = CacheStatsResponse(status="success", data=stats)
+    response = CacheStatsResponse(
+        status="success",
+        data=stats,
+        telemetry=manager.get_telemetry(),
+    )
     return ORJSONResponse(content=response.model_dump())
 
 
@@ -288,9 +315,13 @@ async def clear_cache(
 
     Notes
     -----
-    Rate limited to 2 requests per hour.
+    Rate limited to 2 requests per hour. When cache warming is enabled, a
+    warm-up pass starts in the background once the cache is cleared.
     """
     await manager.clear()
+    # Refill the hottest entries before the traffic that follows misses them all
+    if cache_warmer := getattr(request.app.state, "cache_warmer", None):
+        cache_warmer.trigger()
     response = CacheClearResponse(status="success", message="Cache cleared successfully")
     return ORJSONResponse(content=response.model_dump())
 
@@ -18,6 +18,7 @@ from starlette.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from app.decorators.caching import cache_busting, cached
 from app.dependencies import ReviewRepoDep, UserDBDep, check_owner_or_admin
 from app.errors.upload import (
     ImageProcessingError,
@@ -38,12 +39,16 @@ from app.schemas.review import (
     ReviewUpdate,
 )
 from app.services import MediaService
-from app.utils.helpers import response_datetime
+from app.utils.cache_keys import REVIEWS_LIST_TAG, review_id_key, reviews_list_key
+from app.utils.helpers import response_datetime, set_last_modified
 
 router = APIRouter(prefix="/reviews", tags=["⭐ Reviews"])
 
 logger = get_logger(__name__)
 
+# Reviews are public; clients revalidate with the ETag after a minute
+REVIEWS_CACHE_CONTROL = "public, max-age=60"
+
 
 @dataclass(frozen=True)
 class ReviewOpsDeps:
@@ -156,6 +161,7 @@ def _validate_review_response(
     operation_id="reviews_create",
 )
 @limiter.limit("10/minute")
+@cache_busting(tags=[REVIEWS_LIST_TAG])
 async def create_review(
     request: Request,
     response: Response,
@@ -216,6 +222,14 @@ async def create_review(
     operation_id="reviews_list",
 )
 @limiter.limit("30/minute")
+@cached(
+    ttl=600,
+    namespace="reviews",
+    key_builder=lambda deps, **kw: reviews_list_key(deps.item_id, deps.skip, deps.limit),
+    tags=[REVIEWS_LIST_TAG],
+    prerender=True,
+    cache_control=REVIEWS_CACHE_CONTROL,
+)
 async def list_reviews(
     request: Request,
     response: Response,
@@ -246,6 +260,7 @@ async def list_reviews(
     else:
         reviews = await repo.get_all(skip=deps.skip, limit=deps.limit)
 
+    set_last_modified(response, *reviews)
     return [
         cast(ReviewListResponse, _validate_review_response(ReviewListResponse, r)) for r in reviews
     ]
@@ -279,6 +294,14 @@ async def list_reviews(
     operation_id="reviews_get",
 )
 @limiter.limit("60/minute")
+@cached(
+    ttl=600,
+    namespace="reviews",
+    key_builder=lambda **kw: review_id_key(kw["review_id"]),
+    prerender=True,
+    cache_control=REVIEWS_CACHE_CONTROL,
+    cache_not_found=True,
+)
 async def get_review(
     request: Request,
     response: Response,
@@ -313,6 +336,7 @@ async def get_review(
     if not db_review:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Review not found")
 
+    set_last_modified(response, db_review)
     return cast(ReviewResponse, _validate_review_response(ReviewResponse, db_review))
 
 
@@ -344,6 +368,11 @@ async def get_review(
     operation_id="reviews_update",
 )
 @limiter.limit("10/minute")
+@cache_busting(
+    key_builder=lambda review_id, **kw: [review_id_key(review_id)],
+    namespace="reviews",
+    tags=[REVIEWS_LIST_TAG],
+)
 async def update_review(
     request: Request,
     response: Response,
@@ -437,6 +466,11 @@ async def update_review(
     operation_id="reviews_delete",
 )
 @limiter.limit("5/minute")
+@cache_busting(
+    key_builder=lambda review_id, **kw: [review_id_key(review_id)],
+    namespace="reviews",
+    tags=[REVIEWS_LIST_TAG],
+)
 async def delete_review(
     request: Request,
     response: Response,
@@ -610,6 +644,11 @@ async def _remove_image(review_id: UUID, media_id: str, repo: ReviewRepoDep) ->
     summary="Upload an image to a review",
 )
 @limiter.limit("10/minute")
+@cache_busting(
+    key_builder=lambda review_id, **kw: [review_id_key(review_id)],
+    namespace="reviews",
+    tags=[REVIEWS_LIST_TAG],
+)
 async def upload_review_image(
     request: Request,
     response: Response,
@@ -662,6 +701,11 @@ async def upload_review_image(
     response_class=ORJSONResponse,
 )
 @limiter.limit("10/minute")
+@cache_busting(
+    key_builder=lambda review_id, **kw: [review_id_key(review_id)],
+    namespace="reviews",
+    tags=[REVIEWS_LIST_TAG],
+)
 async def delete_review_image(
     request: Request,
     response: Response,
@@ -30,11 +30,12 @@ authenticated/identified clients.
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, UploadFile
 from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 from starlette.status import (
     HTTP_200_OK,
@@ -48,6 +49,7 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
+from app.configs.cache import CacheConfig
 from app.decorators.caching import cache_busting, cached, get_cache_manager
 from app.decorators.metrics import timed
 from app.dependencies import (
@@ -69,8 +71,10 @@ from app.errors.upload import (
     UnsupportedImageTypeError,
 )
 from app.logging import get_logger
+from app.managers.cache_warmer import WarmupEntry
 from app.managers.rate_limiter import limiter
 from app.models import UserDB
+from app.repositories import UserRepository
 from app.repositories.base import CreateUpdate
 from app.schemas import (
     TestimonialUpdate,
@@ -81,12 +85,16 @@ from app.schemas import (
 )
 from app.services.geo_timezone import detect_timezone_by_ip
 from app.services.profile_picture import ProfilePictureService
-from app.utils.cache_keys import user_id_key, username_key, users_list_key
+from app.utils.cache_keys import USERS_LIST_TAG, user_id_key, username_key, users_list_key
+from app.utils.helpers import set_last_modified
 
 router = APIRouter(prefix="/users", tags=["👤 Users"])
 
 logger = get_logger(__name__)
 
+# Profiles include contact details: never stored by shared caches, always revalidated
+USERS_CACHE_CONTROL = "private, no-cache"
+
 
 @dataclass(frozen=True)
 class UserOpsDeps:
@@ -216,12 +224,9 @@ async def _invalidate_user_cache(request: Request, user_id: UUID, username: str)
     username : str
         User's username.
     """
-    await get_cache_manager(request).delete(
-        user_id_key(user_id),
-        username_key(username),
-        users_list_key(0, 10),
-        namespace="users",
-    )
+    cache_manager = get_cache_manager(request)
+    await cache_manager.delete(user_id_key(user_id), username_key(username), namespace="users")
+    await cache_manager.invalidate_tags(USERS_LIST_TAG)
 
 
 def _success_response(message: str = "success") -> ORJSONResponse:
@@ -339,10 +344,7 @@ class UserCreateDeps:
 )
 @timed("/users/create")
 @limiter.limit(lambda key: "15/hour" if "apikey" in key else "5/hour")
-@cache_busting(
-    key_builder=lambda **kw: [users_list_key(0, 10)],
-    namespace="users",
-)
+@cache_busting(tags=[USERS_LIST_TAG])
 async def create_user(
     request: Request,
     response: Response,
@@ -443,6 +445,9 @@ async def create_user(
     ttl=3600,
     namespace="users",
     key_builder=lambda **kw: users_list_key(kw.get("skip", 0), kw.get("limit", 10)),
+    tags=[USERS_LIST_TAG],
+    prerender=True,
+    cache_control=USERS_CACHE_CONTROL,
 )
 async def get_users(
     request: Request,
@@ -477,6 +482,7 @@ async def get_users(
     """
     if not (db_users := await repo.get_all(skip=skip, limit=limit)):
         return "No users found"
+    set_last_modified(response, *db_users)
     return [validate_user_response(user) for user in db_users]
 
 
@@ -520,6 +526,9 @@ async def get_users(
     namespace="users",
     key_builder=lambda **kw: user_id_key(kw["user_id"]),
     response_model=UserResponse,
+    prerender=True,
+    cache_control=USERS_CACHE_CONTROL,
+    cache_not_found=True,
 )
 async def get_user(
     request: Request,
@@ -552,6 +561,7 @@ async def get_user(
         If user not found.
     """
     db_user = await get_user_or_404(repo, user_id)
+    set_last_modified(response, db_user)
     return validate_user_response(db_user)
 
 
@@ -597,6 +607,9 @@ async def get_user(
     namespace="users",
     key_builder=lambda **kw: username_key(kw["username"]),
     response_model=UserResponse,
+    prerender=True,
+    cache_control=USERS_CACHE_CONTROL,
+    cache_not_found=True,
 )
 async def get_user_by_username(
     request: Request,
@@ -634,6 +647,7 @@ async def get_user_by_username(
             status_code=HTTP_404_NOT_FOUND,
             detail=f"User with username '{username}' not found",
         )
+    set_last_modified(response, db_user)
     return validate_user_response(db_user)
 
 
@@ -689,8 +703,9 @@ class AuthDeps:
 @timed("/users/update")
 @limiter.limit(lambda key: "20/minute" if "apikey" in key else "5/minute")
 @cache_busting(
-    key_builder=lambda deps, **kw: [user_id_key(deps.user_id), users_list_key(0, 10)],
+    key_builder=lambda deps, **kw: [user_id_key(deps.user_id)],
     namespace="users",
+    tags=[USERS_LIST_TAG],
 )
 async def update_user(
     request: Request,
@@ -802,8 +817,9 @@ async def update_user(
 @timed("/users/delete")
 @limiter.limit(lambda key: "10/minute" if "apikey" in key else "2/minute")
 @cache_busting(
-    key_builder=lambda deps, **kw: [user_id_key(deps.user_id), users_list_key(0, 10)],
+    key_builder=lambda deps, **kw: [user_id_key(deps.user_id)],
     namespace="users",
+    tags=[USERS_LIST_TAG],
 )
 async def delete_user(
     request: Request,
@@ -923,8 +939,9 @@ async def delete_user(
 @timed("/users/{user_id}/profile-picture")
 @limiter.limit("10/hour")
 @cache_busting(
-    key_builder=lambda deps, **kw: [user_id_key(deps.user_id), users_list_key(0, 10)],
+    key_builder=lambda deps, **kw: [user_id_key(deps.user_id)],
     namespace="users",
+    tags=[USERS_LIST_TAG],
 )
 async def upload_profile_picture(
     request: Request,
@@ -1014,8 +1031,9 @@ async def upload_profile_picture(
 @timed("/users/{user_id}/profile-picture")
 @limiter.limit("10/hour")
 @cache_busting(
-    key_builder=lambda deps, **kw: [user_id_key(deps.user_id), users_list_key(0, 10)],
+    key_builder=lambda deps, **kw: [user_id_key(deps.user_id)],
     namespace="users",
+    tags=[USERS_LIST_TAG],
 )
 async def delete_profile_picture(
     request: Request,
@@ -1216,7 +1234,10 @@ async def delete_testimonial(
     "/bust-list",
     response_class=ORJSONResponse,
     summary="Bust users list cache page",
-    description="Invalidate cached users list page for given `skip` and `limit`.",
+    description=(
+        "Invalidate every cached users list page at once; "
+        "`skip` and `limit` are accepted for compatibility."
+    ),
     responses={
         200: {
             "content": {"application/json": {"example": {"status": "success"}}},
@@ -1230,10 +1251,7 @@ async def delete_testimonial(
 )
 @timed("/users/bust-list")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda **kw: [users_list_key(kw.get("skip", 0), kw.get("limit", 10))],
-    namespace="users",
-)
+@cache_busting(tags=[USERS_LIST_TAG])
 async def bust_users_list(
     request: Request,
     response: Response,
@@ -1381,7 +1399,9 @@ async def bust_user_by_username(
     "/bust-list-multi",
     response_class=ORJSONResponse,
     summary="Bust multiple users list cache pages",
-    description="Invalidate cached users list pages across multiple `limit` values.",
+    description=(
+        "Invalidate every cached users list page at once; `limits` are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1401,12 +1421,7 @@ async def bust_user_by_username(
 )
 @timed("/users/bust-list-multi")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda query, limits, **kw: [
-        users_list_key(query.skip, limit_value) for limit_value in limits
-    ],
-    namespace="users",
-)
+@cache_busting(tags=[USERS_LIST_TAG])
 async def bust_users_list_multi(
     request: Request,
     response: Response,
@@ -1447,7 +1462,10 @@ async def bust_users_list_multi(
     "/bust-list-grid",
     response_class=ORJSONResponse,
     summary="Bust users list pages across limits and skips",
-    description="Invalidate cached users list pages across multiple `limit` and `skip` values.",
+    description=(
+        "Invalidate every cached users list page at once; "
+        "`skip` and `limit` values are accepted for compatibility."
+    ),
     responses={
         200: {"content": {"application/json": {"example": {"status": "success"}}}},
         403: {
@@ -1467,10 +1485,7 @@ async def bust_users_list_multi(
 )
 @timed("/users/bust-list-grid")
 @limiter.limit("10/minute")
-@cache_busting(
-    key_builder=lambda skip, limit, **kw: [users_list_key(s, lim) for lim in limit for s in skip],
-    namespace="users",
-)
+@cache_busting(tags=[USERS_LIST_TAG])
 async def bust_users_list_grid(
     request: Request,
     response: Response,
@@ -1550,3 +1565,30 @@ async def bust_users_all(
     """
     await get_cache_manager(request).clear(namespace="users")
     return _success_response("cleared")
+
+
+# --- Cache warm-up ---
+async def _user_list_warmup_calls(
+    session: AsyncSession,
+    config: CacheConfig,  # noqa: ARG001
+) -> list[dict[str, Any]]:
+    """
+    Build the `get_users` call for the first page of the listing.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Session of the warm-up lookup.
+    config : CacheConfig
+        Cache configuration (unused; only page 0 is warmed).
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Keyword arguments of the call.
+
+    """
+    return [{"request": None, "response": Response(), "repo": UserRepository(session)}]
+
+
+USER_WARMUP_ENTRIES = (WarmupEntry("users list", get_users.warm, _user_list_warmup_calls),)
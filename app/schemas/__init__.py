@@ -11,6 +11,7 @@ from app.schemas.cache import (
     CacheResetStatsResponse,
     CacheStatisticsData,
     CacheStatsResponse,
+    CacheTelemetryData,
     CacheToggleResponse,
     HealthCheckResponse,
 )
@@ -36,6 +37,7 @@ __all__ = [
     "CacheResetStatsResponse",
     "CacheStatisticsData",
     "CacheStatsResponse",
+    "CacheTelemetryData",
     "CacheToggleResponse",
     "DateTimeResponse",
     "EmailInquiry",
@@ -14,6 +14,8 @@ class CacheStatisticsData(BaseModel):
     deletes: int
     evictions: int
     errors: int
+    coalesced_waits: int = 0
+    negative_hits: int = 0
     total_bytes_written: int
     total_bytes_read: int
     hit_rate: str
@@ -83,6 +85,48 @@ class CacheHealthResponse(BaseModel):
     error: str | None = None
 
 
+class HotKeyData(BaseModel):
+    """Estimated read count of a frequently read cache key."""
+
+    model_config = ConfigDict(ser_json_timedelta="iso8601", ser_json_bytes="utf8")
+
+    key: str
+    reads: int = Field(description="Estimated reads, scaled up from the sample")
+    error: int = Field(description="Upper bound on the overestimate of reads")
+
+
+class LargeKeyData(BaseModel):
+    """Size of one of the largest values written to the cache."""
+
+    model_config = ConfigDict(ser_json_timedelta="iso8601", ser_json_bytes="utf8")
+
+    key: str
+    size_bytes: int
+
+
+class NamespaceStatisticsData(BaseModel):
+    """Per-namespace cache statistics model."""
+
+    model_config = ConfigDict(ser_json_timedelta="iso8601", ser_json_bytes="utf8")
+
+    hits: int
+    misses: int
+    bytes_read: int
+    bytes_written: int
+    hit_rate: str
+
+
+class CacheTelemetryData(BaseModel):
+    """Hot-key, key-size and per-namespace cache telemetry model."""
+
+    model_config = ConfigDict(ser_json_timedelta="iso8601", ser_json_bytes="utf8")
+
+    sample_rate: float
+    hot_keys: list[HotKeyData]
+    largest_keys: list[LargeKeyData]
+    namespaces: dict[str, NamespaceStatisticsData]
+
+
 class CacheStatsResponse(BaseModel):
     """Cache statistics response model."""
 
@@ -90,6 +134,7 @@ class CacheStatsResponse(BaseModel):
 
     status: str
     data: CacheStatisticsData
+    telemetry: CacheTelemetryData | None = None
 
 
 class CacheClearResponse(BaseModel):
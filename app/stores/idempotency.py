@@ -7,7 +7,8 @@ TOCTOU race condition present in a naive GET → SET two-step approach.
 
 Key schema
 ----------
-Redis key : ``idemp:{scope}:{idempotency_key}``
+Redis key : ``idemp:{scope}:{idempotency_key}`` — the braces are literal: the
+            scope is a Redis Cluster hash tag
 Value     : JSON-encoded record with fields:
     - status       : "processing" | "completed" | "failed"
     - body_hash    : SHA-256 hex digest of the original request body
@@ -20,6 +21,7 @@ import base64
 import json
 
 from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
 from redis.exceptions import RedisError
 
 from app.interfaces.idempotency_store import CompletionRecord
@@ -43,19 +45,28 @@ return nil
 """
 
 
+def _legacy_key(redis_key: str) -> str:
+    """Map ``idemp:{scope}:key`` to the key format used before hash tags."""
+    return redis_key.replace("{", "", 1).replace("}", "", 1)
+
+
 class RedisIdempotencyStore:
     """
     Redis-backed idempotency store.
 
     Parameters
     ----------
-    redis : Redis
-        An already-connected ``redis.asyncio.Redis`` instance.
+    redis : Redis | RedisCluster
+        An already-connected ``redis.asyncio.Redis`` or ``RedisCluster`` instance.
         Obtained from ``CacheManager.redis_client.client``.
+    legacy_keys : bool
+        Also replay records stored under the key format used before hash tags
+        (``RedisConfig.legacy_idempotency_keys``).
     """
 
-    def __init__(self, redis: Redis) -> None:
+    def __init__(self, redis: Redis | RedisCluster, *, legacy_keys: bool = False) -> None:
         self._redis = redis
+        self._legacy_keys = legacy_keys
         self._acquire_script = self._redis.register_script(_ACQUIRE_SCRIPT)
 
     async def acquire(
@@ -72,6 +83,12 @@ class RedisIdempotencyStore:
         """
         processing_record = json.dumps({"status": "processing", "body_hash": body_hash})
         try:
+            # Records written before the scope became a hash tag are replayed until
+            # they expire; nothing writes those keys anymore, so no race with the
+            # claim below. Remove once no deployment still enables legacy_keys.
+            if self._legacy_keys and (legacy := await self._redis.get(_legacy_key(redis_key))):
+                raw = legacy.decode("utf-8") if isinstance(legacy, bytes) else legacy
+                return json.loads(raw)
             result = await self._acquire_script(
                 keys=[redis_key],
                 args=[processing_record, str(processing_ttl)],
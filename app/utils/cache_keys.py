@@ -8,6 +8,12 @@ entities in the system, ensuring that different parts of the application
 
 from uuid import UUID
 
+# Invalidation tags: each list page is stamped with the tag's generation, so
+# invalidating the tag drops every page regardless of pagination
+BLOGS_LIST_TAG = "blogs:list"
+USERS_LIST_TAG = "users:list"
+REVIEWS_LIST_TAG = "reviews:list"
+
 
 def user_id_key(user_id: UUID) -> str:
     """Generate cache key for user by ID."""
@@ -22,3 +28,13 @@ def username_key(username: str) -> str:
 def users_list_key(skip: int, limit: int) -> str:
     """Generate cache key for users list."""
     return f"users_all_{skip}_{limit}"
+
+
+def review_id_key(review_id: UUID) -> str:
+    """Generate cache key for review by ID."""
+    return f"review_by_id_{review_id}"
+
+
+def reviews_list_key(item_id: UUID | None, skip: int, limit: int) -> str:
+    """Generate cache key for reviews list, optionally filtered by item."""
+    return f"reviews_all_{item_id or 'any'}_{skip}_{limit}"
@@ -3,12 +3,21 @@ Serialization and compression utilities for caching.
 
 Uses orjson for high-performance JSON serialization/deserialization.
 Falls back to standard json if orjson is not available.
+
+Values are stored as binary frames: a short header carrying a format version and
+a codec ID, followed by the (possibly compressed) JSON bytes. Codecs are pluggable
+via ``register_codec``; zstd and lz4 are used when their packages are installed.
+Legacy entries (plain JSON text or the base64 gzip format) remain readable.
 """
 
 from base64 import b64decode, b64encode
+from collections.abc import Callable
+from dataclasses import dataclass
 from gzip import compress as gzip_compress
 from gzip import decompress as gzip_decompress
 from typing import Any
+from zlib import compress as zlib_compress
+from zlib import decompress as zlib_decompress
 
 from pydantic_core import PydanticSerializationError
 
@@ -35,10 +44,98 @@ except ImportError:
 
     _HAS_ORJSON = False
 
+# Optional codecs: zstd is in the standard library from Python 3.14
+try:
+    from compression.zstd import compress as zstd_compress  # type: ignore[import-not-found]
+    from compression.zstd import decompress as zstd_decompress  # type: ignore[import-not-found]
+
+    _HAS_ZSTD = True
+except ImportError:
+    try:
+        from zstandard import compress as zstd_compress  # type: ignore[import-not-found]
+        from zstandard import decompress as zstd_decompress  # type: ignore[import-not-found]
+
+        _HAS_ZSTD = True
+    except ImportError:
+        _HAS_ZSTD = False
+
+try:
+    from lz4.frame import compress as lz4_compress  # type: ignore[import-not-found]
+    from lz4.frame import decompress as lz4_decompress  # type: ignore[import-not-found]
+
+    _HAS_LZ4 = True
+except ImportError:
+    _HAS_LZ4 = False
+
 logger = get_logger(__name__)
 
 COMPRESSION_MARKER = b"\x00GZIP\x00"
 
+# Binary frame header: magic byte, format version, codec ID. 0xFE never occurs in
+# UTF-8, so a frame can't be mistaken for a legacy text entry.
+FRAME_MAGIC = b"\xfe"
+FRAME_VERSION = 1
+FRAME_HEADER_SIZE = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Codec:
+    """A compression codec identified in frame headers by ``codec_id``."""
+
+    codec_id: int
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+_CODECS_BY_NAME: dict[str, Codec] = {}
+_CODECS_BY_ID: dict[int, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """
+    Register a codec for framing.
+
+    Args:
+        codec: Codec to register. Its ID is persisted in stored values and must
+            never be reused for a different algorithm.
+
+    Raises:
+        ValueError: If the ID or name is already taken by another codec.
+    """
+    if not 0 <= codec.codec_id <= 255:  # noqa: PLR2004
+        mssg = f"Codec ID must fit in one byte, got {codec.codec_id}"
+        raise ValueError(mssg)
+    existing = _CODECS_BY_ID.get(codec.codec_id) or _CODECS_BY_NAME.get(codec.name)
+    if existing is not None and existing != codec:
+        mssg = f"Codec {codec.name!r} conflicts with registered codec {existing.name!r}"
+        raise ValueError(mssg)
+    _CODECS_BY_NAME[codec.name] = codec
+    _CODECS_BY_ID[codec.codec_id] = codec
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Look up a registered codec by name.
+
+    Raises:
+        CacheCompressionError: If no codec with that name is available.
+    """
+    try:
+        return _CODECS_BY_NAME[name]
+    except KeyError as e:
+        mssg = f"Cache codec {name!r} is not available"
+        raise CacheCompressionError(mssg) from e
+
+
+NO_CODEC = Codec(0, "none", bytes, bytes)
+register_codec(NO_CODEC)
+register_codec(Codec(1, "zlib", zlib_compress, zlib_decompress))
+if _HAS_ZSTD:
+    register_codec(Codec(2, "zstd", zstd_compress, zstd_decompress))
+if _HAS_LZ4:
+    register_codec(Codec(3, "lz4", lz4_compress, lz4_decompress))
+
 
 def serialize(value: object) -> str:
     """
@@ -73,14 +170,14 @@ def serialize(value: object) -> str:
         raise CacheSerializationError from e
 
 
-def deserialize(value: str) -> dict[str, Any]:
+def deserialize(value: str | bytes) -> dict[str, Any]:
     """
-    Deserialize JSON string to value.
+    Deserialize JSON string or bytes to value.
 
     Uses orjson for better performance when available.
 
     Args:
-        value: JSON string to deserialize.
+        value: JSON string or bytes to deserialize.
 
     Returns:
         Deserialized value.
@@ -158,3 +255,72 @@ def do_compress(data: str, threshold: int) -> bool:
         True if data size exceeds threshold.
     """
     return len(data.encode("utf-8")) > threshold
+
+
+def serialize_bytes(value: object) -> bytes:
+    """
+    Serialize value to JSON bytes without an intermediate string.
+
+    Raises:
+        CacheSerializationError: If serialization fails.
+    """
+    if not _HAS_ORJSON:
+        return serialize(value).encode("utf-8")
+    try:
+        return orjson_dumps(value, default=str, option=OPT_SERIALIZE_NUMPY | OPT_NON_STR_KEYS)
+    except (PydanticSerializationError, TypeError, ValueError) as e:
+        logger.exception("Serialization failed")
+        raise CacheSerializationError from e
+
+
+def encode_frame(data: bytes, codec: Codec = NO_CODEC) -> bytes:
+    """
+    Compress data with codec and prepend the frame header.
+
+    Args:
+        data: Serialized JSON bytes.
+        codec: Codec to apply; ``NO_CODEC`` stores data as is.
+
+    Returns:
+        Framed bytes ready to store.
+
+    Raises:
+        CacheCompressionError: If compression fails.
+    """
+    try:
+        body = codec.compress(data)
+    except Exception as e:
+        logger.exception("Compression failed")
+        raise CacheCompressionError from e
+    return FRAME_MAGIC + bytes((FRAME_VERSION, codec.codec_id)) + body
+
+
+def decode_frame(data: bytes | str) -> bytes:
+    """
+    Decode a stored value back to JSON bytes.
+
+    Handles binary frames as well as legacy entries: plain JSON text and the
+    base64 gzip format produced by ``compress``.
+
+    Raises:
+        CacheDecompressionError: If the frame is unknown or cannot be decompressed.
+    """
+    if isinstance(data, str):
+        return decompress(data).encode("utf-8")
+    if not data.startswith(FRAME_MAGIC):
+        if data.startswith(COMPRESSION_MARKER):
+            return decompress(data.decode("utf-8")).encode("utf-8")
+        return data
+
+    if len(data) < FRAME_HEADER_SIZE or data[1] != FRAME_VERSION:
+        mssg = "Unsupported cache frame version"
+        raise CacheDecompressionError(mssg)
+    codec = _CODECS_BY_ID.get(data[2])
+    if codec is None:
+        mssg = f"Unknown cache codec ID {data[2]}"
+        raise CacheDecompressionError(mssg)
+    try:
+        return codec.decompress(data[FRAME_HEADER_SIZE:])
+    except Exception as e:
+        logger.exception("Decompression failed")
+        raise CacheDecompressionError from e
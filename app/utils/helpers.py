@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from email.utils import format_datetime
 from ipaddress import ip_address
 from time import perf_counter
 from typing import Any
 
-from fastapi import Request
+from fastapi import Request, Response
 
 from app.models.blog import BlogDB
 from app.models.review import ReviewDB
@@ -87,3 +88,21 @@ def response_datetime(
         db_dict["updated_at"] = None
 
     return db_dict
+
+
+def set_last_modified(response: Response, *records: UserDB | BlogDB | ReviewDB) -> None:
+    """
+    Set the Last-Modified header to the latest change among the records.
+
+    Records that were never updated count from their creation time. Nothing is
+    set for an empty result.
+
+    Args:
+        response: Response of the endpoint returning the records.
+        *records: Database models the response body was built from.
+    """
+    changes = [record.updated_at or record.created_at for record in records]
+    if not changes:
+        return
+    latest = max(changed if changed.tzinfo else changed.replace(tzinfo=UTC) for changed in changes)
+    response.headers["Last-Modified"] = format_datetime(latest.astimezone(UTC), usegmt=True)
@@ -0,0 +1,96 @@
+"""
+Benchmark MemoryClient reads under many concurrent readers.
+
+Compares the lock-free read path with reads that take the client lock (the
+previous behaviour), both while idle and while a writer holds the lock across
+an await, as maintenance work does.
+
+Usage:
+    uv run python scripts/bench_memory_client.py
+    uv run python scripts/bench_memory_client.py --readers 1000 --reads 100
+"""
+
+from argparse import ArgumentParser, Namespace
+from asyncio import create_task, gather, sleep
+from asyncio import run as asyncio_run
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from sys import path as sys_path
+from time import perf_counter
+
+try:
+    from app.clients.memory_client import MemoryClient
+except ImportError:
+    # Add project root to path so 'app' module can be found
+    project_root = Path(__file__).resolve().parent.parent
+    sys_path.append(str(project_root))
+    from app.clients.memory_client import MemoryClient
+
+KEYS = 1000
+WRITER_HOLD_SECONDS = 0.001
+
+Reader = Callable[[MemoryClient, str], Awaitable[object]]
+
+
+async def lock_free_read(client: MemoryClient, key: str) -> object:
+    return await client.get(key)
+
+
+async def locked_read(client: MemoryClient, key: str) -> object:
+    async with client._lock:
+        return client._get_internal(key)
+
+
+async def busy_writer(client: MemoryClient, stop: list[bool]) -> None:
+    """Repeatedly hold the lock across an await, like close() or a snapshot would."""
+    while not stop[0]:
+        async with client._lock:
+            await sleep(WRITER_HOLD_SECONDS)
+        await sleep(0)
+
+
+async def run_readers(client: MemoryClient, read: Reader, args: Namespace) -> float:
+    """Run all readers concurrently and return reads per second."""
+
+    async def reader(offset: int) -> None:
+        for i in range(args.reads):
+            await read(client, f"key{(offset + i) % KEYS}")
+            await sleep(0)
+
+    started = perf_counter()
+    await gather(*(reader(n) for n in range(args.readers)))
+    return args.readers * args.reads / (perf_counter() - started)
+
+
+async def bench(read: Reader, args: Namespace, *, with_writer: bool) -> float:
+    client = MemoryClient()
+    for i in range(KEYS):
+        await client.set(f"key{i}", f"value{i}")
+
+    stop = [False]
+    writer = create_task(busy_writer(client, stop)) if with_writer else None
+    rate = await run_readers(client, read, args)
+    if writer is not None:
+        stop[0] = True
+        await writer
+    return rate
+
+
+async def main(args: Namespace) -> None:
+    print(f"{args.readers} concurrent readers x {args.reads} reads each")
+    for with_writer in (False, True):
+        label = "with busy writer" if with_writer else "idle"
+        for name, read in (("locked", locked_read), ("lock-free", lock_free_read)):
+            rate = await bench(read, args, with_writer=with_writer)
+            print(f"  {label:<17} {name:<10} {rate:>12,.0f} reads/s")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=1000)
+    parser.add_argument("--reads", type=int, default=100)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio_run(main(parse_args()))
@@ -40,6 +40,7 @@ def mock_cache_manager() -> MagicMock:
     """Create a mock cache manager."""
     mock = MagicMock()
     mock.delete = AsyncMock()
+    mock.invalidate_tags = AsyncMock()
     mock.get = AsyncMock(return_value=None)
     mock.set = AsyncMock()
     return mock
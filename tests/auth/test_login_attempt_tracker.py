@@ -121,5 +121,27 @@ class TestLoginAttemptTracker:
         attempts_key = login_tracker._get_attempts_key(identifier)
         lockout_key = login_tracker._get_lockout_key(identifier)
 
-        assert attempts_key == f"login:attempts:{identifier}"
-        assert lockout_key == f"login:lockout:{identifier}"
+        assert attempts_key == f"login:attempts:{{{identifier}}}"
+        assert lockout_key == f"login:lockout:{{{identifier}}}"
+
+    @mark.asyncio
+    async def test_legacy_keys_are_honoured(
+        self,
+        login_tracker: LoginAttemptTracker,
+        mock_redis_client: MagicMock,
+    ) -> None:
+        """Test that counts and lockouts stored before the hash-tag keys still apply."""
+        counts = {"login:attempts:testuser": "3"}
+        ttls = {"login:lockout:testuser": 60}
+        mock_redis_client.get = AsyncMock(side_effect=counts.get)
+        mock_redis_client.ttl = AsyncMock(side_effect=lambda key: ttls.get(key, -2))
+
+        assert await login_tracker.get_attempts_count("testuser") == 3
+        assert await login_tracker.is_locked_out("testuser") == (True, 60)
+        await login_tracker.reset_attempts("testuser")
+        mock_redis_client.delete.assert_called_once_with(
+            "login:attempts:{testuser}",
+            "login:lockout:{testuser}",
+            "login:attempts:testuser",
+            "login:lockout:testuser",
+        )
@@ -7,6 +7,7 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.clients.memory_client import MemoryClient
 from app.managers.cache_manager import CacheManager
+from app.utils.cache_serializer import compress
 
 
 @pytest.mark.asyncio
@@ -279,6 +280,22 @@ async def test_build_key_with_namespace(cache_manager: CacheManager) -> None:
     assert cache_manager.cache_config.key_prefix in key
 
 
+@pytest.mark.asyncio
+async def test_build_key_hashes_long_keys(cache_manager: CacheManager) -> None:
+    """Test that overlong keys are stored under a fixed-length digest."""
+    long_key = "blogs:tags:" + ",".join(f"tag{i}" for i in range(100))
+    full_key = cache_manager._build_key(long_key, namespace="blogs")
+
+    assert full_key.startswith(f"{cache_manager.cache_config.key_prefix}:blogs:blogs:tags:")
+    assert len(full_key) < len(long_key)
+    assert full_key == cache_manager._build_key(long_key, namespace="blogs")
+    assert full_key != cache_manager._build_key(long_key + ",tag100", namespace="blogs")
+
+    await cache_manager.set(long_key, "value", namespace="blogs")
+    assert await cache_manager.get(long_key, namespace="blogs") == "value"
+    assert await cache_manager.delete(long_key, namespace="blogs") == 1
+
+
 @pytest.mark.asyncio
 async def test_expire_key(cache_manager: CacheManager) -> None:
     """Test expire sets expiration on a key."""
@@ -370,6 +387,22 @@ async def test_fallback_to_memory(cache_manager: CacheManager) -> None:
     assert isinstance(cache_manager._client, MemoryClient)
 
 
+@pytest.mark.asyncio
+async def test_clear_namespace_in_memory_mode(cache_manager: CacheManager) -> None:
+    """Test that clearing a namespace in memory mode keeps other namespaces."""
+    cache_manager.is_redis_available = False
+    cache_manager._client = cache_manager.memory_client
+    await cache_manager.set("1", {"title": "post"}, namespace="blogs")
+    await cache_manager.set("2", {"title": "post"}, namespace="blogs")
+    await cache_manager.set("1", {"name": "user"}, namespace="users")
+
+    deleted = await cache_manager.clear(namespace="blogs")
+
+    assert deleted == 2
+    assert await cache_manager.get("1", namespace="blogs") is None
+    assert await cache_manager.get("1", namespace="users") == {"name": "user"}
+
+
 @pytest.mark.asyncio
 async def test_disable_redis_when_already_disabled(cache_manager: CacheManager) -> None:
     """Test disable_redis when Redis is already disabled."""
@@ -459,3 +492,58 @@ async def test_disable_and_enable_redis_round_trip(cache_manager: CacheManager)
     await cache_manager.set("memory_key", {"memory": "data"})
     value = await cache_manager.get("memory_key")
     assert value == {"memory": "data"}
+
+
+@pytest.mark.asyncio
+async def test_set_many_and_get_many(cache_manager: CacheManager) -> None:
+    """Test batch set and get with per-item statistics."""
+    large = {"body": "x" * 4096}
+    await cache_manager.set_many(
+        {"a": {"v": 1}, "b": large},
+        ttl=600,
+        namespace="batch",
+        ttls={"a": 60},
+    )
+
+    values = await cache_manager.get_many(["a", "b", "missing"], namespace="batch")
+    assert values == {"a": {"v": 1}, "b": large}
+    assert 0 < await cache_manager.ttl("a", namespace="batch") <= 60
+    assert await cache_manager.ttl("b", namespace="batch") > 60
+
+    stats = cache_manager.get_statistics()
+    assert stats.sets == 2
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_many(cache_manager: CacheManager) -> None:
+    """Test batch delete."""
+    await cache_manager.set_many({"a": 1, "b": 2, "c": 3})
+
+    assert await cache_manager.delete_many(["a", "b"]) == 2
+    assert await cache_manager.get_many(["a", "b", "c"]) == {"c": 3}
+
+
+@pytest.mark.asyncio
+async def test_values_are_stored_as_binary_frames(cache_manager: CacheManager) -> None:
+    """Test that values are framed bytes and only large ones are compressed."""
+    await cache_manager.set("small", {"v": 1})
+    await cache_manager.set("large", {"body": "x" * 4096})
+
+    small = await cache_manager._client.get_bytes("cache:small")
+    large = await cache_manager._client.get_bytes("cache:large")
+    assert small == b"\xfe\x01\x00" + b'{"v":1}'
+    assert large is not None
+    assert large[:3] == b"\xfe\x01\x01"
+    assert len(large) < 4096
+
+
+@pytest.mark.asyncio
+async def test_legacy_string_entries_remain_readable(cache_manager: CacheManager) -> None:
+    """Test that entries written in the old text formats still decode."""
+    await cache_manager._client.set("cache:plain", '{"v":1}')
+    await cache_manager._client.set("cache:gzip", compress('{"v":2}'))
+
+    assert await cache_manager.get("plain") == {"v": 1}
+    assert await cache_manager.get("gzip") == {"v": 2}
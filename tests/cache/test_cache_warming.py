@@ -0,0 +1,173 @@
+"""Tests for warming registered cache entries."""
+
+from asyncio import Event, sleep
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from app.configs.cache import CacheConfig
+from app.managers.cache_warmer import CacheWarmer, WarmupCalls, WarmupEntry
+from app.monitoring.health import CheckStatus, HealthChecker
+from app.routes import WARMUP_ENTRIES
+
+
+@asynccontextmanager
+async def mock_transaction() -> AsyncGenerator[AsyncMock]:
+    """Mock async context manager for database transactions."""
+    yield AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _no_database() -> Generator[None]:
+    with patch("app.managers.cache_warmer.transaction", mock_transaction):
+        yield
+
+
+def make_warmer(entries: list[WarmupEntry], **config: object) -> CacheWarmer:
+    """Create a warmer over a stand-in cache manager with the given warm-up settings."""
+    cache_manager = MagicMock()
+    cache_manager.cache_config = CacheConfig(**config)
+    return CacheWarmer(cache_manager, entries)
+
+
+def calls_for(count: int) -> WarmupCalls:
+    """Build a calls provider returning ``count`` distinct keyword argument sets."""
+
+    async def calls(session: object, config: CacheConfig) -> list[dict[str, Any]]:
+        return [{"page": page} for page in range(count)]
+
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_warm_runs_every_call_with_bounded_concurrency() -> None:
+    """Test that a pass warms every call and never runs more than the limit at once."""
+    running = peak = 0
+    warmed: list[int] = []
+
+    async def warm(cache_manager: object, *, page: int) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await sleep(0.01)
+        warmed.append(page)
+        running -= 1
+
+    warmer = make_warmer(
+        [WarmupEntry("a", warm, calls_for(5)), WarmupEntry("b", warm, calls_for(5))],
+        warmup_concurrency=3,
+    )
+
+    assert await warmer.warm() == 10
+    assert sorted(warmed) == sorted([*range(5), *range(5)])
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_are_isolated() -> None:
+    """Test that failing calls and providers are skipped without stopping the pass."""
+
+    async def warm(cache_manager: object, *, page: int) -> None:
+        if page == 1:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+    async def broken_calls(session: object, config: CacheConfig) -> list[dict[str, Any]]:
+        msg = "database down"
+        raise ConnectionError(msg)
+
+    warmer = make_warmer(
+        [WarmupEntry("pages", warm, calls_for(3)), WarmupEntry("broken", warm, broken_calls)],
+    )
+
+    assert await warmer.warm() == 2
+
+
+@pytest.mark.asyncio
+async def test_ready_after_first_pass_or_timeout() -> None:
+    """Test that readiness waits for the first pass, but no longer than the timeout."""
+    release = Event()
+
+    async def warm(cache_manager: object, **kwargs: object) -> None:
+        await release.wait()
+
+    warmer = make_warmer(
+        [WarmupEntry("slow", warm, calls_for(1))],
+        warmup_timeout=0.05,
+        warmup_interval=0,
+    )
+    app = FastAPI()
+    app.state.cache_warmer = warmer
+    checker = HealthChecker(app=app)
+
+    warmer.start()
+    await sleep(0)
+    assert not warmer.ready
+    assert checker._check_cache_warmup().status == CheckStatus.FAIL
+
+    await sleep(0.1)
+    assert warmer.ready
+    assert checker._check_cache_warmup().status == CheckStatus.PASS
+    # The timed-out pass keeps running in the background
+    assert not warmer._pass.done()
+
+    release.set()
+    await warmer.stop()
+
+
+@pytest.mark.asyncio
+async def test_trigger_reuses_running_pass() -> None:
+    """Test that triggering during a pass returns it instead of starting another."""
+    calls = 0
+
+    async def warm(cache_manager: object, **kwargs: object) -> None:
+        nonlocal calls
+        calls += 1
+        await sleep(0.01)
+
+    warmer = make_warmer([WarmupEntry("pages", warm, calls_for(1))])
+
+    first = warmer.trigger()
+    assert warmer.trigger() is first
+    assert await first == 1
+    assert await warmer.trigger() == 1
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_periodic_passes_until_stopped() -> None:
+    """Test that the warmer re-warms every interval and stop cancels it."""
+    calls = 0
+
+    async def warm(cache_manager: object, **kwargs: object) -> None:
+        nonlocal calls
+        calls += 1
+
+    warmer = make_warmer([WarmupEntry("pages", warm, calls_for(1))], warmup_interval=0.02)
+
+    warmer.start()
+    await sleep(0.09)
+    await warmer.stop()
+
+    assert calls >= 3
+    settled = calls
+    await sleep(0.05)
+    assert calls == settled
+
+
+@pytest.mark.asyncio
+async def test_registry_warms_blog_pages_and_users() -> None:
+    """Test that the registered blog list calls cover the first pages and users page 0."""
+    entries = {entry.name: entry for entry in WARMUP_ENTRIES}
+    config = CacheConfig(warmup_blog_pages=3)
+
+    blog_calls = await entries["blogs list pages"].calls(AsyncMock(), config)
+    assert [call["query"].skip for call in blog_calls] == [0, 10, 20]
+    assert len({id(call["response"]) for call in blog_calls}) == 3
+
+    (user_call,) = await entries["users list"].calls(AsyncMock(), config)
+    assert "skip" not in user_call
@@ -0,0 +1,88 @@
+"""Tests for per-worker request coalescing in CacheManager."""
+
+from asyncio import Event, create_task, gather, sleep
+
+import pytest
+
+from app.managers.cache_manager import CacheManager
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call(cache_manager: CacheManager) -> None:
+    """Test that concurrent get_or_set misses run the callback once."""
+    calls = 0
+
+    async def callback() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await sleep(0.05)
+        return {"v": 1}
+
+    results = await gather(*(cache_manager.get_or_set("key", callback, ttl=60) for _ in range(10)))
+
+    assert results == [{"v": 1}] * 10
+    assert calls == 1
+    assert cache_manager.get_statistics().coalesced_waits == 9
+    assert cache_manager._flights == {}
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_the_leader_result(cache_manager: CacheManager) -> None:
+    """Test that waiters get the leader's value without reading the cache."""
+    release = Event()
+
+    async def compute() -> str:
+        await release.wait()
+        return "computed"
+
+    leader = create_task(cache_manager.coalesce("key", compute))
+    await sleep(0)
+    waiter = create_task(cache_manager.coalesce("key", compute))
+    await sleep(0)
+    release.set()
+
+    assert await gather(leader, waiter) == ["computed", "computed"]
+    # compute stores nothing, so the waiter could only have got it from the leader
+    assert await cache_manager.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_leader_error_is_shared(cache_manager: CacheManager) -> None:
+    """Test that waiters see the leader's exception instead of recomputing."""
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await sleep(0.01)
+        msg = "boom"
+        raise ValueError(msg)
+
+    results = await gather(
+        *(cache_manager.coalesce("key", compute) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_leader_is_cancelled(cache_manager: CacheManager) -> None:
+    """Test that a cancelled leader does not cancel the callers waiting on it."""
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await sleep(0.05)
+        return "computed"
+
+    leader = create_task(cache_manager.coalesce("key", compute))
+    await sleep(0)
+    waiter = create_task(cache_manager.coalesce("key", compute))
+    await sleep(0)
+    leader.cancel()
+
+    assert await waiter == "computed"
+    assert calls == 2
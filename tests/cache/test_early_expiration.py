@@ -0,0 +1,74 @@
+"""Tests for probabilistic early expiration (XFetch) and TTL jitter."""
+
+from asyncio import gather
+from unittest.mock import patch
+
+import pytest
+
+from app.data import CacheEntry
+from app.managers.cache_manager import CacheManager
+
+
+def test_should_refresh_early_depends_on_cost() -> None:
+    """Test that an expensive entry can be refreshed before its soft expiry."""
+    entry = CacheEntry("v", soft_expires_at=100.0, delta=2.0)
+    with patch("app.data.cache_entry.time", return_value=95.0):
+        # rand() close to 0 pushes the check far ahead of the clock
+        with patch("app.data.cache_entry.random", return_value=0.99):
+            assert entry.should_refresh(beta=1.0)
+        # rand() of 1 adds no lead time
+        with patch("app.data.cache_entry.random", return_value=0.0):
+            assert not entry.should_refresh(beta=1.0)
+        assert not entry.should_refresh()
+
+
+def test_should_refresh_without_delta_waits_for_expiry() -> None:
+    """Test that entries without a recorded cost only refresh once stale."""
+    entry = CacheEntry("v", soft_expires_at=100.0)
+    with patch("app.data.cache_entry.random", return_value=0.99):
+        with patch("app.data.cache_entry.time", return_value=99.0):
+            assert not entry.should_refresh(beta=10.0)
+        with patch("app.data.cache_entry.time", return_value=100.0):
+            assert entry.should_refresh(beta=10.0)
+
+
+@pytest.mark.asyncio
+async def test_set_with_delta_records_cost(cache_manager: CacheManager) -> None:
+    """Test that the recompute cost is stored without extending the TTL."""
+    await cache_manager.set("key", {"v": 1}, ttl=60, delta=0.25)
+
+    entry = await cache_manager.get_entry("key")
+    assert entry is not None
+    assert entry.value == {"v": 1}
+    assert entry.delta == 0.25
+    assert await cache_manager.memory_client.ttl("cache:key") <= 60
+
+
+@pytest.mark.asyncio
+async def test_set_applies_ttl_jitter(cache_manager: CacheManager) -> None:
+    """Test that the configured jitter shortens the TTL."""
+    cache_manager.cache_config.ttl_jitter = 0.5
+    with patch("app.managers.cache_manager.random", return_value=1.0):
+        await cache_manager.set("key", "v", ttl=100)
+
+    assert 0 < await cache_manager.memory_client.ttl("cache:key") <= 50
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_refreshes_early_with_beta(cache_manager: CacheManager) -> None:
+    """Test that get_or_set records the cost and refreshes a fresh entry early."""
+    values = iter(["first", "second"])
+
+    async def callback() -> str:
+        return next(values)
+
+    assert await cache_manager.get_or_set("key", callback, ttl=60, beta=1.0) == "first"
+    entry = await cache_manager.get_entry("key")
+    assert entry is not None
+    assert entry.delta is not None
+
+    with patch.object(CacheEntry, "should_refresh", return_value=True):
+        assert await cache_manager.get_or_set("key", callback, ttl=60, beta=1.0) == "first"
+    await gather(*cache_manager._refresh_tasks.values())
+
+    assert await cache_manager.get("key") == "second"
@@ -0,0 +1,126 @@
+"""Tests for MemoryClient eviction policies and memory accounting."""
+
+from sys import getsizeof
+
+import pytest
+
+from app.clients.eviction import CountMinSketch, FIFOPolicy, TinyLFUPolicy, make_policy
+from app.clients.memory_client import ENTRY_OVERHEAD, MemoryClient
+
+
+def test_sketch_estimates_and_ages() -> None:
+    """Test that the sketch counts accesses, saturates and halves on aging."""
+    sketch = CountMinSketch(64, sample_size=1000)
+    for _ in range(5):
+        sketch.increment("hot")
+    sketch.increment("cold")
+
+    assert sketch.estimate("hot") >= 5
+    assert sketch.estimate("cold") >= 1
+    assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    for _ in range(40):
+        sketch.increment("hot")
+    assert sketch.estimate("hot") == CountMinSketch.MAX_COUNT
+
+    sketch._age()
+    assert sketch.estimate("hot") == CountMinSketch.MAX_COUNT // 2
+
+
+def test_make_policy_selects_strategy() -> None:
+    """Test that the strategy name picks the policy class."""
+    assert isinstance(make_policy("FIFO", 10), FIFOPolicy)
+    assert isinstance(make_policy("TinyLFU", 10), TinyLFUPolicy)
+    assert type(make_policy("LRU", 10)).__name__ == "LRUPolicy"
+
+
+@pytest.mark.asyncio
+async def test_fifo_ignores_access_order() -> None:
+    """Test that FIFO evicts the oldest insert even if it was just read."""
+    client = MemoryClient(max_entries=3, strategy="FIFO")
+    for i in range(3):
+        await client.set(f"key{i}", "v")
+
+    await client.get("key0")
+    await client.set("key3", "v")
+
+    assert await client.exists("key0") == 0
+    assert await client.exists("key1", "key2", "key3") == 3
+
+
+@pytest.mark.asyncio
+async def test_tinylfu_survives_scan() -> None:
+    """Test that a scan over one-off keys does not flush the hot working set."""
+    client = MemoryClient(max_entries=100, strategy="TinyLFU")
+    hot = [f"hot{i}" for i in range(50)]
+    for key in hot:
+        await client.set(key, "v")
+    for _ in range(10):
+        for key in hot:
+            await client.get(key)
+
+    for i in range(1000):
+        await client.set(f"scan{i}", "v")
+
+    # The sketch is approximate, so allow for the odd hash collision
+    assert await client.exists(*hot) >= len(hot) - 5
+    assert len(client._cache) <= 100
+
+
+@pytest.mark.asyncio
+async def test_lru_loses_hot_set_to_scan() -> None:
+    """Test the baseline: a plain LRU evicts the hot keys during the same scan."""
+    client = MemoryClient(max_entries=100, strategy="LRU")
+    hot = [f"hot{i}" for i in range(50)]
+    for key in hot:
+        await client.set(key, "v")
+        await client.get(key)
+
+    for i in range(1000):
+        await client.set(f"scan{i}", "v")
+
+    assert await client.exists(*hot) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_accounting_includes_overhead() -> None:
+    """Test that entry sizes include container overhead and are released on delete."""
+    client = MemoryClient()
+    await client.set("key", "value", ex=60)
+
+    expected = getsizeof("key") + getsizeof("value") + ENTRY_OVERHEAD
+    assert (await client.info())["used_memory_bytes"] == expected
+
+    await client.set("key", "longer value")
+    await client.delete("key")
+    assert (await client.info())["used_memory_bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_limit_is_enforced() -> None:
+    """Test that used memory never exceeds max_memory_mb."""
+    client = MemoryClient(max_memory_mb=1)
+    value = "x" * 10_000
+    for i in range(500):
+        await client.set(f"key{i}", value)
+
+    info = await client.info()
+    assert info["used_memory_bytes"] <= 1024 * 1024
+    assert client.evicted_keys > 0
+    assert await client.get("key499") == value
+
+
+@pytest.mark.asyncio
+async def test_flush_all_resets_policy() -> None:
+    """Test that flush_all forgets policy state so eviction starts fresh."""
+    client = MemoryClient(max_entries=2, strategy="TinyLFU")
+    await client.set("a", "v")
+    await client.set("b", "v")
+    await client.flush_all()
+
+    await client.set("c", "v")
+    await client.set("d", "v")
+    await client.set("e", "v")
+
+    assert len(client._cache) == 2
+    assert (await client.info())["eviction_policy"] == "TinyLFU"
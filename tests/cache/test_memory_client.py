@@ -1,6 +1,8 @@
 """Tests for the in-memory cache client."""
 
 import asyncio
+from time import time
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -101,6 +103,37 @@ async def test_scan_iter(memory_client: MemoryClient) -> None:
     assert "prefix:key2" in keys
 
 
+@pytest.mark.asyncio
+async def test_scan_iter_uses_prefix_index(memory_client: MemoryClient) -> None:
+    """Test prefix, partial-segment, nested and literal patterns against the index."""
+    for key in ("cache:blogs:1", "cache:blogs:2", "cache:blogs:list:1", "cache:users:1", "x"):
+        await memory_client.set(key, "v")
+
+    async def scan(pattern: str) -> set[str]:
+        return {key async for key in memory_client.scan_iter(pattern)}
+
+    assert await scan("cache:blogs:*") == {"cache:blogs:1", "cache:blogs:2", "cache:blogs:list:1"}
+    assert await scan("cache:blogs:l*") == {"cache:blogs:list:1"}
+    assert await scan("cache:b?ogs:1") == {"cache:blogs:1"}
+    assert await scan("*:1") == {"cache:blogs:1", "cache:blogs:list:1", "cache:users:1"}
+    assert await scan("cache:users:1") == {"cache:users:1"}
+    assert await scan("missing:*") == set()
+
+
+@pytest.mark.asyncio
+async def test_prefix_index_drops_removed_keys(memory_client: MemoryClient) -> None:
+    """Test that deleted and evicted keys leave no empty prefix index entries."""
+    await memory_client.set("ns:a:1", "v")
+    await memory_client.set("ns:b:1", "v")
+    await memory_client.delete("ns:a:1")
+
+    assert "ns:a:" not in memory_client._prefix_index
+    assert memory_client._prefix_index["ns:"] == {"ns:b:1"}
+
+    await memory_client.flush_all()
+    assert memory_client._prefix_index == {}
+
+
 @pytest.mark.asyncio
 async def test_memory_limits() -> None:
     """Test that memory limits trigger LRU eviction."""
@@ -239,3 +272,88 @@ async def test_estimate_entry_size() -> None:
     client = MemoryClient()
     size = client._estimate_entry_size("key", "value")
     assert size > 0
+
+
+@pytest.mark.asyncio
+async def test_get_many(memory_client: MemoryClient) -> None:
+    """Test that get_many returns values in key order with None for misses."""
+    await memory_client.set("key1", "value1")
+    await memory_client.set("key2", "value2")
+
+    assert await memory_client.get_many(["key2", "missing", "key1"]) == [
+        "value2",
+        None,
+        "value1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_set_many_with_per_key_ttl(memory_client: MemoryClient) -> None:
+    """Test that set_many stores every value with its own TTL."""
+    assert await memory_client.set_many({"key1": ("value1", 60), "key2": ("value2", None)})
+
+    assert await memory_client.get_many(["key1", "key2"]) == ["value1", "value2"]
+    assert 0 < await memory_client.ttl("key1") <= 60
+    assert await memory_client.ttl("key2") == -1
+
+
+@pytest.mark.asyncio
+async def test_active_expire_removes_only_due_keys() -> None:
+    """Test that cleanup pops due keys off the heap in slices and reports them."""
+    on_evict = Mock()
+    client = MemoryClient(on_evict=on_evict)
+    client._cleanup_batch_size = 2
+    for i in range(5):
+        await client.set(f"short{i}", "v", ex=10)
+    await client.set("long", "v", ex=1000)
+    await client.set("forever", "v")
+
+    with patch("app.clients.memory_client.time", return_value=time() + 100):
+        assert await client._active_expire() == 5
+
+    assert await client.exists("long", "forever") == 2
+    assert client.expired_keys == 5
+    assert sum(call.args[0] for call in on_evict.call_args_list) == 5
+    assert len(client._expiry_heap) == 1
+
+
+@pytest.mark.asyncio
+async def test_active_expire_skips_superseded_entries() -> None:
+    """Test that heap entries replaced by a later set, expire or delete are ignored."""
+    client = MemoryClient()
+    await client.set("renewed", "v", ex=10)
+    await client.expire("renewed", 1000)
+    await client.set("persisted", "v", ex=10)
+    await client.set("persisted", "v")
+    await client.set("deleted", "v", ex=10)
+    await client.delete("deleted")
+
+    with patch("app.clients.memory_client.time", return_value=time() + 100):
+        assert await client._active_expire() == 0
+
+    assert await client.exists("renewed", "persisted") == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_is_reported() -> None:
+    """Test that LRU evictions are counted and passed to on_evict."""
+    on_evict = Mock()
+    client = MemoryClient(max_entries=2, on_evict=on_evict)
+    for i in range(3):
+        await client.set(f"key{i}", "v")
+
+    assert client.evicted_keys == 1
+    on_evict.assert_called_once_with(1)
+    assert (await client.info())["evicted_keys"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_lock(memory_client: MemoryClient) -> None:
+    """Test that reads proceed while a writer holds the lock."""
+    await memory_client.set("key", "value")
+
+    async with memory_client._lock:
+        assert await asyncio.wait_for(memory_client.get("key"), timeout=0.1) == "value"
+        assert await memory_client.get_many(["key", "missing"]) == ["value", None]
+        assert await memory_client.exists("key") == 1
+        assert await memory_client.ttl("key") == -1
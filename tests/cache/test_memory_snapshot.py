@@ -0,0 +1,90 @@
+"""Tests for warm restarts of the in-memory cache from a snapshot file."""
+
+from os import utime
+from pathlib import Path
+from time import time
+from unittest.mock import patch
+
+import pytest
+
+from app.clients.memory_client import MemoryClient
+
+
+async def _restart(path: Path) -> MemoryClient:
+    """Start a new client on the snapshot left by the previous one."""
+    client = MemoryClient(snapshot_path=str(path))
+    await client.start_lifecycle()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_restart_with_their_ttl(tmp_path: Path) -> None:
+    """Test that values, their type and their remaining TTL come back lazily."""
+    path = tmp_path / "snapshot.bin"
+    client = await _restart(path)
+    await client.set("text", "héllo", ex=100)
+    await client.set("raw", b"\x00\xff")
+    await client.set("short", "gone", ex=5)
+    await client.close()
+
+    with patch("app.clients.memory_client.time", return_value=time() + 10):
+        client = await _restart(path)
+    assert (await client.info())["snapshot_pending_keys"] == 2
+    assert len(client._cache) == 0
+
+    assert await client.get("text") == "héllo"
+    assert 80 < await client.ttl("text") <= 100
+    assert await client.get_many(["raw", "short"]) == [b"\x00\xff", None]
+    assert client.restored_keys == 2
+    assert client._snapshot is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_and_deletes_supersede_snapshot(tmp_path: Path) -> None:
+    """Test that restored keys never override newer writes, deletes or clears."""
+    path = tmp_path / "snapshot.bin"
+    client = await _restart(path)
+    for key in ("cache:blogs:a", "cache:blogs:b", "cache:users:a", "cache:users:b"):
+        await client.set(key, "old")
+    await client.close()
+
+    client = await _restart(path)
+    await client.set("cache:users:a", "new")
+    assert await client.delete("cache:users:b") == 1
+    assert sorted([key async for key in client.scan_iter("cache:blogs:*")]) == [
+        "cache:blogs:a",
+        "cache:blogs:b",
+    ]
+    await client.delete("cache:blogs:a", "cache:blogs:b")
+
+    assert await client.get("cache:users:a") == "new"
+    assert await client.exists("cache:users:b", "cache:blogs:a") == 0
+    await client.close()
+
+    client = await _restart(path)
+    assert await client.get_many(["cache:users:a", "cache:blogs:a"]) == ["new", None]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unusable_snapshots_start_cold(tmp_path: Path) -> None:
+    """Test that foreign or stale files are ignored and unstarted clients keep the file."""
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(b"not a snapshot")
+    client = await _restart(path)
+    assert (await client.info())["snapshot_pending_keys"] == 0
+    await client.set("key", "value")
+    await client.close()
+
+    unstarted = MemoryClient(snapshot_path=str(path))
+    await unstarted.close()
+    client = await _restart(path)
+    assert client._pending.keys() == {"key"}
+    await client.close()
+
+    old = time() - 3 * MemoryClient.DEFAULT_SNAPSHOT_INTERVAL
+    utime(path, (old, old))
+    client = await _restart(path)
+    assert not client._pending
+    await client.close()
@@ -0,0 +1,165 @@
+"""Tests for the in-process near cache (L1) and its CacheManager integration."""
+
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from orjson import dumps
+
+from app.clients.memory_client import MemoryClient
+from app.clients.near_cache import NearCache
+from app.managers.cache_manager import CacheManager
+
+
+@pytest.fixture
+async def near_manager() -> AsyncGenerator[CacheManager]:
+    """
+    Create a cache manager with an active near cache.
+
+    The memory client stands in for Redis as the L2 tier and publishing is mocked,
+    so the L1 read path and invalidation handling can be tested without a server.
+    """
+    manager = CacheManager()
+    manager.near_cache = NearCache(max_entries=100, ttl=30)
+    manager._client = manager.memory_client
+    manager.is_redis_available = True
+    manager._near_cache_ready = True
+    manager.redis_client.publish = AsyncMock(return_value=1)  # type: ignore[method-assign]
+
+    yield manager
+
+    manager.is_redis_available = False
+    await manager.shutdown()
+
+
+def test_near_cache_set_and_get() -> None:
+    """Test storing and reading a payload."""
+    cache = NearCache()
+    assert cache.set("cache:key", '{"a":1}')
+    assert cache.get("cache:key") == '{"a":1}'
+    assert cache.get("cache:missing") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_near_cache_lru_eviction() -> None:
+    """Test that the least recently used entry is evicted when full."""
+    cache = NearCache(max_entries=2)
+    cache.set("k1", "v1")
+    cache.set("k2", "v2")
+    cache.get("k1")
+    cache.set("k3", "v3")
+
+    assert cache.get("k2") is None
+    assert cache.get("k1") == "v1"
+    assert cache.get("k3") == "v3"
+
+
+def test_near_cache_expiry() -> None:
+    """Test that entries expire on the monotonic clock."""
+    cache = NearCache(ttl=30)
+    with patch("app.clients.near_cache.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl=5)
+    with patch("app.clients.near_cache.monotonic", return_value=104.0):
+        assert cache.get("key") == "value"
+    with patch("app.clients.near_cache.monotonic", return_value=105.0):
+        assert cache.get("key") is None
+
+
+def test_near_cache_ttl_is_capped() -> None:
+    """Test that the local lifetime never exceeds the configured TTL."""
+    cache = NearCache(ttl=10)
+    with patch("app.clients.near_cache.monotonic", return_value=0.0):
+        cache.set("key", "value", ttl=3600)
+    with patch("app.clients.near_cache.monotonic", return_value=10.0):
+        assert cache.get("key") is None
+
+
+def test_near_cache_rejects_stale_version() -> None:
+    """Test that a value read before an invalidation is not stored."""
+    cache = NearCache()
+    version = cache.version
+    cache.invalidate("key")
+
+    assert not cache.set("key", "stale", version=version)
+    assert cache.get("key") is None
+
+
+def test_near_cache_invalidate_prefix() -> None:
+    """Test prefix invalidation drops only matching keys."""
+    cache = NearCache()
+    cache.set("cache:blogs:a", "1")
+    cache.set("cache:blogs:b", "2")
+    cache.set("cache:users:a", "3")
+
+    assert cache.invalidate_prefix("cache:blogs:") == 2
+    assert cache.get("cache:users:a") == "3"
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_populates_and_serves_from_near_cache(near_manager: CacheManager) -> None:
+    """Test that an L2 hit populates L1 and the next hit skips L2."""
+    await near_manager.memory_client.set("cache:blogs:slug", '{"title":"Bali"}')
+
+    assert await near_manager.get("slug", namespace="blogs") == {"title": "Bali"}
+    assert near_manager.near_cache is not None
+    assert near_manager.near_cache.get("cache:blogs:slug") == '{"title":"Bali"}'
+
+    with patch.object(MemoryClient, "get_bytes", new_callable=AsyncMock) as l2_get:
+        assert await near_manager.get("slug", namespace="blogs") == {"title": "Bali"}
+        l2_get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_and_delete_publish_invalidations(near_manager: CacheManager) -> None:
+    """Test that writes update L1 locally and notify other workers."""
+    publish = near_manager.redis_client.publish
+    assert isinstance(publish, AsyncMock)
+
+    await near_manager.set("key", {"v": 1}, namespace="users")
+    assert near_manager.near_cache is not None
+    assert near_manager.near_cache.get("cache:users:key") == '{"v":1}'
+    assert publish.await_count == 1
+
+    await near_manager.delete("key", namespace="users")
+    assert near_manager.near_cache.get("cache:users:key") is None
+    assert publish.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_apply_invalidation_from_other_worker(near_manager: CacheManager) -> None:
+    """Test that messages from other workers evict keys and prefixes."""
+    assert near_manager.near_cache is not None
+    near_manager.near_cache.set("cache:blogs:a", "1")
+    near_manager.near_cache.set("cache:blogs:b", "2")
+    near_manager.near_cache.set("cache:users:a", "3")
+
+    near_manager._apply_invalidation(dumps({"origin": "other", "keys": ["cache:blogs:a"]}))
+    assert near_manager.near_cache.get("cache:blogs:a") is None
+
+    near_manager._apply_invalidation(dumps({"origin": "other", "prefix": "cache:users:"}))
+    assert near_manager.near_cache.get("cache:users:a") is None
+    assert near_manager.near_cache.get("cache:blogs:b") == "2"
+
+
+@pytest.mark.asyncio
+async def test_apply_invalidation_ignores_own_messages(near_manager: CacheManager) -> None:
+    """Test that a worker does not evict its own freshly written entries."""
+    assert near_manager.near_cache is not None
+    near_manager.near_cache.set("cache:key", "1")
+
+    message = dumps({"origin": near_manager._instance_id, "keys": ["cache:key"]})
+    near_manager._apply_invalidation(message)
+
+    assert near_manager.near_cache.get("cache:key") == "1"
+
+
+@pytest.mark.asyncio
+async def test_near_cache_bypassed_when_not_subscribed(near_manager: CacheManager) -> None:
+    """Test that L1 is not served while the invalidation subscription is down."""
+    assert near_manager.near_cache is not None
+    near_manager.near_cache.set("cache:key", '"stale"')
+    near_manager._near_cache_ready = False
+
+    assert await near_manager.get("key") is None
@@ -0,0 +1,52 @@
+"""Tests for caching of "not found" results."""
+
+import pytest
+
+from app.managers.cache_manager import CacheManager
+
+
+@pytest.mark.asyncio
+async def test_negative_entry_reads_as_miss(cache_manager: CacheManager) -> None:
+    """Test that a cached not-found is flagged by get_entry and a miss everywhere else."""
+    assert await cache_manager.set_negative("user_1", namespace="users", detail="User not found")
+    await cache_manager.set("user_2", {"id": 2}, namespace="users")
+
+    entry = await cache_manager.get_entry("user_1", namespace="users")
+    assert entry is not None
+    assert entry.negative
+    assert entry.value == "User not found"
+    assert await cache_manager.get("user_1", namespace="users") is None
+    assert await cache_manager.get_many(["user_1", "user_2"], namespace="users") == {
+        "user_2": {"id": 2},
+    }
+    assert cache_manager.get_statistics().negative_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_negative_ttl_disables_negative_caching(cache_manager: CacheManager) -> None:
+    """Test that nothing is stored when the negative TTL is 0."""
+    cache_manager.cache_config.negative_ttl = 0
+
+    assert not await cache_manager.set_negative("user_1")
+    assert await cache_manager.get_entry("user_1") is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_caches_none_until_deleted(cache_manager: CacheManager) -> None:
+    """Test that a None result is not recomputed until the key is deleted."""
+    calls = 0
+    value: dict[str, int] | None = None
+
+    async def load() -> dict[str, int] | None:
+        nonlocal calls
+        calls += 1
+        return value
+
+    assert await cache_manager.get_or_set("blog_1", load) is None
+    assert await cache_manager.get_or_set("blog_1", load) is None
+    assert calls == 1
+
+    value = {"id": 1}
+    await cache_manager.delete("blog_1")
+    assert await cache_manager.get_or_set("blog_1", load) == {"id": 1}
+    assert calls == 2
@@ -0,0 +1,109 @@
+"""Tests for the circuit breaker routing the cache to memory during Redis outages."""
+
+from asyncio import sleep
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from app.errors import CacheKeyError
+from app.managers.cache_manager import CacheManager
+from app.managers.circuit_breaker import CircuitState
+
+
+@pytest.fixture
+async def redis_manager() -> AsyncGenerator[CacheManager]:
+    """Create a manager whose backend is a Redis client with mocked commands."""
+    manager = CacheManager()
+    manager.cache_config.breaker_probe_interval = 60
+    manager.redis_client._binary_redis = AsyncMock()
+    manager._client = manager.redis_client
+    manager.is_redis_available = True
+    yield manager
+    await manager.shutdown()
+
+
+async def _wait_for(manager: CacheManager, state: CircuitState) -> None:
+    """Let the probe task run until the breaker reaches state."""
+    for _ in range(100):
+        if manager.breaker_state is state:
+            return
+        await sleep(0.01)
+    pytest.fail(f"breaker stayed {manager.breaker_state.value}")
+
+
+@pytest.mark.asyncio
+async def test_outage_errors_trip_breaker_to_memory(redis_manager: CacheManager) -> None:
+    """Test that connection errors open the breaker and later reads skip Redis."""
+    get_bytes = AsyncMock(side_effect=RedisConnectionError("Connection refused"))
+    redis_manager.redis_client.get_bytes = get_bytes  # type: ignore[method-assign]
+
+    for _ in range(redis_manager.cache_config.breaker_failure_threshold):
+        with pytest.raises(CacheKeyError):
+            await redis_manager.get("key")
+
+    assert redis_manager.breaker_state is CircuitState.OPEN
+    assert redis_manager._client is redis_manager.memory_client
+    assert await redis_manager.get("key") is None
+    assert get_bytes.await_count == redis_manager.cache_config.breaker_failure_threshold
+    assert redis_manager.breaker_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_command_errors_and_old_failures_do_not_trip(redis_manager: CacheManager) -> None:
+    """Test that failed commands and failures outside the window are not an outage."""
+    error = RedisConnectionError("Cache get operation failed")
+    error.__cause__ = ResponseError("WRONGTYPE")
+    for _ in range(5):
+        redis_manager._record_redis_failure(error)
+    assert redis_manager._redis_failures == 0
+
+    outage = RedisConnectionError("Timeout reading from socket")
+    redis_manager._record_redis_failure(outage)
+    redis_manager._record_redis_failure(outage)
+    redis_manager._last_redis_failure -= redis_manager.cache_config.breaker_failure_window + 1
+    redis_manager._record_redis_failure(outage)
+
+    assert redis_manager._redis_failures == 1
+    assert redis_manager.breaker_state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_probe_switches_back_once_redis_answers(redis_manager: CacheManager) -> None:
+    """Test that the probe keeps memory until a ping succeeds and reports each transition."""
+    redis_manager.cache_config.breaker_probe_interval = 0.01
+    ping = AsyncMock(side_effect=[RedisConnectionError("Connection refused"), True])
+    redis_manager.redis_client.ping = ping  # type: ignore[method-assign]
+
+    with patch("app.managers.cache_manager.metrics") as metrics:
+        redis_manager._open_breaker()
+        await _wait_for(redis_manager, CircuitState.CLOSED)
+
+    assert redis_manager._client is redis_manager.redis_client
+    assert redis_manager.is_redis_available
+    assert ping.await_count == 2
+    assert redis_manager._probe_task is None
+    assert metrics.record_circuit_breaker_transition.call_args_list == [
+        call(CacheManager.BREAKER_NAME, state)
+        for state in ("open", "half_open", "open", "half_open", "closed")
+    ]
+
+
+@pytest.mark.asyncio
+@patch("app.clients.redis_client.RedisClient.connect")
+async def test_redis_down_at_startup_is_picked_up_later(mock_connect: Mock) -> None:
+    """Test that a manager started without Redis switches to it once it comes up."""
+    mock_connect.side_effect = [RedisConnectionError("Connection refused"), None]
+    manager = CacheManager()
+    manager.cache_config.breaker_probe_interval = 0.01
+    with patch("app.managers.cache_manager.settings") as settings:
+        settings.REDIS_ENABLED = True
+        await manager.initialize()
+
+    assert manager._client is manager.memory_client
+    await _wait_for(manager, CircuitState.CLOSED)
+    assert manager._client is manager.redis_client
+    assert mock_connect.await_count == 2
+    await manager.shutdown()
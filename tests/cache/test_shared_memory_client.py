@@ -0,0 +1,205 @@
+"""Tests for the cache client shared by workers through a memory-mapped region."""
+
+from collections.abc import AsyncGenerator
+from multiprocessing import get_context
+from os import environ
+from pathlib import Path
+from time import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.clients.memory_client import MemoryClient
+from app.clients.shared_memory_client import SEQ, SharedMemoryClient
+from app.interfaces import CacheClientProtocol
+from app.managers.cache_manager import CacheManager
+
+
+@pytest.fixture
+async def shared_client(tmp_path: Path) -> AsyncGenerator[SharedMemoryClient]:
+    """Create a small shared-memory client backed by a temporary file."""
+    client = SharedMemoryClient(path=str(tmp_path / "cache"), slots=64, slot_size=256)
+    await client.start_lifecycle()
+    yield client
+    await client.close()
+
+
+def _increment(path: str, times: int) -> None:
+    """Increment a shared counter from another process."""
+    client = SharedMemoryClient(path=path, slots=64, slot_size=256)
+    client._attach()
+    for _ in range(times):
+        client._incr_internal("counter")
+
+
+@pytest.mark.asyncio
+async def test_conforms_to_cache_protocol(shared_client: SharedMemoryClient) -> None:
+    """Test that the client can stand in for MemoryClient and RedisClient."""
+    assert isinstance(shared_client, CacheClientProtocol)
+    assert await shared_client.ping()
+
+
+@pytest.mark.asyncio
+async def test_values_round_trip_with_their_type(shared_client: SharedMemoryClient) -> None:
+    """Test that text and bytes come back as stored and bytes getters encode text."""
+    assert await shared_client.set_many({"text": ("héllo", None), "raw": (b"\x00\xff", 60)})
+
+    assert await shared_client.get("text") == "héllo"
+    assert await shared_client.get_bytes("text") == "héllo".encode()
+    assert await shared_client.get_many(["raw", "missing"]) == [b"\x00\xff", None]
+    assert await shared_client.exists("text", "raw", "missing") == 2
+    assert await shared_client.ttl("text") == -1
+    assert 0 < await shared_client.ttl("raw") <= 60
+
+    assert await shared_client.delete("text", "missing") == 1
+    assert await shared_client.get("text") is None
+
+
+@pytest.mark.asyncio
+async def test_workers_share_entries(tmp_path: Path, shared_client: SharedMemoryClient) -> None:
+    """Test that a value written by one worker is read, bumped and flushed by another."""
+    other = SharedMemoryClient(path=str(tmp_path / "cache"), slots=64, slot_size=256)
+    await other.start_lifecycle()
+
+    await shared_client.set("cache:blogs:a", "1")
+    assert await other.get("cache:blogs:a") == "1"
+    assert await other.incr("cache:blogs:a") == 2
+    assert await shared_client.get("cache:blogs:a") == "2"
+    assert [key async for key in other.scan_iter("cache:blogs:*")] == ["cache:blogs:a"]
+
+    await other.flush_all()
+    assert await shared_client.get("cache:blogs:a") is None
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_and_oversized_values_are_not_served(
+    shared_client: SharedMemoryClient,
+) -> None:
+    """Test lazy expiry, EXPIRE and the refusal of values larger than a slot."""
+    await shared_client.set("key", "value", ex=10)
+    assert await shared_client.expire("key", 100)
+    assert await shared_client.ttl("key") > 10
+
+    with patch("app.clients.shared_memory_client.time", return_value=time() + 200):
+        assert await shared_client.get("key") is None
+        assert await shared_client.ttl("key") == -2
+
+    assert not await shared_client.set("big", b"x" * 256)
+    assert shared_client.oversized_values == 1
+
+
+@pytest.mark.asyncio
+async def test_full_bucket_evicts_entry_closest_to_expiry(tmp_path: Path) -> None:
+    """Test that a full bucket evicts the entry expiring first and reports it."""
+    on_evict = Mock()
+    client = SharedMemoryClient(
+        path=str(tmp_path / "cache"),
+        slots=SharedMemoryClient.WAYS,
+        slot_size=128,
+        on_evict=on_evict,
+    )
+    await client.start_lifecycle()
+    for i in range(client.WAYS):
+        await client.set(f"key{i}", "value", ex=None if i else 10)
+
+    await client.set("new", "value")
+
+    assert await client.get("key0") is None
+    assert await client.get("new") == "value"
+    assert await client.exists(*(f"key{i}" for i in range(1, client.WAYS))) == client.WAYS - 1
+    on_evict.assert_called_once_with(1)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_slot_being_written_reads_as_miss(shared_client: SharedMemoryClient) -> None:
+    """Test that readers never return a slot whose seqlock shows a write in progress."""
+    await shared_client.set("key", "value")
+    region = shared_client._map
+    slot = next(i for i in range(64) if shared_client._slot_hash(i))
+    offset = shared_client._offset(slot)
+    (seq,) = SEQ.unpack_from(region, offset)
+
+    SEQ.pack_into(region, offset, seq + 1)
+    assert await shared_client.get("key") is None
+
+    SEQ.pack_into(region, offset, seq + 2)
+    assert await shared_client.get("key") == "value"
+
+
+def test_layout_change_uses_another_region(tmp_path: Path) -> None:
+    """Test that workers with another geometry map their own file, leaving the old intact."""
+    path = str(tmp_path / "cache")
+    first = SharedMemoryClient(path=path, slots=64, slot_size=256)
+    first._attach()
+    first._set_internal("key", "value")
+
+    second = SharedMemoryClient(path=path, slots=64, slot_size=512)
+    second._attach()
+
+    assert second._get_internal("key") is None
+    assert first._get_internal("key") == "value"
+    assert Path(first._path).stat().st_size == 64 + 64 * 256
+    assert Path(second._path).stat().st_size == 64 + 64 * 512
+
+
+def test_foreign_file_is_left_alone(tmp_path: Path) -> None:
+    """Test that a file at the region path that is not of its layout is never reformatted."""
+    client = SharedMemoryClient(path=str(tmp_path / "cache"), slots=64, slot_size=256)
+    Path(client._path).write_bytes(b"not a cache region")
+
+    with pytest.raises(OSError, match="not a shared memory cache"):
+        client._attach()
+    assert Path(client._path).read_bytes() == b"not a cache region"
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_falls_back_to_worker_memory(tmp_path: Path) -> None:
+    """Test that a shared region that cannot be mapped is replaced by a MemoryClient."""
+    manager = CacheManager()
+    shared = SharedMemoryClient(path=str(tmp_path / "cache"), slots=64, slot_size=256)
+    manager.memory_client = manager._client = shared
+
+    with patch.object(shared, "_attach", side_effect=OSError("not a shared memory cache")):
+        await manager._start_memory_client()
+
+    assert isinstance(manager.memory_client, MemoryClient)
+    assert manager._client is manager.memory_client
+    await manager.memory_client.close()
+
+
+def test_concurrent_processes_do_not_lose_writes(tmp_path: Path) -> None:
+    """Test that bucket locks serialize writers running in separate processes."""
+    path = str(tmp_path / "cache")
+    client = SharedMemoryClient(path=path, slots=64, slot_size=256)
+    client._attach()
+
+    context = get_context("fork")
+    workers = [context.Process(target=_increment, args=(path, 200)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert client._get_internal("counter") == "800"
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_falls_back_to_shared_region(tmp_path: Path) -> None:
+    """Test that the manager uses the shared region when configured, namespaces included."""
+    env = {"CACHE_SHARED_MEMORY_ENABLED": "true", "CACHE_SHARED_MEMORY_PATH": str(tmp_path / "c")}
+    with patch.dict(environ, env), patch("app.managers.cache_manager.settings") as settings:
+        settings.REDIS_ENABLED = False
+        manager = CacheManager()
+        await manager.initialize()
+
+    assert isinstance(manager.memory_client, SharedMemoryClient)
+    await manager.set("a", {"id": 1}, namespace="blogs")
+    await manager.set("b", {"id": 2}, namespace="users")
+    assert await manager.get("a", namespace="blogs") == {"id": 1}
+
+    assert await manager.clear(namespace="blogs") == 1
+    assert await manager.get("b", namespace="users") == {"id": 2}
+    await manager.shutdown()
@@ -0,0 +1,104 @@
+"""Tests for cross-worker single-flight in CacheManager.get_or_set."""
+
+from asyncio import gather, sleep
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.managers.cache_manager import CacheManager
+
+
+def _use_shared_lease_store(manager: CacheManager, leases: dict[str, str]) -> None:
+    """Point the manager's lease calls at a dict that stands in for Redis."""
+
+    async def acquire_lease(key: str, token: str, px: int) -> bool:
+        return leases.setdefault(key, token) == token
+
+    async def release_lease(key: str, token: str) -> bool:
+        if leases.get(key) == token:
+            del leases[key]
+            return True
+        return False
+
+    manager.redis_client.acquire_lease = AsyncMock(side_effect=acquire_lease)  # type: ignore[method-assign]
+    manager.redis_client.release_lease = AsyncMock(side_effect=release_lease)  # type: ignore[method-assign]
+
+
+@pytest.fixture
+async def workers() -> AsyncGenerator[tuple[CacheManager, CacheManager]]:
+    """
+    Create two managers that share one backend and one lease store.
+
+    The first manager's memory client stands in for Redis, so both behave like
+    separate workers talking to the same server.
+    """
+    leases: dict[str, str] = {}
+    first, second = CacheManager(), CacheManager()
+    for manager in (first, second):
+        manager._client = first.memory_client
+        manager.is_redis_available = True
+        manager.cache_config.single_flight_distributed = True
+        _use_shared_lease_store(manager, leases)
+
+    yield first, second
+
+    for manager in (first, second):
+        manager.is_redis_available = False
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_only_one_worker_runs_callback(
+    workers: tuple[CacheManager, CacheManager],
+) -> None:
+    """Test that concurrent misses in two workers run the callback once."""
+    calls = 0
+
+    async def callback() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await sleep(0.05)
+        return {"v": 1}
+
+    first, second = workers
+    results = await gather(
+        first.get_or_set("key", callback, ttl=60),
+        second.get_or_set("key", callback, ttl=60),
+    )
+
+    assert results == [{"v": 1}, {"v": 1}]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_computes_after_timeout(
+    workers: tuple[CacheManager, CacheManager],
+) -> None:
+    """Test that a waiter stops waiting for a lease holder that never finishes."""
+    first, _ = workers
+    first.cache_config.single_flight_wait_timeout = 0.05
+    await first.redis_client.acquire_lease("lease:cache:key", "stuck-worker", 30_000)
+
+    async def callback() -> str:
+        return "computed"
+
+    assert await first.get_or_set("key", callback) == "computed"
+
+
+@pytest.mark.asyncio
+async def test_lease_errors_fall_back_to_local_compute(
+    workers: tuple[CacheManager, CacheManager],
+) -> None:
+    """Test that a failing lease never blocks the caller."""
+    first, _ = workers
+    first.redis_client.acquire_lease = AsyncMock(  # type: ignore[method-assign]
+        side_effect=RedisConnectionError("down"),
+    )
+
+    async def callback() -> str:
+        return "computed"
+
+    assert await first.get_or_set("key", callback) == "computed"
+    assert await first.get("key") == "computed"
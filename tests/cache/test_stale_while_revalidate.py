@@ -0,0 +1,88 @@
+"""Tests for stale-while-revalidate (soft/hard TTL) cache entries."""
+
+from asyncio import Event, gather, sleep
+from unittest.mock import patch
+
+import pytest
+
+from app.data import CacheEntry
+from app.managers.cache_manager import CacheManager
+
+
+def test_cache_entry_round_trip() -> None:
+    """Test that an envelope survives conversion to and from a payload."""
+    entry = CacheEntry({"a": 1}, soft_expires_at=123.0)
+    assert CacheEntry.from_payload(entry.to_payload()) == entry
+
+
+def test_cache_entry_wraps_plain_values() -> None:
+    """Test that values written without an envelope are always fresh."""
+    entry = CacheEntry.from_payload({"a": 1})
+    assert entry.value == {"a": 1}
+    assert not entry.is_stale
+
+
+def test_cache_entry_is_stale() -> None:
+    """Test that an entry becomes stale once its soft TTL has elapsed."""
+    entry = CacheEntry("v", soft_expires_at=100.0)
+    with patch("app.data.cache_entry.time", return_value=99.0):
+        assert not entry.is_stale
+    with patch("app.data.cache_entry.time", return_value=100.0):
+        assert entry.is_stale
+
+
+@pytest.mark.asyncio
+async def test_set_with_stale_ttl_extends_hard_ttl(cache_manager: CacheManager) -> None:
+    """Test that the backend TTL covers the stale window and get unwraps the value."""
+    await cache_manager.set("key", {"v": 1}, ttl=60, stale_ttl=30)
+
+    assert await cache_manager.get("key") == {"v": 1}
+    remaining = await cache_manager.memory_client.ttl("cache:key")
+    assert 60 < remaining <= 90
+
+    entry = await cache_manager.get_entry("key")
+    assert entry is not None
+    assert entry.soft_expires_at is not None
+    assert not entry.is_stale
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_serves_stale_and_refreshes_once(cache_manager: CacheManager) -> None:
+    """Test that a stale entry is served while a single background refresh runs."""
+    with patch("app.managers.cache_manager.time", return_value=0.0):
+        await cache_manager.set("key", "old", ttl=60, stale_ttl=300)
+
+    release = Event()
+    calls = 0
+
+    async def callback() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "new"
+
+    assert await cache_manager.get_or_set("key", callback, ttl=60, stale_ttl=300) == "old"
+    assert await cache_manager.get_or_set("key", callback, ttl=60, stale_ttl=300) == "old"
+    await sleep(0)
+    assert calls == 1
+
+    release.set()
+    await gather(*cache_manager._refresh_tasks.values())
+
+    assert await cache_manager.get("key") == "new"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value(cache_manager: CacheManager) -> None:
+    """Test that a failing refresh leaves the stale value in place."""
+    with patch("app.managers.cache_manager.time", return_value=0.0):
+        await cache_manager.set("key", "old", ttl=60, stale_ttl=300)
+
+    async def callback() -> str:
+        msg = "upstream down"
+        raise RuntimeError(msg)
+
+    assert cache_manager.refresh_in_background("key", callback, ttl=60, stale_ttl=300)
+    await gather(*cache_manager._refresh_tasks.values())
+
+    assert await cache_manager.get("key") == "old"
@@ -0,0 +1,51 @@
+"""Tests for tag invalidation through generation counters in CacheManager."""
+
+import pytest
+
+from app.clients.memory_client import MemoryClient
+from app.managers.cache_manager import CacheManager
+
+
+@pytest.mark.asyncio
+async def test_untouched_tags_are_at_generation_zero(cache_manager: CacheManager) -> None:
+    """Test that tags never invalidated read as generation 0."""
+    assert await cache_manager.tag_versions(["blogs:list", "users:list"]) == [0, 0]
+    assert await cache_manager.tagged_key("page_0", []) == "page_0"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_moves_readers_to_new_keys(cache_manager: CacheManager) -> None:
+    """Test that one INCR hides every page stamped with the tag."""
+    pages = [await cache_manager.tagged_key(f"page_{i}", ["blogs:list"]) for i in range(3)]
+    for page in pages:
+        await cache_manager.set(page, {"page": page}, namespace="blogs")
+
+    await cache_manager.invalidate_tags("blogs:list")
+
+    assert await cache_manager.tag_versions(["blogs:list"]) == [1]
+    for i, page in enumerate(pages):
+        new_key = await cache_manager.tagged_key(f"page_{i}", ["blogs:list"])
+        assert new_key != page
+        assert await cache_manager.get(new_key, namespace="blogs") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_leaves_other_tags(cache_manager: CacheManager) -> None:
+    """Test that invalidating one tag keeps keys stamped with other tags."""
+    key = await cache_manager.tagged_key("users_all_0_10", ["users:list"])
+    await cache_manager.set(key, [1, 2], namespace="users")
+
+    await cache_manager.invalidate_tags("blogs:list")
+
+    assert await cache_manager.tagged_key("users_all_0_10", ["users:list"]) == key
+    assert await cache_manager.get(key, namespace="users") == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_memory_incr_keeps_ttl() -> None:
+    """Test that MemoryClient.incr counts from 0 and keeps the TTL like Redis."""
+    client = MemoryClient()
+    assert await client.incr("counter") == 1
+    await client.expire("counter", 60)
+    assert await client.incr("counter") == 2
+    assert 0 < await client.ttl("counter") <= 60
@@ -0,0 +1,117 @@
+"""Tests for hot-key, key-size and per-namespace cache telemetry."""
+
+from random import Random
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from app.data.telemetry import OTHER_NAMESPACE, KeyTelemetry, LargestValues, SpaceSaving
+from app.managers.cache_manager import CacheManager
+from app.monitoring.prometheus import CacheTelemetryCollector
+
+
+def test_space_saving_finds_heavy_hitters() -> None:
+    """Test that frequent items survive a long tail and counts bound the true ones."""
+    top = SpaceSaving(10)
+    rng = Random(7)  # noqa: S311
+    stream = ["hot1"] * 300 + ["hot2"] * 200 + [f"tail{rng.randrange(500)}" for _ in range(1000)]
+    rng.shuffle(stream)
+    for item in stream:
+        top.add(item)
+
+    ranked = top.top(2)
+    assert [item for item, _, _ in ranked] == ["hot1", "hot2"]
+    for item, count, error in ranked:
+        true_count = stream.count(item)
+        assert count - error <= true_count <= count
+    assert top.total == len(stream)
+    assert len(top.top()) == 10
+
+
+def test_largest_values_keeps_latest_sizes() -> None:
+    """Test that only the largest current values are kept, rewrites replacing sizes."""
+    largest = LargestValues(2)
+    largest.add("a", 100)
+    largest.add("b", 50)
+    largest.add("c", 10)
+    largest.add("d", 500)
+    largest.add("a", 20)
+
+    assert largest.top() == [("d", 500), ("a", 20)]
+
+
+def test_namespaces_are_exact_and_bounded() -> None:
+    """Test exact per-namespace counters and the shared bucket past the limit."""
+    telemetry = KeyTelemetry(top_k=5, sample_rate=0.0, max_namespaces=2)
+    telemetry.record_hit("blogs", "k1", 10)
+    telemetry.record_miss("blogs", "k2")
+    telemetry.record_write("users", "k3", 30)
+    telemetry.record_hit("reviews", "k4", 5)
+
+    data = telemetry.to_data()
+    assert data.namespaces["blogs"].hit_rate == "50.00%"
+    assert data.namespaces["users"].bytes_written == 30
+    assert data.namespaces[OTHER_NAMESPACE].bytes_read == 5
+    assert data.hot_keys == []
+    assert data.largest_keys[0].key == "k3"
+
+
+def test_sampled_reads_are_scaled_back_up() -> None:
+    """Test that hot-key counts are estimated from the sample."""
+    telemetry = KeyTelemetry(top_k=5, sample_rate=0.5)
+    with patch("app.data.telemetry.random", side_effect=[0.1, 0.9] * 50):
+        for _ in range(100):
+            telemetry.record_hit(None, "hot", 1)
+
+    (hot,) = telemetry.to_data().hot_keys
+    assert hot.reads == 100
+    assert telemetry.to_data().namespaces["default"].hits == 100
+    assert telemetry.hot_key_share() == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_feeds_telemetry(cache_manager: CacheManager) -> None:
+    """Test that reads and writes through the manager reach the telemetry by namespace."""
+    assert cache_manager.telemetry is not None
+    cache_manager.telemetry.sample_rate = 1.0
+
+    await cache_manager.set("post", {"title": "x" * 100}, namespace="blogs")
+    await cache_manager.get("post", namespace="blogs")
+    await cache_manager.get("post", namespace="blogs")
+    await cache_manager.get_many(["post", "missing"], namespace="blogs")
+
+    data = cache_manager.get_telemetry()
+    blogs = data.namespaces["blogs"]
+    assert (blogs.hits, blogs.misses) == (3, 1)
+    assert blogs.bytes_read == 3 * data.largest_keys[0].size_bytes
+    assert data.hot_keys[0].key == cache_manager._build_key("post", "blogs")
+    assert data.hot_keys[0].reads == 3
+
+    cache_manager.reset_statistics()
+    assert cache_manager.get_telemetry().namespaces == {}
+
+
+def test_collector_exports_namespaces_without_keys() -> None:
+    """Test that Prometheus gets namespace series and hot-key gauges but no key labels."""
+    telemetry = KeyTelemetry(top_k=5, sample_rate=1.0)
+    telemetry.record_hit("blogs", "cache:blogs:secret-slug", 40)
+    telemetry.record_write("blogs", "cache:blogs:secret-slug", 40)
+    collector = CacheTelemetryCollector()
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    assert generate_latest(registry) == b""
+
+    collector.telemetry = telemetry
+    output = generate_latest(registry).decode()
+    assert (
+        'baliblissed_cache_namespace_requests_total{namespace="blogs",result="hit"} 1.0' in output
+    )
+    assert (
+        'baliblissed_cache_namespace_bytes_total{direction="written",namespace="blogs"} 40.0'
+        in output
+    )
+    assert "baliblissed_cache_hot_keys_read_share 1.0" in output
+    assert "baliblissed_cache_largest_value_bytes 40.0" in output
+    assert "secret-slug" not in output
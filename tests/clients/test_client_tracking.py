@@ -0,0 +1,188 @@
+"""Tests for the Redis client tracking mirror and its RedisClient integration."""
+
+from asyncio import Queue, sleep
+from collections.abc import AsyncGenerator, Callable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from app.clients.client_tracking import ClientTracking
+from app.clients.redis_client import RedisClient
+
+
+class FakeTrackingConnection:
+    """RESP3 connection stand-in whose pushes are fed through a queue."""
+
+    def __init__(self) -> None:
+        self.pushes: Queue[list[object] | Exception] = Queue()
+        self.commands: list[tuple[object, ...]] = []
+        self.handler: Callable[[list[object]], object] | None = None
+        self._parser = MagicMock()
+        self._parser.set_invalidation_push_handler.side_effect = self._set_handler
+
+    def _set_handler(self, handler: Callable[[list[object]], object]) -> None:
+        self.handler = handler
+
+    async def send_command(self, *args: object) -> None:
+        self.commands.append(args)
+
+    async def read_response(self, **kwargs: object) -> object:
+        if not kwargs.get("push_request"):
+            return "OK"
+        push = await self.pushes.get()
+        if isinstance(push, Exception):
+            raise push
+        assert self.handler is not None
+        return await self.handler(push)
+
+
+@pytest.fixture
+def tracking() -> ClientTracking:
+    """Create a tracking mirror that is live without a server."""
+    tracking = ClientTracking(prefix="cache:", max_entries=100, ttl=60)
+    tracking._ready = True
+    return tracking
+
+
+@pytest.fixture
+def redis_client(tracking: ClientTracking) -> RedisClient:
+    """Create a RedisClient with mocked pools and a live tracking mirror."""
+    client = RedisClient(tracking=tracking)
+    client._redis = AsyncMock()
+    client._binary_redis = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_the_mirror(redis_client: RedisClient) -> None:
+    """Test that a mirrored key costs one GET until the server invalidates it."""
+    redis_client.client.get = AsyncMock(side_effect=["v1", "v2"])
+
+    assert await redis_client.get("cache:post") == "v1"
+    assert await redis_client.get("cache:post") == "v1"
+    redis_client.client.get.assert_awaited_once()
+
+    assert redis_client.tracking is not None
+    await redis_client.tracking._on_invalidate(["invalidate", ["cache:post"]])
+    assert await redis_client.get("cache:post") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_only_tracked_prefix_and_present_keys_are_mirrored(
+    redis_client: RedisClient,
+) -> None:
+    """Test that keys outside the prefix and missing keys always go to Redis."""
+    redis_client.client.get = AsyncMock(return_value=None)
+    redis_client.binary_client.get = AsyncMock(return_value=b"raw")
+
+    await redis_client.get("cache:missing")
+    await redis_client.get("cache:missing")
+    await redis_client.get_bytes("blacklist:token")
+    await redis_client.get_bytes("blacklist:token")
+
+    assert redis_client.client.get.await_count == 2
+    assert redis_client.binary_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_fetches_only_unmirrored_keys(redis_client: RedisClient) -> None:
+    """Test that MGET only asks for keys the mirror does not hold."""
+    redis_client.binary_client.mget = AsyncMock(side_effect=[[b"a", None], [b"c"]])
+
+    assert await redis_client.get_many_bytes(["cache:a", "cache:b"]) == [b"a", None]
+    assert await redis_client.get_many_bytes(["cache:c", "cache:a"]) == [b"c", b"a"]
+    assert redis_client.binary_client.mget.await_args.args == (["cache:c"],)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_read_discards_value(redis_client: RedisClient) -> None:
+    """Test that a value is not mirrored when its invalidation raced the read."""
+    assert redis_client.tracking is not None
+    tracking = redis_client.tracking
+
+    async def racing_get(key: str) -> str:
+        await tracking._on_invalidate(["invalidate", [key]])
+        return "old"
+
+    redis_client.client.get = AsyncMock(side_effect=racing_get)
+    assert await redis_client.get("cache:post") == "old"
+    assert tracking.text.get("cache:post") is None
+
+
+@pytest.mark.asyncio
+async def test_writes_and_flushes_drop_mirrored_values(redis_client: RedisClient) -> None:
+    """Test that own writes are visible at once and a null push clears everything."""
+    assert redis_client.tracking is not None
+    tracking = redis_client.tracking
+    redis_client.client.get = AsyncMock(side_effect=["v1", "v2", "v3"])
+
+    await redis_client.get("cache:post")
+    await redis_client.set("cache:post", "v2")
+    assert await redis_client.get("cache:post") == "v2"
+
+    await tracking._on_invalidate(["invalidate", None])
+    assert len(tracking.text) == 0
+    assert tracking.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_start_falls_back_when_tracking_is_unsupported() -> None:
+    """Test that a server rejecting RESP3 leaves reads going straight to Redis."""
+    tracking = ClientTracking(prefix="cache:")
+    pool = MagicMock()
+    pool.get_connection = AsyncMock(side_effect=ResponseError("unknown command 'HELLO'"))
+    pool.disconnect = AsyncMock()
+
+    with patch("app.clients.client_tracking.ConnectionPool", return_value=pool):
+        assert not await tracking.start({"host": "localhost"})
+
+    assert not tracking.ready
+    assert tracking.lookup(tracking.text, ["cache:post"]) == [None]
+
+
+@pytest.fixture
+async def live_tracking() -> AsyncGenerator[tuple[ClientTracking, list[FakeTrackingConnection]]]:
+    """Start tracking against fake connections, one per (re)connection."""
+    connections: list[FakeTrackingConnection] = []
+
+    async def get_connection() -> FakeTrackingConnection:
+        connections.append(FakeTrackingConnection())
+        return connections[-1]
+
+    pool = MagicMock()
+    pool.get_connection = AsyncMock(side_effect=get_connection)
+    pool.disconnect = AsyncMock()
+    pool.release = AsyncMock()
+    tracking = ClientTracking(prefix="cache:")
+    tracking.RETRY_DELAY = 0.01
+
+    with patch("app.clients.client_tracking.ConnectionPool", return_value=pool):
+        assert await tracking.start({"host": "localhost"})
+    yield tracking, connections
+    await tracking.stop()
+
+
+@pytest.mark.asyncio
+async def test_pushes_invalidate_and_lost_connection_reconnects(
+    live_tracking: tuple[ClientTracking, list[FakeTrackingConnection]],
+) -> None:
+    """Test broadcast tracking, push handling and recovery from a dropped connection."""
+    tracking, connections = live_tracking
+    assert connections[0].commands == [("CLIENT", "TRACKING", "ON", "BCAST", "PREFIX", "cache:")]
+
+    tracking.text.set("cache:a", "1")
+    await connections[0].pushes.put(["invalidate", ["cache:a"]])
+    await sleep(0)
+    assert tracking.text.get("cache:a") is None
+
+    tracking.text.set("cache:b", "2")
+    await connections[0].pushes.put(RedisConnectionError("connection reset"))
+    await sleep(0)
+    assert not tracking.ready
+    assert len(tracking.text) == 0
+
+    await sleep(0.05)
+    assert len(connections) == 2
+    assert tracking.ready
@@ -0,0 +1,158 @@
+"""Tests for batching of concurrent Redis reads and its RedisClient integration."""
+
+from asyncio import create_task, gather, sleep
+from typing import Self
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from app.clients.command_batcher import CommandBatcher
+from app.clients.redis_client import RedisClient
+
+
+class FakePipeline:
+    """Pipeline stand-in answering commands from the data of its client."""
+
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.commands: list[tuple[str, ...]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def execute_command(self, *args: str) -> None:
+        self.commands.append(args)
+
+    async def execute(self, *, raise_on_error: bool = True) -> list[object]:
+        assert not raise_on_error
+        self.client.pipelines.append(self.commands)
+        await sleep(0)
+        if self.client.error is not None:
+            raise self.client.error
+        return [self.client.reply(*args) for args in self.commands]
+
+
+class FakeRedis:
+    """Redis stand-in recording the commands of each pipeline sent to it."""
+
+    def __init__(self, data: dict[str, str]) -> None:
+        self.data = data
+        self.pipelines: list[list[tuple[str, ...]]] = []
+        self.error: Exception | None = None
+
+    def pipeline(self, *, transaction: bool = True) -> FakePipeline:
+        assert not transaction
+        return FakePipeline(self)
+
+    def reply(self, command: str, *keys: str) -> str | int | Exception | None:
+        if command == "GET":
+            return self.data.get(keys[0])
+        if command == "EXISTS":
+            return sum(key in self.data for key in keys)
+        return ResponseError(f"unknown command '{command}'")
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """Create a fake Redis holding two keys."""
+    return FakeRedis({"cache:a": "1", "token:blacklist:x": "1"})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_pipeline(fake_redis: FakeRedis) -> None:
+    """Test that reads issued in the same tick go out together, duplicates once."""
+    client = RedisClient(batcher=CommandBatcher())
+    client._redis = fake_redis  # type: ignore[assignment]
+
+    results = await gather(
+        client.get("cache:a"),
+        client.get("cache:a"),
+        client.get("cache:b"),
+        client.exists("token:blacklist:x"),
+        client.exists("token:blacklist:y"),
+    )
+
+    assert results == ["1", "1", None, 1, 0]
+    assert fake_redis.pipelines == [
+        [
+            ("GET", "cache:a"),
+            ("GET", "cache:b"),
+            ("EXISTS", "token:blacklist:x"),
+            ("EXISTS", "token:blacklist:y"),
+        ],
+    ]
+    assert client.batcher is not None
+    assert client.batcher.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_window_and_max_batch_bound_each_pipeline(fake_redis: FakeRedis) -> None:
+    """Test that the window spans ticks and a full batch is sent without waiting."""
+    batcher = CommandBatcher(window=0.01, max_batch=3)
+
+    async def staggered(key: str) -> str | None:
+        await sleep(0)
+        return await batcher.execute(fake_redis, "GET", key)  # type: ignore[arg-type]
+
+    results = await gather(*(staggered(f"cache:{key}") for key in "abcd"))
+
+    assert results == ["1", None, None, None]
+    assert [len(commands) for commands in fake_redis.pipelines] == [3, 1]
+    assert batcher.info()["batches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter(fake_redis: FakeRedis) -> None:
+    """Test that a failed round trip fails the whole batch and error replies only theirs."""
+    batcher = CommandBatcher()
+
+    results = await gather(
+        batcher.execute(fake_redis, "GET", "cache:a"),  # type: ignore[arg-type]
+        batcher.execute(fake_redis, "NOPE", "cache:a"),  # type: ignore[arg-type]
+        return_exceptions=True,
+    )
+    assert results[0] == "1"
+    assert isinstance(results[1], ResponseError)
+
+    fake_redis.error = RedisConnectionError("connection reset")
+    results = await gather(
+        batcher.execute(fake_redis, "GET", "cache:a"),  # type: ignore[arg-type]
+        batcher.execute(fake_redis, "GET", "cache:b"),  # type: ignore[arg-type]
+        return_exceptions=True,
+    )
+    assert all(result is fake_redis.error for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_reply(fake_redis: FakeRedis) -> None:
+    """Test that cancelling one waiter leaves the others sharing its command served."""
+    batcher = CommandBatcher(window=0.01)
+    first = create_task(batcher.execute(fake_redis, "GET", "cache:a"))  # type: ignore[arg-type]
+    second = create_task(batcher.execute(fake_redis, "GET", "cache:a"))  # type: ignore[arg-type]
+    await sleep(0)
+
+    first.cancel()
+    assert await second == "1"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_sends_open_batches() -> None:
+    """Test that closing the client flushes queued reads instead of stranding them."""
+    batcher = CommandBatcher(window=60)
+    fake_redis = FakeRedis({"cache:a": "1"})
+    client = RedisClient(batcher=batcher)
+    client._redis = fake_redis  # type: ignore[assignment]
+    client._pool = AsyncMock()
+    fake_redis.aclose = AsyncMock()  # type: ignore[attr-defined]
+
+    pending = create_task(client.get("cache:a"))
+    await sleep(0)
+    await client.disconnect()
+
+    assert await pending == "1"
@@ -1,5 +1,6 @@
 """Tests for app/clients/protocols.py."""
 
+from collections.abc import Mapping, Sequence
 from logging import DEBUG, INFO
 from typing import Any
 
@@ -49,6 +50,30 @@ class MockCacheClient:
         self.store[key] = (value, ex)
         return True
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get a value from the cache as bytes."""
+        value = await self.get(key)
+        return value.encode("utf-8") if value is not None else None
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        """Get many values from the cache."""
+        return [await self.get(key) for key in keys]
+
+    async def get_many_bytes(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values from the cache as bytes."""
+        return [await self.get_bytes(key) for key in keys]
+
+    async def set_many(self, items: Mapping[str, tuple[str, int | None]]) -> bool:
+        """Set many values in the cache."""
+        self.store.update(items)
+        return True
+
+    async def incr(self, key: str) -> int:
+        """Increment an integer value."""
+        value, ex = self.store.get(key, ("0", None))
+        self.store[key] = (str(int(value) + 1), ex)
+        return int(value) + 1
+
     async def delete(self, *keys: str) -> int:
         """Delete keys from the cache."""
         count = 0
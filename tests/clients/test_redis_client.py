@@ -1,8 +1,10 @@
 """Tests for app/clients/redis_client.py."""
 
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.asyncio.cluster import RedisCluster
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 
@@ -10,6 +12,7 @@ from app.clients.redis_client import (
     RETRIABLE_EXCEPTIONS,
     RedisClient,
 )
+from app.configs.redis import RedisConfig
 from app.decorators.with_retry import _log_before_sleep, with_retry
 
 
@@ -188,6 +191,128 @@ class TestRedisClientOperations:
         result = await client.delete()
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_get_many_uses_mget(self) -> None:
+        """Test that get_many issues one MGET and skips empty batches."""
+        client = RedisClient()
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=["v1", None])
+        client._redis = mock_redis
+
+        assert await client.get_many([]) == []
+        assert await client.get_many(["k1", "k2"]) == ["v1", None]
+        mock_redis.mget.assert_awaited_once_with(["k1", "k2"])
+
+    @pytest.mark.asyncio
+    async def test_bytes_reads_use_binary_client(self) -> None:
+        """Test that get_bytes and get_many_bytes bypass the decoding pool."""
+        client = RedisClient()
+        client._redis = AsyncMock()
+        binary = AsyncMock()
+        binary.get = AsyncMock(return_value=b"\xfe\x01\x00{}")
+        binary.mget = AsyncMock(return_value=[b"v1", None])
+        client._binary_redis = binary
+
+        assert await client.get_bytes("k1") == b"\xfe\x01\x00{}"
+        assert await client.get_many_bytes(["k1", "k2"]) == [b"v1", None]
+        client._redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_per_key_ttl(self) -> None:
+        """Test that set_many queues one SET per key in a single pipeline."""
+        client = RedisClient()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
+        client._redis = mock_redis
+
+        assert await client.set_many({"k1": ("v1", 60), "k2": ("v2", None)})
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_any_call("k1", "v1", ex=60)
+        pipe.set.assert_any_call("k2", "v2", ex=None)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_uses_set_nx_px(self) -> None:
+        """Test that a lease is taken with SET NX PX."""
+        client = RedisClient()
+        mock_redis = AsyncMock()
+        mock_redis.set = AsyncMock(side_effect=[True, None])
+        client._redis = mock_redis
+
+        assert await client.acquire_lease("lease:k", "token", 5000)
+        assert not await client.acquire_lease("lease:k", "other", 5000)
+        mock_redis.set.assert_any_await("lease:k", "token", nx=True, px=5000)
+
+    @pytest.mark.asyncio
+    async def test_release_lease_checks_token(self) -> None:
+        """Test that a lease is released via the compare-and-delete script."""
+        client = RedisClient()
+        mock_redis = AsyncMock()
+        mock_redis.eval = AsyncMock(return_value=0)
+        client._redis = mock_redis
+
+        assert not await client.release_lease("lease:k", "stale-token")
+        assert mock_redis.eval.await_args.args[1:] == (1, "lease:k", "stale-token")
+
+
+class TestRedisClientCluster:
+    """Tests for RedisClient in Redis Cluster mode."""
+
+    @pytest.mark.asyncio
+    @patch("app.clients.redis_client.ConnectionPool")
+    @patch("app.clients.redis_client.RedisCluster")
+    async def test_connect_uses_startup_nodes(
+        self,
+        mock_cluster: MagicMock,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test that both clients are cluster clients and tracking is turned off."""
+        mock_cluster.return_value.ping = AsyncMock(return_value=True)
+        client = RedisClient(tracking=MagicMock())
+        client.cluster_nodes = [("10.0.0.1", 7000), ("10.0.0.2", 7001)]
+
+        await client.connect()
+
+        assert [c.kwargs["decode_responses"] for c in mock_cluster.call_args_list] == [True, False]
+        nodes = mock_cluster.call_args.kwargs["startup_nodes"]
+        assert [(node.host, node.port) for node in nodes] == client.cluster_nodes
+        assert "db" not in mock_cluster.call_args.kwargs
+        mock_pool.assert_not_called()
+        assert client.tracking is None
+        assert client.is_connected
+
+    @pytest.mark.asyncio
+    async def test_reads_and_scans_span_nodes(self) -> None:
+        """Test that MGET is split per slot and scans go through the cluster client."""
+        client = RedisClient()
+        cluster = MagicMock(spec=RedisCluster)
+        cluster.mget_nonatomic = AsyncMock(return_value=["v1", None])
+
+        async def scan_iter(**_: object) -> AsyncGenerator[str]:
+            for key in ("cache:{a}:1", b"cache:{b}:2"):
+                yield key
+
+        cluster.scan_iter = scan_iter
+        client._redis = cluster
+
+        assert await client.get_many(["k1", "k2"]) == ["v1", None]
+        cluster.mget_nonatomic.assert_awaited_once_with(["k1", "k2"])
+        assert [key async for key in client.scan_iter("cache:*")] == [
+            "cache:{a}:1",
+            "cache:{b}:2",
+        ]
+
+    def test_startup_nodes_parsing(self) -> None:
+        """Test host:port parsing, including default ports and IPv6 addresses."""
+        config = RedisConfig(cluster_nodes="a:7000, b ,[::1]:7002,", port=6380)
+
+        assert config.cluster_startup_nodes == [("a", 7000), ("b", 6380), ("::1", 7002)]
+        assert RedisConfig(cluster_nodes="").cluster_startup_nodes == []
+
 
 class TestRedisHealthCheck:
     """Tests for RedisClient health_check method."""
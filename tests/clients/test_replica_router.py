@@ -0,0 +1,213 @@
+"""Tests for routing cache reads to read replicas and its RedisClient integration."""
+
+from time import monotonic
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.clients.near_cache import NearCache
+from app.clients.redis_client import RedisClient
+from app.clients.replica_router import ReplicaRouter, _Replica, request_writes
+from app.managers.cache_manager import CacheManager
+from app.managers.login_attempt_tracker import LoginAttemptTracker
+from app.managers.token_blacklist import TokenBlacklist
+
+
+def _router(consistency: str = "read_your_writes", replicas: int = 2) -> ReplicaRouter:
+    """Create a router whose replicas have mocked clients and are in sync."""
+    router = ReplicaRouter(
+        nodes=[("replica", 6380 + i) for i in range(replicas)],
+        consistency=consistency,  # type: ignore[arg-type]
+    )
+    for host, port in router.nodes:
+        replica = _Replica({}, host, port)
+        replica.client = AsyncMock()
+        replica.binary_client = AsyncMock()
+        replica.synced_at = monotonic()
+        router._replicas.append(replica)
+    return router
+
+
+def _client(router: ReplicaRouter) -> RedisClient:
+    """Create a client on a mocked primary that routes reads through router."""
+    client = RedisClient(replicas=router)
+    client._redis = AsyncMock()
+    client._redis.scan.return_value = (0, [])
+    client._binary_redis = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_reads_spread_over_replicas_and_writes_stay_on_primary() -> None:
+    """Test that reads go round-robin to replicas while writes go to the primary."""
+    router = _router()
+    client = _client(router)
+    first, second = router._replicas
+    first.client.get.return_value = "a"
+    second.client.get.return_value = "b"
+    first.binary_client.mget.return_value = [b"raw"]
+
+    assert [await client.get("k", replica_ok=True), await client.get("k", replica_ok=True)] == [
+        "a",
+        "b",
+    ]
+    assert await client.get_many_bytes(["k"], replica_ok=True) == [b"raw"]
+    await client.set("k", "v")
+    await client.delete("k")
+
+    client._redis.set.assert_awaited_once()
+    client._redis.delete.assert_awaited_once_with("k")
+    client._redis.get.assert_not_awaited()
+    assert router.replica_reads == 3
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_within_request() -> None:
+    """Test that keys written in the request, and scans after a write, hit the primary."""
+    router = _router()
+    client = _client(router)
+    client._redis.exists.return_value = 1
+    client._redis.scan.return_value = (0, ["k"])
+
+    token = request_writes.set(set())
+    try:
+        await client.set("k", "v")
+        assert await client.exists("k", replica_ok=True) == 1
+        await client.ttl("other", replica_ok=True)
+        assert [key async for key in client.scan_iter("*", replica_ok=True)] == ["k"]
+    finally:
+        request_writes.reset(token)
+
+    client._redis.exists.assert_awaited_once_with("k")
+    client._redis.ttl.assert_not_awaited()
+    assert router.primary_reads == 2
+    assert router.replica_reads == 1
+
+    # The next request starts without writes
+    await client.exists("k", replica_ok=True)
+    assert router.replica_reads == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_lag_reads_own_writes_from_replicas() -> None:
+    """Test that the bounded-lag policy also serves keys the request wrote from replicas."""
+    router = _router(consistency="bounded_lag", replicas=1)
+    client = _client(router)
+
+    token = request_writes.set(set())
+    try:
+        await client.set("k", "v")
+        await client.get("k", replica_ok=True)
+    finally:
+        request_writes.reset(token)
+
+    router._replicas[0].client.get.assert_awaited_once_with("k")
+    client._redis.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lagging_and_unreachable_replicas_are_skipped() -> None:
+    """Test that only replicas holding the primary's recent offset serve reads."""
+    router = _router(replicas=3)
+    client = _client(router)
+    router._primary = client._redis
+    behind, down, synced = router._replicas
+    for replica in router._replicas:
+        replica.synced_at = float("-inf")
+    client._redis.info.return_value = {"master_repl_offset": 500}
+    behind.client.info.return_value = {"master_link_status": "up", "slave_repl_offset": 400}
+    down.client.info.side_effect = RedisConnectionError("Connection refused")
+    synced.client.info.return_value = {"master_link_status": "up", "slave_repl_offset": 500}
+
+    await router._check()
+    assert behind.synced_at == float("-inf")
+    assert {router.pick(["k"]) for _ in range(3)} == {synced.client}
+
+    # A replica behind the latest sample is trusted up to the sample it reached
+    reached_at = monotonic() - router.max_lag / 2
+    router._samples[0] = (reached_at, 400)
+    client._redis.info.return_value = {"master_repl_offset": 600}
+    await router._check()
+    assert behind.synced_at == reached_at
+    assert {router.pick(["k"]) for _ in range(3)} == {behind.client, synced.client}
+
+    behind.synced_at -= router.max_lag
+    synced.synced_at -= 2 * router.max_lag
+    assert router.pick(["k"]) is None
+    await client.get("k", replica_ok=True)
+    client._redis.get.assert_awaited_once_with("k")
+    assert router.info()["replicas"]["replica:6381"] is None
+
+
+@pytest.mark.asyncio
+async def test_security_reads_and_deleting_scans_stay_on_primary() -> None:
+    """Test that revocation, lockout and clear scans never see a lagging replica."""
+    router = _router()
+    client = _client(router)
+    client._redis.exists.return_value = 1
+    client._redis.ttl.return_value = 60
+    client._redis.get.return_value = "2"
+
+    assert await TokenBlacklist(client).is_blacklisted("jti")
+    tracker = LoginAttemptTracker(client)
+    assert await tracker.is_locked_out("user") == (True, 60)
+    assert await tracker.get_attempts_count("user") == 2
+    assert await tracker.record_failed_attempt("user") == 3
+    assert [key async for key in client.scan_iter("cache:*")] == []
+
+    assert router.replica_reads == 0
+    for replica in router._replicas:
+        replica.client.exists.assert_not_awaited()
+        replica.client.ttl.assert_not_awaited()
+        replica.client.get.assert_not_awaited()
+        replica.client.scan.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_lookups_use_replicas() -> None:
+    """Test that cache lookups opt into replicas while namespace clears scan the primary."""
+    manager = CacheManager()
+    router = _router(replicas=1)
+    manager.redis_client = _client(router)
+    manager._replica_reader.client = manager.redis_client
+    manager._client = manager.redis_client
+    manager.is_redis_available = True
+    replica = router._replicas[0]
+    replica.binary_client.get.return_value = None
+    replica.client.exists.return_value = 0
+
+    assert await manager.get("key") is None
+    assert await manager.exists("key") == 0
+    assert await manager.clear(namespace="blogs") == 0
+
+    assert router.replica_reads == 2
+    manager.redis_client._redis.scan.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_near_cache_is_filled_from_the_primary() -> None:
+    """Test that a lagging replica's old value never lands in an active near cache."""
+    manager = CacheManager()
+    router = _router(replicas=1)
+    manager.redis_client = _client(router)
+    manager._replica_reader.client = manager.redis_client
+    manager._client = manager.redis_client
+    manager.is_redis_available = True
+    manager.near_cache = NearCache(max_entries=100, ttl=30)
+    manager._near_cache_ready = True
+    replica = router._replicas[0]
+    # The replica has not applied the latest write or tag invalidation yet
+    replica.binary_client.get.return_value = manager._encode("old")[1]
+    replica.binary_client.mget.return_value = [b"1"]
+    manager.redis_client._binary_redis.get.return_value = manager._encode("new")[1]
+    manager.redis_client._binary_redis.mget.return_value = [b"2"]
+
+    assert await manager.get("key") == "new"
+    assert await manager.get("key") == "new"
+    assert await manager.tag_versions(["blogs"]) == [2]
+
+    assert router.replica_reads == 0
+    manager.redis_client._binary_redis.get.assert_awaited_once()
+    replica.binary_client.get.assert_not_awaited()
+    replica.binary_client.mget.assert_not_awaited()
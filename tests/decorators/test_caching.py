@@ -1,16 +1,20 @@
 # tests/decorators/test_caching.py
 """Tests for app/decorators/caching.py module."""
 
+from asyncio import gather, sleep
 from collections.abc import AsyncGenerator
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import Request
-from pydantic import BaseModel
+from fastapi import HTTPException, Request, Response
+from orjson import loads
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.datastructures import Headers
 
 from app.decorators.caching import (
-    _generate_cache_key,
+    _compile_key_builder,
+    _type_adapter,
     cache_busting,
     cached,
     validate_cache,
@@ -25,6 +29,14 @@ class SampleModel(BaseModel):
     name: str
 
 
+class AliasedModel(BaseModel):
+    """Sample model serialized by alias, like the camelCase API schemas."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    view_count: int = Field(alias="viewCount")
+
+
 @pytest.fixture
 async def test_cache_manager() -> AsyncGenerator[CacheManager]:
     """Create a test cache manager with memory client."""
@@ -45,31 +57,51 @@ def mock_request(test_cache_manager: CacheManager) -> Request:
     return request
 
 
-class TestGenerateCacheKey:
-    """Tests for _generate_cache_key function."""
+def _sample_endpoint(request: Request, item_id: int, filters: dict[str, str] | None = None) -> None:
+    """Endpoint-like function whose default cache key is under test."""
+
+
+class TestCompileKeyBuilder:
+    """Tests for _compile_key_builder function."""
 
     def test_generates_key_from_function_name(self) -> None:
-        """Test key generation with just function name."""
-        key = _generate_cache_key("my_function")
+        """Test key generation for a function without arguments."""
+
+        def my_function() -> None:
+            pass
+
+        key = _compile_key_builder(my_function)()
         assert isinstance(key, str)
         assert len(key) == 16
 
     def test_generates_different_keys_for_different_args(self) -> None:
         """Test that different args produce different keys."""
-        key1 = _generate_cache_key("func", [1])
-        key2 = _generate_cache_key("func", [3])
-        assert key1 != key2
+        build_key = _compile_key_builder(_sample_endpoint)
+        assert build_key(item_id=1) != build_key(item_id=3)
 
     def test_generates_different_keys_for_different_kwargs(self) -> None:
         """Test that different kwargs produce different keys."""
-        key1 = _generate_cache_key("func", name={"a": "alice"})
-        key2 = _generate_cache_key("func", name={"b": "bob"})
+        build_key = _compile_key_builder(_sample_endpoint)
+        key1 = build_key(item_id=1, filters={"a": "alice"})
+        key2 = build_key(item_id=1, filters={"b": "bob"})
         assert key1 != key2
 
-    def test_handles_complex_args(self) -> None:
-        """Test with complex argument types."""
-        key = _generate_cache_key("func", [1, 2, 3], name={"nested": "dict"})
-        assert isinstance(key, str)
+    def test_positional_and_keyword_calls_match(self) -> None:
+        """Test that arguments are keyed by parameter name, however they are passed."""
+        build_key = _compile_key_builder(_sample_endpoint)
+        request = MagicMock(spec=Request)
+        assert build_key(request, 1, {"a": "b"}) == build_key(
+            request=request,
+            item_id=1,
+            filters={"a": "b"},
+        )
+
+    def test_skips_request_scoped_params(self) -> None:
+        """Test that request-typed parameters do not affect the key."""
+        build_key = _compile_key_builder(_sample_endpoint)
+        key1 = build_key(request=MagicMock(spec=Request), item_id=1)
+        key2 = build_key(request=MagicMock(spec=Request), item_id=1)
+        assert key1 == key2
 
     def test_handles_non_serializable_args(self) -> None:
         """Test handling of non-serializable arguments."""
@@ -77,15 +109,23 @@ class TestGenerateCacheKey:
         class NonSerializable:
             pass
 
-        # Should not raise, just skip the argument
-        key = _generate_cache_key("func", [NonSerializable()])
+        def func(value: object) -> None:
+            pass
+
+        # Should not raise
+        key = _compile_key_builder(func)(NonSerializable())
         assert isinstance(key, str)
 
-    def test_consistent_keys_for_same_input(self) -> None:
-        """Test that same inputs produce same key."""
-        key1 = _generate_cache_key("func", [1], name={"test": "value"})
-        key2 = _generate_cache_key("func", [1], name={"test": "value"})
-        assert key1 == key2
+    def test_keys_extra_args_and_kwargs(self) -> None:
+        """Test that *args / **kwargs the signature does not name still vary the key."""
+
+        def func(*args: object, **kwargs: object) -> None:
+            pass
+
+        build_key = _compile_key_builder(func)
+        assert build_key(1) != build_key(2)
+        assert build_key(name="a") != build_key(name="b")
+        assert build_key(1, name="a") == build_key(1, name="a")
 
 
 class TestValidateResponse:
@@ -114,6 +154,10 @@ class TestValidateResponse:
         assert isinstance(result, SampleModel)
         assert isinstance(result2, SampleModel)
 
+    def test_type_adapter_is_built_once(self) -> None:
+        """Test that the TypeAdapter for an annotation is reused across calls."""
+        assert _type_adapter(list[SampleModel]) is _type_adapter(list[SampleModel])
+
 
 class TestCachedDecorator:
     """Tests for cached decorator."""
@@ -222,6 +266,260 @@ class TestCachedDecorator:
         result2 = await get_sample(mock_request)
         assert isinstance(result2, SampleModel)
 
+    @pytest.mark.asyncio
+    async def test_stale_value_served_and_refreshed(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that a stale cached result is returned and refreshed in the background."""
+        call_count = 0
+
+        @cached(ttl=60, stale_ttl=300)
+        async def get_data(request: Request) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            return SampleModel(id=call_count, name="test")
+
+        with patch("app.managers.cache_manager.time", return_value=0.0):
+            assert await get_data(mock_request) == SampleModel(id=1, name="test")
+
+        # Soft TTL has elapsed: the stale result is served immediately
+        assert await get_data(mock_request) == SampleModel(id=1, name="test")
+        await gather(*test_cache_manager._refresh_tasks.values())
+
+        assert call_count == 2
+        assert await get_data(mock_request) == SampleModel(id=2, name="test")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_are_coalesced(self, mock_request: Request) -> None:
+        """Test that concurrent misses run the endpoint once and get separate copies."""
+        call_count = 0
+
+        @cached(ttl=60)
+        async def get_data(request: Request) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            await sleep(0.05)
+            return SampleModel(id=1, name="test")
+
+        results = await gather(*(get_data(mock_request) for _ in range(5)))
+
+        assert call_count == 1
+        assert all(result == SampleModel(id=1, name="test") for result in results)
+        assert len({id(result) for result in results}) == len(results)
+
+    @pytest.mark.asyncio
+    async def test_prerendered_hits_return_stored_body(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that prerender stores the aliased JSON body and serves it as a Response."""
+        call_count = 0
+
+        @cached(ttl=60, key_builder=lambda request: "rendered", prerender=True)
+        async def get_items(request: Request) -> list[AliasedModel]:
+            nonlocal call_count
+            call_count += 1
+            return [AliasedModel(view_count=3)]
+
+        first = await get_items(mock_request)
+        second = await get_items(mock_request)
+
+        assert call_count == 1
+        assert isinstance(first, Response)
+        assert isinstance(second, Response)
+        assert first is not second
+        assert loads(second.body) == [{"viewCount": 3}]
+        assert second.media_type == "application/json"
+        assert (await test_cache_manager.get("rendered"))["body"] == '[{"viewCount":3}]'
+
+    @pytest.mark.asyncio
+    async def test_prerender_reads_entries_cached_without_it(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that switching prerender on still serves values cached as plain JSON."""
+        await test_cache_manager.set("plain", [{"id": 1, "name": "test"}])
+
+        @cached(ttl=60, key_builder=lambda request: "plain", prerender=True)
+        async def get_items(request: Request) -> list[SampleModel]:
+            raise AssertionError
+
+        assert await get_items(mock_request) == [SampleModel(id=1, name="test")]
+
+    @pytest.mark.asyncio
+    async def test_conditional_get_answers_304(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that prerendered responses carry validators and matching ETags get a 304."""
+        call_count = 0
+
+        def request_with(headers: dict[str, str]) -> Request:
+            request = MagicMock(spec=Request)
+            request.app = mock_request.app
+            request.headers = Headers(headers)
+            return request
+
+        @cached(
+            ttl=60,
+            key_builder=lambda **kw: "conditional",
+            prerender=True,
+            cache_control="public, max-age=60",
+        )
+        async def get_item(request: Request, response: Response) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            response.headers["Last-Modified"] = "Fri, 02 Jan 2026 00:00:00 GMT"
+            return SampleModel(id=1, name="test")
+
+        first = await get_item(request=request_with({}), response=Response())
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "public, max-age=60"
+        assert first.headers["last-modified"] == "Fri, 02 Jan 2026 00:00:00 GMT"
+
+        hit = await get_item(request=request_with({"if-none-match": etag}), response=Response())
+        assert hit.status_code == 304
+        assert hit.body == b""
+        assert hit.headers["etag"] == etag
+        assert call_count == 1
+
+        changed = await get_item(
+            request=request_with({"if-none-match": '"stale"'}),
+            response=Response(),
+        )
+        assert changed.status_code == 200
+        assert loads(changed.body) == {"id": 1, "name": "test"}
+
+        # A miss answers a matching conditional request too
+        await test_cache_manager.clear()
+        miss = await get_item(
+            request=request_with({"if-none-match": f'"other", W/{etag}'}),
+            response=Response(),
+        )
+        assert miss.status_code == 304
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_until_busted(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that a 404 is replayed from cache and a bust lets the endpoint run again."""
+        call_count = 0
+        exists = False
+
+        @cached(ttl=60, namespace="items", key_builder=lambda **kw: "item_1", cache_not_found=True)
+        async def get_item(request: Request) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            if not exists:
+                raise HTTPException(status_code=404, detail="Item 1 not found")
+            return SampleModel(id=1, name="test")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_item(request=mock_request)
+            assert exc_info.value.status_code == 404
+            assert exc_info.value.detail == "Item 1 not found"
+        assert call_count == 1
+
+        exists = True
+        await test_cache_manager.delete("item_1", namespace="items")
+        assert await get_item(request=mock_request) == SampleModel(id=1, name="test")
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_cached_by_default(self, mock_request: Request) -> None:
+        """Test that without cache_not_found every 404 runs the endpoint."""
+        call_count = 0
+
+        @cached(ttl=60)
+        async def get_item(request: Request) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await get_item(mock_request)
+        assert call_count == 2
+
+    def test_cache_control_requires_prerender(self) -> None:
+        """Test that cache_control is rejected for endpoints returning plain values."""
+        with pytest.raises(ValueError, match="prerender"):
+            cached(ttl=60, cache_control="no-cache")
+
+    @pytest.mark.asyncio
+    async def test_default_key_ignores_request_and_call_style(self, mock_request: Request) -> None:
+        """Test that the default key skips the Request and matches args by parameter name."""
+        call_count = 0
+        other_request = MagicMock(spec=Request)
+        other_request.app = mock_request.app
+
+        @cached(ttl=60)
+        async def get_item(request: Request, item_id: int) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            return SampleModel(id=item_id, name="test")
+
+        await get_item(mock_request, 1)
+        await get_item(request=other_request, item_id=1)
+        assert call_count == 1
+
+        await get_item(mock_request, item_id=2)
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_signature_is_inspected_at_decoration(self, mock_request: Request) -> None:
+        """Test that calls reuse the signature analysis done when decorating."""
+
+        @cached(ttl=60)
+        async def get_data(request: Request) -> SampleModel:
+            return SampleModel(id=1, name="test")
+
+        with patch("app.decorators.caching.signature") as mock_signature:
+            await get_data(mock_request)
+            await get_data(request=mock_request)
+
+        mock_signature.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_stores_entry_served_to_requests(
+        self,
+        mock_request: Request,
+        test_cache_manager: CacheManager,
+    ) -> None:
+        """Test that warm stores the entry a later request hits, under its tagged key."""
+        call_count = 0
+
+        @cached(
+            ttl=60,
+            namespace="warm",
+            key_builder=lambda **kw: f"item_{kw['item_id']}",
+            tags=["items"],
+            prerender=True,
+        )
+        async def get_item(request: Request, response: Response, item_id: int) -> SampleModel:
+            nonlocal call_count
+            call_count += 1
+            response.headers["Last-Modified"] = "Fri, 02 Jan 2026 00:00:00 GMT"
+            return SampleModel(id=item_id, name="warm")
+
+        await get_item.warm(test_cache_manager, request=None, response=Response(), item_id=7)
+        assert call_count == 1
+
+        hit = await get_item(request=mock_request, response=Response(), item_id=7)
+        assert call_count == 1
+        assert loads(hit.body) == {"id": 7, "name": "warm"}
+        assert hit.headers["last-modified"] == "Fri, 02 Jan 2026 00:00:00 GMT"
+
 
 class TestCacheBustingDecorator:
     """Tests for cache_busting decorator."""
@@ -247,6 +545,33 @@ class TestCacheBustingDecorator:
         cached = await test_cache_manager.get("item_1")
         assert cached is None
 
+    @pytest.mark.asyncio
+    async def test_invalidates_tagged_pages(
+        self,
+        mock_request: Request,
+    ) -> None:
+        """Test that busting a tag drops every page cached under it."""
+        call_count = 0
+
+        @cached(ttl=300, key_builder=lambda request, page: f"page_{page}", tags=["list"])
+        async def get_page(request: Request, page: int) -> dict[str, int]:
+            nonlocal call_count
+            call_count += 1
+            return {"page": page}
+
+        @cache_busting(tags=["list"])
+        async def add_item(request: Request) -> None:
+            return None
+
+        for page in (0, 1, 0, 1):
+            await get_page(mock_request, page)
+        assert call_count == 2
+
+        await add_item(mock_request)
+        for page in (0, 1):
+            assert await get_page(mock_request, page) == {"page": page}
+        assert call_count == 4
+
     @pytest.mark.asyncio
     async def test_with_custom_key_builder(
         self,
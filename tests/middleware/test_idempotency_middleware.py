@@ -18,6 +18,7 @@ from httpx import ASGITransport, AsyncClient
 from redis.exceptions import RedisError
 
 from app.middleware.idempotency import IdempotencyMiddleware, InitContext
+from app.stores.idempotency import RedisIdempotencyStore
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -321,3 +322,28 @@ async def test_failed_state_returns_409_with_retry_after() -> None:
     assert resp.status_code == 409
     assert resp.json()["error"] == "request_failed"
     assert resp.headers.get("Retry-After") is not None
+
+
+async def test_store_replays_records_under_pre_hash_tag_keys() -> None:
+    """Records stored under the key format without hash tag should be found when enabled."""
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(return_value=None)
+    legacy = {f"idemp:user-1:{VALID_UUID}": b'{"status": "completed", "body_hash": "abc"}'}
+    redis.get = AsyncMock(side_effect=legacy.get)
+
+    # Off by default: no extra round trip per request
+    key = f"idemp:{{user-1}}:{VALID_UUID}"
+    assert await RedisIdempotencyStore(redis).acquire(key, "abc", 60) is None
+    redis.get.assert_not_awaited()
+    redis.register_script.return_value.reset_mock()
+
+    store = RedisIdempotencyStore(redis, legacy_keys=True)
+
+    assert await store.acquire(key, "abc", 60) == {
+        "status": "completed",
+        "body_hash": "abc",
+    }
+    redis.register_script.return_value.assert_not_awaited()
+
+    assert await store.acquire(f"idemp:{{user-2}}:{VALID_UUID}", "abc", 60) is None
+    redis.register_script.return_value.assert_awaited_once()
@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 import pytest
 from httpx import AsyncClient
 
+from app.data import CacheEntry
 from app.dependencies.dependencies import get_blog_repository, get_current_user
 from app.errors.database import DatabaseError, DuplicateEntryError
 from app.main import app
@@ -59,8 +60,11 @@ def override_blog_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
 
     app.state.cache_manager = MagicMock()
     app.state.cache_manager.get = AsyncMock(return_value=None)
+    app.state.cache_manager.get_entry = AsyncMock(return_value=None)
+    app.state.cache_manager.set_negative = AsyncMock()
     app.state.cache_manager.set = AsyncMock()
     app.state.cache_manager.delete = AsyncMock()
+    app.state.cache_manager.invalidate_tags = AsyncMock()
     app.dependency_overrides[get_blog_repository] = lambda: mock_repo
     app.dependency_overrides[get_current_user] = lambda: sample_user
 
@@ -223,6 +227,27 @@ async def test_get_blog_by_slug_returns_not_found_when_missing(
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Blog with slug 'missing-blog' not found"
+    set_negative = app.state.cache_manager.set_negative
+    set_negative.assert_awaited_once()
+    assert set_negative.await_args.kwargs["detail"] == "Blog with slug 'missing-blog' not found"
+
+
+@pytest.mark.asyncio
+async def test_get_blog_by_slug_replays_cached_not_found(
+    client: AsyncClient,
+    override_blog_dependencies: MagicMock,
+) -> None:
+    """Test that a cached 404 is returned without querying the repository."""
+    app.state.cache_manager.get_entry.return_value = CacheEntry(
+        value="Blog with slug 'missing-blog' not found",
+        negative=True,
+    )
+
+    response = await client.get("/blogs/by-slug/missing-blog")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Blog with slug 'missing-blog' not found"
+    override_blog_dependencies.get_by_slug.assert_not_awaited()
 
 
 @pytest.mark.asyncio
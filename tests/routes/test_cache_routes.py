@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from httpx import AsyncClient
 
+from app.data import KeyTelemetry
 from app.dependencies import get_cache_manager
 from app.dependencies.dependencies import is_admin
 from app.main import app
@@ -21,6 +22,8 @@ def make_cache_stats() -> dict[str, int | str]:
         "deletes": 1,
         "evictions": 0,
         "errors": 0,
+        "coalesced_waits": 0,
+        "negative_hits": 0,
         "total_bytes_written": 100,
         "total_bytes_read": 50,
         "hit_rate": "71.43%",
@@ -41,6 +44,7 @@ def clear_cache_route_overrides() -> Generator:
 def cache_route_manager() -> MagicMock:
     manager = MagicMock()
     manager.get_statistics.return_value = make_cache_stats()
+    manager.get_telemetry.return_value = None
     manager.ping = AsyncMock(return_value=True)
     manager.clear = AsyncMock()
     manager.disable_redis = AsyncMock(
@@ -79,10 +83,32 @@ async def test_get_cache_stats_returns_manager_statistics(
     response = await client.get("/cache/stats")
 
     assert response.status_code == 200
-    assert response.json() == {"status": "success", "data": make_cache_stats()}
+    assert response.json() == {"status": "success", "data": make_cache_stats(), "telemetry": None}
     cache_route_manager.get_statistics.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_get_cache_stats_includes_key_telemetry(
+    client: AsyncClient,
+    admin_user: UserDB,
+    cache_route_manager: MagicMock,
+) -> None:
+    telemetry = KeyTelemetry(top_k=2, sample_rate=1.0)
+    telemetry.record_hit("blogs", "cache:blogs:hot", 10)
+    telemetry.record_hit("blogs", "cache:blogs:hot", 10)
+    telemetry.record_miss(None, "cache:cold")
+    cache_route_manager.get_telemetry.return_value = telemetry.to_data()
+    override_cache_route_dependencies(cache_route_manager, admin_user)
+
+    response = await client.get("/cache/stats")
+
+    assert response.status_code == 200
+    body = response.json()["telemetry"]
+    assert body["hot_keys"][0] == {"key": "cache:blogs:hot", "reads": 2, "error": 0}
+    assert body["namespaces"]["blogs"]["bytes_read"] == 20
+    assert body["namespaces"]["default"]["misses"] == 1
+
+
 @pytest.mark.asyncio
 async def test_ping_cache_returns_success_when_manager_is_alive(
     client: AsyncClient,
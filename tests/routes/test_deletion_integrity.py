@@ -23,6 +23,7 @@ def setup_teardown() -> Generator[None]:
     # Setup: Mock cache_manager on app.state
     app.state.cache_manager = MagicMock()
     app.state.cache_manager.delete = AsyncMock()
+    app.state.cache_manager.invalidate_tags = AsyncMock()
     app.state.cache_manager.clear = AsyncMock()
 
     yield
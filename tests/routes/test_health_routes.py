@@ -84,6 +84,8 @@ def make_cache_health() -> dict[str, Any]:
             "deletes": 4,
             "evictions": 0,
             "errors": 0,
+            "coalesced_waits": 0,
+            "negative_hits": 0,
             "total_bytes_written": 10,
             "total_bytes_read": 20,
             "hit_rate": "33.3%",
@@ -23,6 +23,7 @@ def override_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
 
     mock_cache = MagicMock()
     mock_cache.delete = AsyncMock()
+    mock_cache.invalidate_tags = AsyncMock()
 
     app.state.cache_manager = mock_cache
     app.dependency_overrides[get_current_user] = lambda: sample_user
@@ -16,18 +16,28 @@ from app.models import ReviewDB, UserDB
 @pytest.fixture
 def override_review_media_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
     original_overrides = app.dependency_overrides.copy()
+    had_cache_manager = hasattr(app.state, "cache_manager")
+    original_cache_manager = getattr(app.state, "cache_manager", None)
 
     mock_repo = MagicMock()
     mock_repo.get_by_id = AsyncMock()
     mock_repo.add_image = AsyncMock()
     mock_repo.remove_image_by_media_id = AsyncMock(return_value=True)
 
+    app.state.cache_manager = MagicMock()
+    app.state.cache_manager.get = AsyncMock(return_value=None)
+    app.state.cache_manager.set = AsyncMock()
+    app.state.cache_manager.invalidate_tags = AsyncMock()
     app.dependency_overrides[get_review_repository] = lambda: mock_repo
     app.dependency_overrides[get_current_user] = lambda: sample_user
 
     yield mock_repo
 
     app.dependency_overrides = original_overrides
+    if had_cache_manager:
+        app.state.cache_manager = original_cache_manager
+    elif hasattr(app.state, "cache_manager"):
+        delattr(app.state, "cache_manager")
 
 
 class TestUploadReviewImage:
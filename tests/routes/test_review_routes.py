@@ -12,6 +12,7 @@ from app.main import app
 from app.models import ReviewDB, UserDB
 from app.routes.review import _validate_review_response
 from app.schemas.review import ReviewResponse
+from app.utils.cache_keys import REVIEWS_LIST_TAG, review_id_key
 
 
 def _make_review(user_id: UUID, item_id: UUID | None = None) -> ReviewDB:
@@ -30,6 +31,8 @@ def _make_review(user_id: UUID, item_id: UUID | None = None) -> ReviewDB:
 @pytest.fixture
 def override_review_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
     original_overrides = app.dependency_overrides.copy()
+    had_cache_manager = hasattr(app.state, "cache_manager")
+    original_cache_manager = getattr(app.state, "cache_manager", None)
 
     mock_repo = MagicMock()
     mock_repo.create = AsyncMock()
@@ -39,12 +42,23 @@ def override_review_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
     mock_repo.update = AsyncMock()
     mock_repo.delete = AsyncMock(return_value=True)
 
+    app.state.cache_manager = MagicMock()
+    app.state.cache_manager.get = AsyncMock(return_value=None)
+    app.state.cache_manager.get_entry = AsyncMock(return_value=None)
+    app.state.cache_manager.set_negative = AsyncMock()
+    app.state.cache_manager.set = AsyncMock()
+    app.state.cache_manager.invalidate_tags = AsyncMock()
+    app.state.cache_manager.delete = AsyncMock(return_value=1)
     app.dependency_overrides[get_review_repository] = lambda: mock_repo
     app.dependency_overrides[get_current_user] = lambda: sample_user
 
     yield mock_repo
 
     app.dependency_overrides = original_overrides
+    if had_cache_manager:
+        app.state.cache_manager = original_cache_manager
+    elif hasattr(app.state, "cache_manager"):
+        delattr(app.state, "cache_manager")
 
 
 @pytest.mark.asyncio
@@ -220,6 +234,12 @@ async def test_update_review_success(
     assert response.status_code == 200
     assert response.json()["content"] == "Updated review text that is long enough."
     override_review_dependencies.update.assert_awaited_once()
+    # Only this review's entry is dropped; list pages move to a new tag generation
+    app.state.cache_manager.delete.assert_awaited_once_with(
+        review_id_key(review_id),
+        namespace="reviews",
+    )
+    app.state.cache_manager.invalidate_tags.assert_awaited_once_with(REVIEWS_LIST_TAG)
 
 
 @pytest.mark.asyncio
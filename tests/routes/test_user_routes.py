@@ -35,8 +35,11 @@ def override_dependencies(sample_user: UserDB) -> Generator[tuple[MagicMock, Mag
 
     app.state.cache_manager = MagicMock()
     app.state.cache_manager.get = AsyncMock(return_value=None)
+    app.state.cache_manager.get_entry = AsyncMock(return_value=None)
+    app.state.cache_manager.set_negative = AsyncMock()
     app.state.cache_manager.set = AsyncMock()
     app.state.cache_manager.delete = AsyncMock()
+    app.state.cache_manager.invalidate_tags = AsyncMock()
     app.state.cache_manager.clear = AsyncMock()
     app.dependency_overrides[get_current_user] = lambda: sample_user
     app.dependency_overrides[get_user_repository] = lambda: mock_repo
@@ -20,6 +20,7 @@ def override_dependencies(sample_user: UserDB) -> Generator[MagicMock]:
 
     mock_cache = MagicMock()
     mock_cache.delete = AsyncMock()
+    mock_cache.invalidate_tags = AsyncMock()
 
     # Set on app state for direct calls in decorators/helpers
     app.state.cache_manager = mock_cache
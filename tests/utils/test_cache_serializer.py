@@ -2,7 +2,7 @@
 """Tests for app/utils/cache_serializer.py module."""
 
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -15,11 +15,18 @@ from app.errors import (
 from app.schemas.items import Item
 from app.utils.cache_serializer import (
     COMPRESSION_MARKER,
+    NO_CODEC,
+    Codec,
     compress,
+    decode_frame,
     decompress,
     deserialize,
     do_compress,
+    encode_frame,
+    get_codec,
+    register_codec,
     serialize,
+    serialize_bytes,
 )
 
 
@@ -197,3 +204,54 @@ class TestDoCompress:
         # Each emoji is 4 bytes
         data = "🎉" * 25  # 100 bytes
         assert do_compress(data, threshold=50) is True
+
+
+class TestFraming:
+    """Tests for binary frames and pluggable codecs."""
+
+    def test_serialize_bytes_matches_serialize(self) -> None:
+        """Test that serialize_bytes produces the same JSON as serialize."""
+        data = {"name": "test", "value": 123}
+        assert serialize_bytes(data).decode("utf-8") == serialize(data)
+
+    @pytest.mark.parametrize("name", ["none", "zlib"])
+    def test_round_trip(self, name: str) -> None:
+        """Test that decode_frame reverses encode_frame for built-in codecs."""
+        data = b'{"body":"' + b"x" * 4096 + b'"}'
+        framed = encode_frame(data, get_codec(name))
+        assert framed[:3] == bytes((0xFE, 1, get_codec(name).codec_id))
+        assert decode_frame(framed) == data
+
+    def test_decode_legacy_entries(self) -> None:
+        """Test that plain JSON and base64 gzip entries are still readable."""
+        assert decode_frame(b'{"v":1}') == b'{"v":1}'
+        assert decode_frame('{"v":1}') == b'{"v":1}'
+        legacy = compress('{"v":2}')
+        assert decode_frame(legacy) == b'{"v":2}'
+        assert decode_frame(legacy.encode("utf-8")) == b'{"v":2}'
+
+    def test_decode_unknown_codec(self) -> None:
+        """Test that unknown codec IDs raise CacheDecompressionError."""
+        with pytest.raises(CacheDecompressionError):
+            decode_frame(b"\xfe\x01\xff payload")
+
+    def test_decode_unknown_version(self) -> None:
+        """Test that unsupported frame versions raise CacheDecompressionError."""
+        with pytest.raises(CacheDecompressionError):
+            decode_frame(b"\xfe\x09\x00{}")
+
+    def test_get_unknown_codec(self) -> None:
+        """Test that looking up a missing codec raises CacheCompressionError."""
+        with pytest.raises(CacheCompressionError):
+            get_codec("brotli")
+
+    def test_register_conflicting_codec(self) -> None:
+        """Test that a codec ID cannot be reused for another algorithm."""
+        with pytest.raises(ValueError, match="conflicts"):
+            register_codec(Codec(NO_CODEC.codec_id, "other", bytes, bytes))
+
+    def test_compression_error(self) -> None:
+        """Test that codec failures raise CacheCompressionError."""
+        failing = Codec(250, "failing", Mock(side_effect=OSError), bytes)
+        with pytest.raises(CacheCompressionError):
+            encode_frame(b"data", failing)
@@ -1,10 +1,15 @@
 # tests/utils/test_helpers.py
 """Tests for app/utils/helpers.py module."""
 
+from datetime import UTC, datetime
 from re import match as re_match
 from time import perf_counter, sleep
+from uuid import uuid4
 
-from app.utils.helpers import mask_ip_address, time_taken, today_str
+from fastapi import Response
+
+from app.models import UserDB
+from app.utils.helpers import mask_ip_address, set_last_modified, time_taken, today_str
 
 
 class TestTodayStr:
@@ -99,3 +104,37 @@ class TestMaskIpAddress:
     def test_returns_unknown_for_invalid_or_missing_ip(self) -> None:
         assert mask_ip_address("not-an-ip") == "unknown"
         assert mask_ip_address(None) == "unknown"
+
+
+class TestSetLastModified:
+    """Tests for set_last_modified helper."""
+
+    @staticmethod
+    def _user(created_at: datetime, updated_at: datetime | None = None) -> UserDB:
+        return UserDB(
+            uuid=uuid4(),
+            username=f"user{uuid4().hex[:8]}",
+            email="user@example.com",
+            password_hash="hash",
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def test_uses_latest_update_or_creation(self) -> None:
+        response = Response()
+        set_last_modified(
+            response,
+            self._user(datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 3, 1, 12, tzinfo=UTC)),
+            self._user(datetime(2026, 4, 2, 8, 30, tzinfo=UTC)),
+        )
+        assert response.headers["Last-Modified"] == "Thu, 02 Apr 2026 08:30:00 GMT"
+
+    def test_treats_naive_datetimes_as_utc(self) -> None:
+        response = Response()
+        set_last_modified(response, self._user(datetime(2026, 1, 2, 3, 4, 5)))
+        assert response.headers["Last-Modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+
+    def test_sets_nothing_without_records(self) -> None:
+        response = Response()
+        set_last_modified(response)
+        assert "Last-Modified" not in response.headers